@@ -5,11 +5,31 @@ import sys
 import threading
 import time
 import traceback
+import types
 import uuid
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import bpy
 
+try:
+    import orjson
+except ImportError:  # optional speedup; Blender's bundled Python usually lacks it
+    orjson = None
+
+
+def _loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(payload) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload).encode("utf-8")
+
 
 def _log(msg: str) -> None:
     try:
@@ -24,11 +44,15 @@ BRIDGE_STATE = {
     "jobs": {},
     "stats": {"ticks": 0, "queued": 0, "executed": 0},
     "timer_registered": False,
+    "functions": {},
+    "fns_version": None,
     "server_thread": None,
     "httpd": None,
     "host": "127.0.0.1",
     "port": 8765,
     "exec_timeout": float(os.environ.get("NEW_MCP_EXEC_TIMEOUT", "10.0") or 10.0),
+    # finished jobs stay readable through GET /jobs/<id> this long, so a repeated status poll still sees them
+    "job_ttl": 300.0,
 }
 
 
@@ -57,32 +81,82 @@ def _register_timer():
     _log("[bridge] Timer registered")
 
 
+@lru_cache(maxsize=256)
+def _compile_cached(code: str):
+    # MCP tools send the same template source with different params; parse/compile it once.
+    return compile(code, "<mcp_exec>", "exec")
+
+
+def _register_fns(source: str, version: str) -> list:
+    # Helper library shipped by the MCP server; public functions become callable through /call.
+    fn_ns = {"__builtins__": __builtins__, "bpy": bpy}
+    exec(compile(source, "<mcp_fns>", "exec"), fn_ns, fn_ns)
+    functions = {
+        name: value
+        for name, value in fn_ns.items()
+        if not name.startswith("_") and isinstance(value, types.FunctionType)
+    }
+    BRIDGE_STATE["functions"] = functions
+    BRIDGE_STATE["fns_version"] = version
+    return sorted(functions)
+
+
+def _call_fn(name: str, args: dict):
+    fn = BRIDGE_STATE["functions"].get(name)
+    if fn is None:
+        raise LookupError(f"Unknown function {name}")
+    return fn(**args)
+
+
 def _run_job(job: dict) -> None:
-    code = job.get("code", "")
+    kind = job.get("kind", "exec")
     try:
-        compiled = compile(code, "<mcp_exec>", "exec")
-        exec_ns = {"__builtins__": __builtins__, "bpy": bpy}
-        exec(compiled, exec_ns, exec_ns)
+        if kind == "call":
+            result = _call_fn(job["fn"], job.get("args") or {})
+        elif kind == "register":
+            result = _register_fns(job["source"], job.get("version"))
+        else:
+            params = job.get("params") or {}
+            compiled = _compile_cached(job.get("code", ""))
+            exec_ns = {**params, "__builtins__": __builtins__, "bpy": bpy}
+            exec(compiled, exec_ns, exec_ns)
+            result = exec_ns.get("result")
         job["ok"] = True
         job["error"] = None
         job["traceback"] = None
-        job["result"] = exec_ns.get("result")
+        job["result"] = result
     except Exception as exc:  # noqa: BLE001
         job["ok"] = False
         job["error"] = str(exc)
         job["traceback"] = traceback.format_exc()
     finally:
+        job["finished_at"] = time.time()
         job["done_event"].set()
 
 
+def _prune_jobs() -> None:
+    jobs = BRIDGE_STATE["jobs"]
+    cutoff = time.time() - BRIDGE_STATE["job_ttl"]
+    for job_id, job in list(jobs.items()):
+        if job.get("finished_at", cutoff) < cutoff:
+            jobs.pop(job_id, None)
+
+
 class BridgeHandler(BaseHTTPRequestHandler):
     server_version = "blender_bridge/0.2"
+    # HTTP/1.1 keeps the MCP server's connection open between calls (every reply sets Content-Length).
+    protocol_version = "HTTP/1.1"
+    # drop idle keep-alive connections; the client reconnects transparently
+    timeout = 60
+    # headers and body go out in separate writes; without TCP_NODELAY a reused connection
+    # waits on the client's delayed ACK (~40 ms) before the body is sent
+    disable_nagle_algorithm = True
 
     def log_message(self, format: str, *args) -> None:  # noqa: A003
         _log("%s - - [%s] %s" % (self.address_string(), self.log_date_time_string(), format % args))
 
     def _send_json(self, payload, status=200):
-        body = json.dumps(payload).encode("utf-8")
+        body = _dumps(payload)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -119,54 +193,135 @@ class BridgeHandler(BaseHTTPRequestHandler):
                 "executed": state["stats"]["executed"],
                 "queue_size": state["queue"].qsize(),
                 "timer_registered": state["timer_registered"],
+                "compile_cache": _compile_cached.cache_info()._asdict(),
+                "functions": sorted(state["functions"]),
+                "fns_version": state["fns_version"],
             }
             self._send_json(payload)
             return
+        if self.path.startswith("/jobs/"):
+            self._job_status(self.path[len("/jobs/"):])
+            return
         self._send_json({"ok": False, "error": "Not found"}, status=404)
 
-    def do_POST(self):  # noqa: N802
-        if self.path != "/exec":
-            self._send_json({"ok": False, "error": "Not found"}, status=404)
+    def _job_status(self, job_id):
+        # poll target for /exec jobs submitted with "wait": false; finished jobs answer until job_ttl runs out.
+        # An unknown id is a normal 200 reply so clients don't mistake it for the bridge being down.
+        _prune_jobs()
+        job = BRIDGE_STATE["jobs"].get(job_id)
+        if job is None:
+            self._send_json({"ok": False, "id": job_id, "error": "Unknown job", "error_type": "unknown_job"})
             return
+        if not job["done_event"].is_set():
+            self._send_json({"ok": True, "id": job_id, "pending": True})
+            return
+        self._send_json(self._job_reply(job))
+
+    def _read_json(self):
         length = int(self.headers.get("Content-Length", "0"))
         raw = self.rfile.read(length) if length > 0 else b""
         try:
-            payload = json.loads(raw.decode("utf-8")) if raw else {}
-        except json.JSONDecodeError:
+            payload = _loads(raw) if raw else {}
+        except ValueError:
             self._send_json({"ok": False, "error": "Invalid JSON"}, status=400)
+            return None
+        if not isinstance(payload, dict):
+            self._send_json({"ok": False, "error": "body must be an object"}, status=400)
+            return None
+        return payload
+
+    def do_POST(self):  # noqa: N802
+        if self.path not in ("/exec", "/call", "/register_fns"):
+            self._send_json({"ok": False, "error": "Not found"}, status=404)
             return
+        payload = self._read_json()
+        if payload is None:
+            return
+        if self.path == "/call":
+            job = self._call_job(payload)
+        elif self.path == "/register_fns":
+            job = self._register_job(payload)
+        else:
+            job = self._exec_job(payload)
+        if job is not None:
+            self._submit(job)
+
+    def _exec_job(self, payload):
         code = payload.get("code")
         if not isinstance(code, str):
             self._send_json({"ok": False, "error": "code must be a string"}, status=400)
-            return
+            return None
+        params = payload.get("params")
+        if params is not None and not isinstance(params, dict):
+            self._send_json({"ok": False, "error": "params must be an object"}, status=400)
+            return None
+        wait = payload.get("wait", True)
+        if not isinstance(wait, bool):
+            self._send_json({"ok": False, "error": "wait must be a boolean"}, status=400)
+            return None
+        return {"kind": "exec", "code": code, "params": params, "wait": wait}
 
+    def _call_job(self, payload):
+        fn = payload.get("fn")
+        args = payload.get("args")
+        if not isinstance(fn, str):
+            self._send_json({"ok": False, "error": "fn must be a string"}, status=400)
+            return None
+        if args is not None and not isinstance(args, dict):
+            self._send_json({"ok": False, "error": "args must be an object"}, status=400)
+            return None
+        version = payload.get("version")
+        state = BRIDGE_STATE
+        if fn not in state["functions"] or (version is not None and version != state["fns_version"]):
+            # not registered yet (or an older library): the client ships it via /register_fns and retries
+            self._send_json({"ok": False, "error": f"Function {fn} not registered", "error_type": "fns_missing"})
+            return None
+        return {"kind": "call", "fn": fn, "args": args}
+
+    def _register_job(self, payload):
+        source = payload.get("source")
+        if not isinstance(source, str):
+            self._send_json({"ok": False, "error": "source must be a string"}, status=400)
+            return None
+        return {"kind": "register", "source": source, "version": payload.get("version")}
+
+    def _submit(self, job):
         job_id = str(uuid.uuid4())
-        job = {
-            "id": job_id,
-            "code": code,
-            "created_at": time.time(),
-            "done_event": threading.Event(),
-            "ok": None,
-            "error": None,
-            "traceback": None,
-        }
+        job.update(
+            {
+                "id": job_id,
+                "created_at": time.time(),
+                "done_event": threading.Event(),
+                "ok": None,
+                "error": None,
+                "traceback": None,
+            }
+        )
         state = BRIDGE_STATE
+        _prune_jobs()
         state["jobs"][job_id] = job
         state["queue"].put(job)
         state["stats"]["queued"] += 1
         _log(f"[bridge] queued job {job_id}")
 
+        if not job.get("wait", True):
+            # long jobs (exports): answer now and let the client poll GET /jobs/<id>, free of exec_timeout
+            self._send_json({"ok": True, "id": job_id, "pending": True})
+            return
         done = job["done_event"].wait(timeout=state["exec_timeout"])
         if not done or job["ok"] is None:
             self._send_json({"ok": False, "error": "Timed out waiting for execution", "id": job_id})
             return
+        self._send_json(self._job_reply(job))
+
+    @staticmethod
+    def _job_reply(job):
         if job["ok"]:
-            payload = {"ok": True, "id": job_id}
+            payload = {"ok": True, "id": job["id"]}
             if "result" in job:
                 payload["result"] = job.get("result")
-            self._send_json(payload)
-        else:
-            self._send_json({"ok": False, "id": job_id, "error": job["error"], "traceback": job["traceback"]})
+            return payload
+        return {"ok": False, "id": job["id"], "error": job["error"], "traceback": job["traceback"]}
 
 
 def start_server():
@@ -1,27 +1,54 @@
+import ast
+import atexit
+import bisect
+import contextlib
+import gzip
+import hashlib
+import http.client
 import json
+import mmap
 import os
+import queue
 import re
+import select
+import string
 import sys
+import textwrap
+import threading
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 import uuid
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None  # type: ignore[assignment]
+
 from .tools_packs import register_all
 
 BRIDGE_URL = os.environ.get("BLENDER_MCP_BRIDGE_URL") or os.environ.get("NEW_MCP_BRIDGE_URL", "http://127.0.0.1:8765")
 SERVER_VERSION = "0.1.0"
-NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+TOOL_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 DEBUG_EXEC_ENABLED = os.environ.get("BLENDER_MCP_DEBUG_EXEC") == "1" or os.environ.get("NEW_MCP_DEBUG_EXEC") == "1"
 ROOT_DIR = Path(__file__).resolve().parents[2]
-RUNS_DIR = ROOT_DIR / "runs"
+RUNS_DIR = Path(os.environ.get("BLENDER_MCP_RUNS_DIR") or (ROOT_DIR / "runs"))
 RUNS_FILE = RUNS_DIR / "actions.jsonl"
 REQUESTS_FILE = RUNS_DIR / "requests.jsonl"
+RUNS_GZIP = os.environ.get("BLENDER_MCP_RUNS_GZIP") == "1"
+ASYNC_LOG_ENABLED = os.environ.get("BLENDER_MCP_ASYNC_LOG") == "1"
+# Write targets resolved once so the logging hot path deals in plain strings, not pathlib objects.
+_RUNS_FILE_STR = os.fspath(RUNS_FILE) + (".gz" if RUNS_GZIP else "")
+_REQUESTS_FILE_STR = os.fspath(REQUESTS_FILE) + (".gz" if RUNS_GZIP else "")
 def get_tool_request_dir() -> Path:
     return Path(os.environ.get("TOOL_REQUEST_DATA_DIR") or (ROOT_DIR / "data"))
 
@@ -31,16 +58,66 @@ def get_tool_request_file() -> Path:
 def get_tool_request_updates_file() -> Path:
     return get_tool_request_dir() / "tool_requests_updates.jsonl"
 
+# updates replayed on load before the base file is rewritten and the updates log truncated
+# (the actual threshold is max(this, 4 * live requests))
+TOOL_REQUEST_COMPACT_MIN = 1000
 
 
-def _get_timeout(default: float) -> float:
+
+def _parse_env_timeout() -> Optional[float]:
     env_val = os.environ.get("BLENDER_MCP_BRIDGE_TIMEOUT") or os.environ.get("NEW_MCP_BRIDGE_TIMEOUT")
     if env_val is None:
-        return default
+        return None
     try:
         return float(env_val)
     except ValueError:
-        return default
+        return None
+
+
+def _split_bridge_url(url: str) -> Tuple[str, str, int, str]:
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme or "http"
+    port = parts.port or (443 if scheme == "https" else 80)
+    return scheme, parts.hostname or "127.0.0.1", port, parts.path.rstrip("/")
+
+
+def _parse_coalesce_window() -> float:
+    env_val = os.environ.get("BLENDER_MCP_COALESCE_MS")
+    if not env_val:
+        return 0.0
+    try:
+        return max(float(env_val), 0.0) / 1000.0
+    except ValueError:
+        return 0.0
+
+
+# Env vars are fixed for the life of the process; resolve them once instead of per bridge call.
+_ENV_TIMEOUT = _parse_env_timeout()
+_COALESCE_WINDOW_S = _parse_coalesce_window()
+BRIDGE_ADDR = _split_bridge_url(BRIDGE_URL)
+
+
+def _get_timeout(default: float) -> float:
+    return _ENV_TIMEOUT if _ENV_TIMEOUT is not None else default
+
+
+_SCHEMA_CACHE: Dict[str, Any] = {}
+
+
+def _intern_schema(schema: Any) -> Any:
+    # Structurally identical schema fragments (e.g. {"type": "string"}) share one object across all tools.
+    if isinstance(schema, dict):
+        schema = {key: _intern_schema(val) for key, val in schema.items()}
+    elif isinstance(schema, list):
+        schema = [_intern_schema(val) for val in schema]
+    else:
+        return schema
+    key = json.dumps(schema, sort_keys=True)
+    return _SCHEMA_CACHE.setdefault(key, schema)
+
+
+def _valid_tool_name(name: str) -> bool:
+    return 0 < len(name) <= 64 and TOOL_NAME_CHARS.issuperset(name)
 
 
 class ToolError(Exception):
@@ -50,6 +127,10 @@ class ToolError(Exception):
         self.data = data or {}
 
 
+# Constant-message error raised on the dispatch path; reuse one instance instead of building it per call.
+_ERR_INVALID_NAME = ToolError("Invalid tool name", code=-32602)
+
+
 @dataclass
 class Tool:
     name: str
@@ -79,12 +160,94 @@ class ToolRequestStore:
         },
         "status": {"pending", "triaged", "accepted", "implemented", "released", "rejected", "needs_info"},
     }
-    _ESTIMATED_EFFORT = {"trivial", "small", "medium", "large"}
+    _ENUMS = {name: frozenset(values) for name, values in _ENUMS.items()}
+    _ENUM_ERRORS = {name: f"{name} must be one of {', '.join(sorted(values))}" for name, values in _ENUMS.items()}
+    _ESTIMATED_EFFORT = frozenset({"trivial", "small", "medium", "large"})
+    # list() filters answered from per-field id sets: exact match for the first group, case-insensitive
+    # for the second, and "non-empty object" for the flagged ones
+    _EXACT_FIELDS = ("status", "priority")
+    _FOLDED_FIELDS = ("domain", "type", "session")
+    _FLAG_FIELDS = {"has_api_probe": "api_probe", "has_params_schema": "proposed_params_schema"}
 
     def __init__(self) -> None:
-        self.requests: Dict[str, Dict[str, Any]] = {}
+        self._reset()
         self._load()
 
+    def _reset(self) -> None:
+        """Empty the request dict and every index kept alongside it."""
+        self.requests: Dict[str, Dict[str, Any]] = {}
+        # (created_at, id) of every request, ascending; list() walks it backwards instead of sorting per call
+        self._order: List[Tuple[str, str]] = []
+        # lowercased text the q/text filter matches against, kept out of the entries so it is never persisted
+        self._search_blobs: Dict[str, str] = {}
+        self._by_field: Dict[str, Dict[str, Set[str]]] = {f: {} for f in self._EXACT_FIELDS + self._FOLDED_FIELDS}
+        self._flagged: Dict[str, Set[str]] = {f: set() for f in self._FLAG_FIELDS.values()}
+        # update/delete records in the updates log since the base file was last rewritten
+        self._update_count = 0
+
+    @staticmethod
+    def _order_key(req_id: str, entry: Dict[str, Any]) -> Tuple[str, str]:
+        return (str(entry.get("created_at") or ""), req_id)
+
+    @staticmethod
+    def _search_blob(entry: Dict[str, Any]) -> str:
+        return " ".join(
+            [
+                entry.get("need") or "",
+                entry.get("why") or "",
+                " ".join(str(tag) for tag in entry.get("tags") or []),
+                entry.get("proposed_tool_name") or "",
+                entry.get("implementation_hint") or "",
+            ]
+        ).lower()
+
+    @classmethod
+    def _field_keys(cls, entry: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        for field in cls._EXACT_FIELDS:
+            val = entry.get(field)
+            if isinstance(val, str):
+                yield field, val
+        for field in cls._FOLDED_FIELDS:
+            yield field, str(entry.get(field) or "").lower()
+
+    def _index_fields(self, req_id: str, entry: Dict[str, Any]) -> None:
+        for field, key in self._field_keys(entry):
+            self._by_field[field].setdefault(key, set()).add(req_id)
+        for field, ids in self._flagged.items():
+            val = entry.get(field)
+            if isinstance(val, dict) and val:
+                ids.add(req_id)
+
+    def _unindex(self, req_id: str, entry: Dict[str, Any]) -> None:
+        key = self._order_key(req_id, entry)
+        idx = bisect.bisect_left(self._order, key)
+        if idx < len(self._order) and self._order[idx] == key:
+            del self._order[idx]
+        for field, value in self._field_keys(entry):
+            index = self._by_field[field]
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(req_id)
+                if not ids:
+                    del index[value]
+        for ids in self._flagged.values():
+            ids.discard(req_id)
+        self._search_blobs.pop(req_id, None)
+
+    def _put(self, req_id: str, entry: Dict[str, Any]) -> None:
+        old = self.requests.get(req_id)
+        if old is not None:
+            self._unindex(req_id, old)
+        self.requests[req_id] = entry
+        self._search_blobs[req_id] = self._search_blob(entry)
+        self._index_fields(req_id, entry)
+        bisect.insort(self._order, self._order_key(req_id, entry))
+
+    def _pop(self, req_id: str) -> None:
+        old = self.requests.pop(req_id, None)
+        if old is not None:
+            self._unindex(req_id, old)
+
     def _normalize_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         normalized = dict(entry)
         created_at = normalized.get("created_at")
@@ -103,21 +266,35 @@ class ToolRequestStore:
         if mode == "replace" or new_value is None:
             return new_value
         if isinstance(current, dict) and isinstance(new_value, dict):
-            merged = dict(current)
+            # new keys and scalar overwrites come straight from the union; only containers on both sides recurse
+            merged = current | new_value
             for key, val in new_value.items():
-                merged[key] = self._merge_value(current.get(key), val, mode=mode, list_mode=list_mode)
+                cur = current.get(key)
+                if isinstance(cur, (dict, list)):
+                    merged[key] = self._merge_value(cur, val, mode=mode, list_mode=list_mode)
             return merged
         if isinstance(current, list) and isinstance(new_value, list):
             if list_mode == "replace":
                 return new_value
             merged_list = list(current)
-            for item in new_value:
-                if item not in merged_list:
-                    merged_list.append(item)
+            try:
+                seen = set(merged_list)
+                for item in new_value:
+                    if item not in seen:
+                        seen.add(item)
+                        merged_list.append(item)
+            except TypeError:
+                # unhashable items (objects in examples etc.): fall back to the linear membership check
+                merged_list = list(current)
+                for item in new_value:
+                    if item not in merged_list:
+                        merged_list.append(item)
             return merged_list
         return new_value
 
     def _merge_payload(self, base: Dict[str, Any], changes: Dict[str, Any], *, mode: str, list_mode: str) -> Dict[str, Any]:
+        if mode == "replace":
+            return base | changes
         merged = dict(base)
         for key, value in changes.items():
             merged[key] = self._merge_value(base.get(key), value, mode=mode, list_mode=list_mode)
@@ -138,28 +315,93 @@ class ToolRequestStore:
         if not path.exists():
             return items
         try:
-            for line in path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    items.append(json.loads(line))
-                except json.JSONDecodeError as exc:
-                    if warn_on_bad_line:
-                        warnings.warn(f"tool-request: skipping corrupted line in {path.name}: {exc}")
+            lines = [line for line in path.read_bytes().splitlines() if line.strip()]
         except Exception as exc:  # noqa: BLE001
             warnings.warn(f"tool-request: failed reading {path}: {exc}")
+            return items
+        # one comprehension over raw bytes lines when the file is clean; the per-line pass only runs to skip
+        # (and report) corrupted lines
+        try:
+            return [_loads_body(line) for line in lines]
+        except ValueError:
+            pass
+        for line in lines:
+            try:
+                items.append(_loads_body(line))
+            except ValueError as exc:
+                if warn_on_bad_line:
+                    warnings.warn(f"tool-request: skipping corrupted line in {path.name}: {exc}")
         return items
 
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock over both tool-request files, shared by every append and by compaction."""
+        if fcntl is None:
+            yield
+            return
+        with open(get_tool_request_dir() / "tool_requests.lock", "ab") as lock_fh:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            yield
+
     def _load(self) -> None:
         get_tool_request_dir().mkdir(parents=True, exist_ok=True)
+        self._read_files()
+        self._maybe_compact()
+
+    def _read_files(self) -> None:
+        """(Re)build the in-memory state from the base file plus the replayed updates log."""
+        self._reset()
         warn = (os.environ.get('BLENDER_MCP_SILENCE_TOOL_REQUEST_WARNINGS') != '1')
         base_items = self._load_jsonl(get_tool_request_file(), warn_on_bad_line=warn)
         updates = self._load_jsonl(get_tool_request_updates_file(), warn_on_bad_line=warn)
         for item in base_items:
             if isinstance(item, dict) and "id" in item:
                 self.requests[item["id"]] = self._normalize_entry(item)
+        self._order = sorted(self._order_key(req_id, item) for req_id, item in self.requests.items())
+        self._search_blobs = {req_id: self._search_blob(item) for req_id, item in self.requests.items()}
+        for req_id, item in self.requests.items():
+            self._index_fields(req_id, item)
         for upd in updates:
             self._apply_update_record(upd)
+        self._update_count = len(updates)
+
+    def _maybe_compact(self) -> None:
+        if self._update_count > max(TOOL_REQUEST_COMPACT_MIN, 4 * len(self.requests)):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the base file from disk state and truncate the updates log."""
+        if fcntl is None:
+            # no cross-process lock to hold the other writers off: stay append-only
+            return
+        base_str = os.fspath(get_tool_request_file())
+        updates_str = os.fspath(get_tool_request_updates_file())
+        tmp_path = f"{base_str}.tmp-{uuid.uuid4().hex}"
+        with self._file_lock():
+            # other processes may have appended since this store loaded; fold their records in before rewriting
+            self._read_files()
+            data = b"".join(_dumps_line(self.requests[req_id]) for _, req_id in self._order)
+            try:
+                with open(tmp_path, "wb") as out:
+                    out.write(data)
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp_path, base_str)
+                # cached O_APPEND descriptors keep working: the base one is reopened once its inode is
+                # unlinked, and the updates one simply writes at the new end of file
+                with open(updates_str, "ab") as updates_fh:
+                    updates_fh.truncate(0)
+                    os.fsync(updates_fh.fileno())
+            except OSError as exc:
+                warnings.warn(f"tool-request: compaction failed: {exc}")
+                return
+            finally:
+                if os.path.exists(tmp_path):
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+        self._update_count = 0
 
     def _apply_update_record(self, record: Dict[str, Any]) -> None:
         if not isinstance(record, dict):
@@ -167,7 +409,7 @@ class ToolRequestStore:
         req_id = record.get("id")
         changes = record.get("changes") or {}
         if record.get("delete") is True and isinstance(req_id, str):
-            self.requests.pop(req_id, None)
+            self._pop(req_id)
             return
         if not isinstance(req_id, str) or req_id not in self.requests or not isinstance(changes, dict):
             return
@@ -175,14 +417,17 @@ class ToolRequestStore:
         list_mode = record.get("list_mode") or ("replace" if mode == "replace" else "append")
         current = self.requests[req_id].copy()
         merged = self._merge_payload(current, changes, mode=mode, list_mode=list_mode)
-        merged["updated_at"] = record.get("ts") or datetime.now(timezone.utc).isoformat()
+        merged["updated_at"] = record.get("ts") or _utc_timestamp()
         merged["revision"] = int(current.get("revision") or 1) + 1
         if record.get("updated_by") is not None:
             merged["updated_by"] = record.get("updated_by")
-        self.requests[req_id] = self._normalize_entry(merged)
+        self._put(req_id, self._normalize_entry(merged))
 
     def _write_jsonl(self, path: Path, entry: Dict[str, Any]) -> None:
-        _atomic_append_jsonl(path, json.dumps(entry, ensure_ascii=False) + "\n")
+        # same encoder as the runs/ logs: orjson bytes when installed, no str -> utf-8 round trip
+        data = _dumps_line(entry)
+        with self._file_lock():
+            _atomic_append_bytes(path, data)
 
     def _validate_new(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
@@ -196,10 +441,9 @@ class ToolRequestStore:
                 return
             if not isinstance(raw_val, str):
                 raise ToolError(f"{name} must be a string", code=-32602)
-            val = raw_val.lower()
-            allowed = self._ENUMS[name]
-            if not soft and val not in allowed:
-                raise ToolError(f"{name} must be one of {', '.join(sorted(allowed))}", code=-32602)
+            val = raw_val if raw_val.islower() else raw_val.lower()
+            if not soft and val not in self._ENUMS[name]:
+                raise ToolError(self._ENUM_ERRORS[name], code=-32602)
             out[name] = val
 
         _enum_field("source", "manual")
@@ -265,7 +509,7 @@ class ToolRequestStore:
             raise ToolError("changes must be an object", code=-32602)
         clean: Dict[str, Any] = {}
 
-        def _enum_field(name: str, allowed: set[str], soft: bool = False) -> None:
+        def _enum_field(name: str, allowed: FrozenSet[str], soft: bool = False) -> None:
             if name not in changes:
                 return
             val = changes[name]
@@ -274,9 +518,9 @@ class ToolRequestStore:
                 return
             if not isinstance(val, str):
                 raise ToolError(f"{name} must be a string", code=-32602)
-            val_norm = val.lower()
+            val_norm = val if val.islower() else val.lower()
             if not soft and val_norm not in allowed:
-                raise ToolError(f"{name} must be one of {', '.join(sorted(allowed))}", code=-32602)
+                raise ToolError(self._ENUM_ERRORS[name], code=-32602)
             clean[name] = val_norm
 
         _enum_field("status", self._ENUMS["status"])
@@ -342,10 +586,10 @@ class ToolRequestStore:
 
     def create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         clean = self._validate_new(payload)
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_timestamp()
         entry = {
             "schema_version": 2,
-            "id": str(uuid.uuid4()),
+            "id": _fast_uuid(),
             "created_at": now,
             "updated_at": now,
             "revision": 1,
@@ -354,58 +598,44 @@ class ToolRequestStore:
         entry.setdefault("depends_on", [])
         entry.setdefault("blocks", [])
         self._write_jsonl(get_tool_request_file(), entry)
-        self.requests[entry["id"]] = self._normalize_entry(entry)
+        self._put(entry["id"], self._normalize_entry(entry))
         return entry
 
     def list(
         self, filters: Dict[str, Any], limit: int = 50, cursor: Optional[str] = None, next_page_token: Optional[str] = None
     ) -> Dict[str, Any]:
-        items = list(self.requests.values())
         filters = filters or {}
-        status_filter = filters.get("status")
-        if isinstance(status_filter, list):
-            items = [it for it in items if it.get("status") in status_filter]
-        elif isinstance(status_filter, str):
-            items = [it for it in items if it.get("status") == status_filter]
-        priority_filter = filters.get("priority")
-        if isinstance(priority_filter, list):
-            items = [it for it in items if it.get("priority") in priority_filter]
-        elif isinstance(priority_filter, str):
-            items = [it for it in items if it.get("priority") == priority_filter]
-        for key in ("domain", "type", "session"):
-            val = filters.get(key)
+        requests = self.requests
+        wanted: List[Set[str]] = []
+        excluded: Set[str] = set()
+        for field in self._EXACT_FIELDS:
+            val = filters.get(field)
+            index = self._by_field[field]
+            if isinstance(val, list):
+                wanted.append(set().union(*(index.get(v, ()) for v in val if isinstance(v, str))))
+            elif isinstance(val, str):
+                wanted.append(index.get(val, set()))
+        for field in self._FOLDED_FIELDS:
+            val = filters.get(field)
             if isinstance(val, str) and val:
-                items = [it for it in items if str(it.get(key) or "").lower() == val.lower()]
-        if filters.get("has_api_probe") is True:
-            items = [it for it in items if isinstance(it.get("api_probe"), dict) and bool(it.get("api_probe"))]
-        elif filters.get("has_api_probe") is False:
-            items = [it for it in items if not (isinstance(it.get("api_probe"), dict) and bool(it.get("api_probe")))]
-        if filters.get("has_params_schema") is True:
-            items = [it for it in items if isinstance(it.get("proposed_params_schema"), dict) and bool(it.get("proposed_params_schema"))]
-        elif filters.get("has_params_schema") is False:
-            items = [
-                it for it in items if not (isinstance(it.get("proposed_params_schema"), dict) and bool(it.get("proposed_params_schema")))
-            ]
+                wanted.append(self._by_field[field].get(val.lower(), set()))
+        for filter_key, field in self._FLAG_FIELDS.items():
+            flag = filters.get(filter_key)
+            if flag is True:
+                wanted.append(self._flagged[field])
+            elif flag is False:
+                excluded |= self._flagged[field]
+        # newest first: sort just the matching ids, or walk the (created_at, id) index when nothing narrows it
+        if wanted:
+            ids = set.intersection(*wanted) - excluded
+            items = [requests[key[1]] for key in sorted((self._order_key(i, requests[i]) for i in ids), reverse=True)]
+        else:
+            items = [requests[req_id] for _, req_id in reversed(self._order) if req_id not in excluded]
         text = filters.get("q") or filters.get("text")
         if text:
             low = text.lower()
-            items = [
-                it
-                for it in items
-                if low
-                in (
-                    " ".join(
-                        [
-                            it.get("need") or "",
-                            it.get("why") or "",
-                            " ".join(it.get("tags") or []),
-                            it.get("proposed_tool_name") or "",
-                            it.get("implementation_hint") or "",
-                        ]
-                    )
-                ).lower()
-            ]
-        items.sort(key=lambda i: (i.get("created_at", ""), i.get("id", "")), reverse=True)
+            blobs = self._search_blobs
+            items = [it for it in items if low in blobs.get(it.get("id"), "")]
         start = 0
         token = next_page_token or cursor
         if token:
@@ -450,8 +680,8 @@ class ToolRequestStore:
         current = self.requests[req_id].copy()
         merged = self._merge_payload(current, clean, mode=mode, list_mode=list_mode)
         merged["revision"] = int(current.get("revision") or 1) + 1
-        merged["updated_at"] = datetime.now(timezone.utc).isoformat()
-        self.requests[req_id] = self._normalize_entry(merged)
+        merged["updated_at"] = _utc_timestamp()
+        self._put(req_id, self._normalize_entry(merged))
         record: Dict[str, Any] = {
             "id": req_id,
             "ts": merged["updated_at"],
@@ -462,14 +692,18 @@ class ToolRequestStore:
         if "updated_by" in clean:
             record["updated_by"] = clean["updated_by"]
         self._write_jsonl(get_tool_request_updates_file(), record)
+        self._update_count += 1
+        self._maybe_compact()
         return self.requests[req_id]
 
     def delete(self, req_id: str) -> Dict[str, Any]:
         if req_id not in self.requests:
             raise ToolError("request not found", code=-32602)
-        self.requests.pop(req_id, None)
-        record = {"id": req_id, "ts": datetime.now(timezone.utc).isoformat(), "delete": True}
+        self._pop(req_id)
+        record = {"id": req_id, "ts": _utc_timestamp(), "delete": True}
         self._write_jsonl(get_tool_request_updates_file(), record)
+        self._update_count += 1
+        self._maybe_compact()
         return {"ok": True, "deleted_id": req_id}
 
     def purge(self, *, statuses: Optional[List[str]] = None, older_than_days: Optional[int] = None) -> List[str]:
@@ -533,16 +767,16 @@ class ToolRequestStore:
         if not path.exists():
             return {"path": str(path), "exists": False, "lines": []}
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()[-n:]
+            lines = path.read_bytes().splitlines()[-n:]
         except Exception as exc:  # noqa: BLE001
             return {"path": str(path), "exists": True, "error": str(exc), "lines": []}
         entries = []
         for line in lines:
-            entry: Dict[str, Any] = {"raw": line}
+            entry: Dict[str, Any] = {"raw": line.decode("utf-8", errors="replace")}
             try:
-                entry["parsed"] = json.loads(line)
+                entry["parsed"] = _loads_body(line)
                 entry["ok"] = True
-            except json.JSONDecodeError as exc:  # noqa: BLE001
+            except ValueError as exc:
                 entry["ok"] = False
                 entry["error"] = str(exc)
             entries.append(entry)
@@ -592,40 +826,112 @@ class ToolRequestStore:
                 removed.append(str(path))
             except FileNotFoundError:
                 continue
-        self.requests.clear()
+        self._reset()
         return {"ok": True, "removed": removed}
 
 
-def _atomic_append_jsonl(path: Path, line: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    lock_path = path.with_suffix(path.suffix + ".lock")
+def _atomic_append_jsonl(path: Union[str, Path], line: str) -> None:
+    _atomic_append_bytes(path, line.encode("utf-8"))
+
+
+_READY_DIRS: set = set()
+
+
+def _ensure_dir(directory: str) -> None:
+    # mkdir once per directory per process instead of a stat/mkdir syscall on every append
+    if directory in _READY_DIRS:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _READY_DIRS.add(directory)
+
+
+# POSIX O_APPEND makes each write() land atomically at end-of-file, so the lock-file dance is only
+# needed on platforms without it (Windows emulates O_APPEND with seek+write).
+_APPEND_FD_ENABLED = os.name == "posix"
+_APPEND_FDS: Dict[str, int] = {}
+_APPEND_FDS_LOCK = threading.Lock()
+
+
+def _open_append_fd(path_str: str) -> int:
+    fd = _APPEND_FDS.get(path_str)
+    if fd is not None:
+        try:
+            if os.fstat(fd).st_nlink:
+                return fd
+        except OSError:
+            pass
+        # file was deleted/rotated underneath us; reopen so lines don't go to an orphaned inode
+        _APPEND_FDS.pop(path_str, None)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    directory = os.path.dirname(path_str)
+    _ensure_dir(directory)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+    try:
+        fd = os.open(path_str, flags, 0o644)
+    except FileNotFoundError:
+        _READY_DIRS.discard(directory)
+        _ensure_dir(directory)
+        fd = os.open(path_str, flags, 0o644)
+    _APPEND_FDS[path_str] = fd
+    return fd
+
+
+def _fd_append(path_str: str, data: bytes) -> None:
+    with _APPEND_FDS_LOCK:
+        fd = _open_append_fd(path_str)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+
+
+def _atomic_append_bytes(path: Union[str, Path], data: bytes) -> None:
+    path_str = os.fspath(path)
+    if _APPEND_FD_ENABLED:
+        try:
+            _fd_append(path_str, data)
+            return
+        except OSError:
+            pass
+    directory = os.path.dirname(path_str)
+    _ensure_dir(directory)
+    lock_path = path_str + ".lock"
     deadline = time.monotonic() + 0.2
     while time.monotonic() < deadline:
         try:
-            lock_path.touch(mode=0o600, exist_ok=False)
+            os.close(os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
         except FileExistsError:
             time.sleep(0.01)
             continue
+        except FileNotFoundError:
+            # directory was removed after we cached it; recreate and retry
+            _READY_DIRS.discard(directory)
+            _ensure_dir(directory)
+            continue
         except Exception:
             break
         try:
-            with path.open("a", encoding="utf-8") as fh:
-                fh.write(line)
+            with open(path_str, "ab") as fh:
+                fh.write(data)
                 fh.flush()
                 os.fsync(fh.fileno())
             return
         finally:
             try:
-                lock_path.unlink()
+                os.unlink(lock_path)
             except Exception:
                 pass
 
-    tmp_path = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+    tmp_path = f"{path_str}.tmp-{uuid.uuid4().hex}"
     try:
-        with tmp_path.open("wb") as out:
-            if path.exists():
+        with open(tmp_path, "wb") as out:
+            if os.path.exists(path_str):
                 try:
-                    with path.open("rb") as src:
+                    with open(path_str, "rb") as src:
                         while True:
                             chunk = src.read(8192)
                             if not chunk:
@@ -633,61 +939,953 @@ def _atomic_append_jsonl(path: Path, line: str) -> None:
                             out.write(chunk)
                 except Exception:
                     pass
-            out.write(line.encode("utf-8"))
+            out.write(data)
             out.flush()
             os.fsync(out.fileno())
-        tmp_path.replace(path)
+        os.replace(tmp_path, path_str)
     finally:
-        if tmp_path.exists():
+        if os.path.exists(tmp_path):
             try:
-                tmp_path.unlink()
+                os.unlink(tmp_path)
             except Exception:
                 pass
 
 
-def _bridge_request(path: str, payload: Optional[Dict[str, Any]] = None, timeout: float = 0.5) -> Any:
-    url = f"{BRIDGE_URL}{path}"
-    use_timeout = _get_timeout(timeout)
-    data: Optional[bytes] = None
-    headers: Dict[str, str] = {}
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-    req = urllib.request.Request(url, data=data, headers=headers)
+def _log_path(path: Path) -> Path:
+    # runs/*.jsonl become runs/*.jsonl.gz when compressed logging is enabled
+    return path.with_name(path.name + ".gz") if RUNS_GZIP else path
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    # One encoded JSONL record; orjson writes UTF-8 bytes directly (same non-ASCII output as ensure_ascii=False).
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _append_log_line(target: str, data: bytes) -> None:
+    # target is an already-resolved write path (_RUNS_FILE_STR / _REQUESTS_FILE_STR)
+    if RUNS_GZIP:
+        # each append is a self-contained gzip member; gzip readers concatenate members
+        _atomic_append_bytes(target, gzip.compress(data, compresslevel=1))
+        return
+    _atomic_append_bytes(target, data)
+
+
+def _iter_lines(buf: Any, start: int, end: int) -> Iterator[bytes]:
+    # Newline-separated slices of bytes or an mmap; each line is copied on its own, never the whole range.
+    while start < end:
+        nl = buf.find(b"\n", start, end)
+        if nl < 0:
+            nl = end
+        yield buf[start:nl]
+        start = nl + 1
+
+
+def _parse_jsonl(buf: Any, start: int = 0, end: Optional[int] = None) -> List[Any]:
+    # Raw bytes lines straight into the parser (orjson when installed): one comprehension when every line
+    # is valid, a second per-line pass that skips bad lines otherwise.
+    lines = [line for line in _iter_lines(buf, start, len(buf) if end is None else end) if line.strip()]
+    try:
+        return [_loads_body(line) for line in lines]
+    except ValueError:
+        pass
+    records = []
+    for line in lines:
+        try:
+            records.append(_loads_body(line))
+        except ValueError:
+            continue
+    return records
+
+
+def _tail_jsonl(path: Path, n: int) -> List[Dict[str, Any]]:
+    """Last n parseable records of a plain .jsonl file, walking newlines backwards through an mmap (like tail)."""
+    records: List[Dict[str, Any]] = []
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return records  # mmap refuses empty files
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0 and len(records) < n:
+                nl = mm.rfind(b"\n", 0, end)
+                line = mm[nl + 1:end]
+                end = max(nl, 0)
+                if not line.strip():
+                    continue
+                try:
+                    records.append(_loads_body(line))
+                except ValueError:
+                    continue
+    records.reverse()
+    return records
+
+
+class _LogWriter:
+    """Background writer that coalesces runs/*.jsonl appends into one write per file per batch."""
+
+    def __init__(self, max_batch: int = 64) -> None:
+        self._queue: "queue.SimpleQueue[Tuple[str, bytes]]" = queue.SimpleQueue()
+        self._max_batch = max_batch
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="blender-mcp-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, line: bytes) -> None:
+        with self._cond:
+            self._pending += 1
+        self._queue.put((path, line))
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_path: Dict[str, List[bytes]] = {}
+            for path, line in batch:
+                by_path.setdefault(path, []).append(line)
+            for path, lines in by_path.items():
+                try:
+                    _append_log_line(path, b"".join(lines))
+                except Exception as exc:  # noqa: BLE001
+                    try:
+                        sys.stderr.write(f"[log] failed to write {os.path.basename(path)}: {exc}\n")
+                        sys.stderr.flush()
+                    except Exception:
+                        pass
+            with self._cond:
+                self._pending -= len(batch)
+                self._cond.notify_all()
+
+
+_LOG_WRITER: Optional[_LogWriter] = None
+
+
+def _get_log_writer() -> _LogWriter:
+    global _LOG_WRITER
+    if _LOG_WRITER is None:
+        _LOG_WRITER = _LogWriter()
+        atexit.register(_LOG_WRITER.flush, 5.0)
+    return _LOG_WRITER
+
+
+def _write_log_line(path: str, line: bytes) -> None:
+    if ASYNC_LOG_ENABLED:
+        _get_log_writer().submit(path, line)
+        return
+    _append_log_line(path, line)
+
+
+def _flush_logs() -> None:
+    if _LOG_WRITER is not None:
+        _LOG_WRITER.flush()
+
+
+def _loads_body(body: bytes) -> Any:
+    # Both parsers take raw bytes, so skip the intermediate str decode; orjson is used when installed.
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _dumps_body(payload: Any) -> bytes:
+    # orjson emits UTF-8 bytes directly; fall back to json for anything it refuses (e.g. ints over 64 bits).
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
+def _code_literal(value: Any) -> str:
+    # JSON text of a str/number/list is also a valid Python literal; used to embed arguments in /exec code
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+class _BridgeConnectionPool:
+    """Keep-alive HTTP connections to the bridge, reused across tool calls instead of a socket per request."""
+
+    # errors that mean a reused keep-alive socket went stale
+    _STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, scheme: str, host: str, port: int, path_prefix: str, maxsize: int = 4) -> None:
+        self._conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self._host = host
+        self._port = port
+        self._prefix = path_prefix
+        self._maxsize = maxsize
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _dropped(conn: http.client.HTTPConnection) -> bool:
+        # an idle socket has nothing to read unless the bridge closed it (EOF) or sent something unsolicited
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            return bool(select.select([sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._conn_cls(self._host, self._port, timeout=timeout), False
+            if not self._dropped(conn):
+                break
+            conn.close()
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str], timeout: float
+    ) -> Tuple[int, str, bytes]:
+        while True:
+            conn, reused = self._acquire(timeout)
+            try:
+                conn.request(method, self._prefix + path, body=body, headers=headers)
+            except self._STALE_ERRORS:
+                conn.close()
+                if reused:
+                    continue  # the request never got through: resend on a fresh or next idle connection
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                resp = conn.getresponse()
+                data = resp.read()
+            except self._STALE_ERRORS:
+                conn.close()
+                # the bridge may have read the request and run it already: only a GET is safe to send again
+                if reused and method == "GET":
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, resp.reason, data
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_BRIDGE_POOL = _BridgeConnectionPool(*BRIDGE_ADDR)
+
+
+def _bridge_send(method: str, path: str, body: Optional[bytes], headers: Dict[str, str], timeout: float) -> Any:
+    if _TRANSFORM_COALESCER is not None:
+        _TRANSFORM_COALESCER.flush()  # debounced transforms land before anything that may observe them
     try:
-        with urllib.request.urlopen(req, timeout=use_timeout) as resp:
-            body = resp.read()
-    except (urllib.error.HTTPError, urllib.error.URLError) as exc:
+        status, reason, data = _BRIDGE_POOL.request(method, path, body, headers, timeout)
+    except (http.client.HTTPException, OSError) as exc:
         raise ToolError("Blender bridge unreachable", data={"reason": str(exc)})
+    if status >= 400:
+        raise ToolError("Blender bridge unreachable", data={"reason": f"HTTP Error {status}: {reason}"})
     try:
-        return json.loads(body.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        return _loads_body(data)
+    except ValueError as exc:
         raise ToolError("Invalid response from Blender bridge") from exc
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_NO_HEADERS: Dict[str, str] = {}
+
+
+def _bridge_get(path: str, timeout: float = 0.5) -> Any:
+    # Payload-less calls (ping/snapshot): plain GET, no body encoding or headers.
+    return _bridge_send("GET", path, None, _NO_HEADERS, _get_timeout(timeout))
+
+
+def _bridge_request(path: str, payload: Optional[Dict[str, Any]] = None, timeout: float = 0.5) -> Any:
+    if payload is None:
+        return _bridge_get(path, timeout)
+    body = _dumps_body(payload)
+    return _bridge_send("POST", path, body, _JSON_HEADERS, _get_timeout(timeout))
+
+
+def _wait_bridge_job(job_id: Any, deadline_s: float) -> Dict[str, Any]:
+    """Poll GET /jobs/<id> for an /exec sent with "wait": false until it finishes; returns its final reply."""
+    if not isinstance(job_id, str) or not job_id:
+        raise ToolError("Invalid response from Blender bridge")
+    path = f"/jobs/{urllib.parse.quote(job_id, safe='')}"
+    deadline = time.monotonic() + deadline_s
+    delay = 0.05
+    while True:
+        data = _bridge_request(path, timeout=2.0)
+        if not data.get("pending"):
+            return data
+        if time.monotonic() + delay > deadline:
+            raise ToolError("Timed out waiting for Blender", data={"job_id": job_id})
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+def _wrap_batch(code_fragments: List[str]) -> str:
+    # Each fragment runs in its own function so locals don't collide and one failure doesn't stop the rest.
+    parts = ["_batch_results = []"]
+    for idx, fragment in enumerate(code_fragments):
+        body = textwrap.indent(textwrap.dedent(fragment).strip() or "pass", "    ")
+        parts.append(
+            f"""
+def _batch_op_{idx}():
+{body}
+try:
+    _batch_op_{idx}()
+    _batch_results.append({{"ok": True}})
+except Exception as exc:
+    _batch_results.append({{"ok": False, "error": str(exc)}})
+"""
+        )
+    parts.append("result = _batch_results")
+    return "\n".join(parts)
+
+
+def _batch_exec(code_fragments: List[str], timeout: float = 10.0) -> List[Dict[str, Any]]:
+    """Run several /exec fragments in one bridge round-trip; returns one {"ok", "error"?} status per fragment."""
+    data = _bridge_request("/exec", payload={"code": _wrap_batch(code_fragments)}, timeout=timeout)
+    if not data.get("ok"):
+        error = data.get("error") or "Batch execution failed"
+        return [{"ok": False, "error": error} for _ in code_fragments]
+    results = data.get("result")
+    if not isinstance(results, list) or len(results) != len(code_fragments):
+        raise ToolError("Invalid response from Blender bridge")
+    return results
+
+
+# Helper library shipped to the bridge once (/register_fns); object tools invoke it by name through /call.
+_BRIDGE_FNS_SOURCE = """
+import bpy
+import bmesh
+import math
+
+
+# name -> Object resolved earlier; Blender owns the data, entries are just proxies checked on every hit
+_OBJECT_CACHE = {}
+
+
+def _clear_object_cache(*_args):
+    _OBJECT_CACHE.clear()
+
+
+# depsgraph/undo/file-load handlers drop cached proxies before they can go stale; a re-shipped library
+# replaces the previous copy's handler instead of stacking another one
+for _handlers in (
+    bpy.app.handlers.depsgraph_update_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+):
+    for _old in [h for h in _handlers if getattr(h, "__name__", "") == "_clear_object_cache"]:
+        _handlers.remove(_old)
+    _handlers.append(_clear_object_cache)
+
+
+def _get_object(name):
+    obj = _OBJECT_CACHE.get(name)
+    if obj is not None:
+        try:
+            if obj.name == name:
+                return obj
+        except ReferenceError:
+            pass
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        _OBJECT_CACHE.pop(name, None)
+        raise ValueError(f"Object {name} not found")
+    _OBJECT_CACHE[name] = obj
+    return obj
+
+
+def move_object(name, location):
+    _get_object(name).location = location
+
+
+def delete_object(name):
+    bpy.data.objects.remove(_get_object(name), do_unlink=True)
+    _OBJECT_CACHE.pop(name, None)
+
+
+def scale_object(name, scale):
+    _get_object(name).scale = scale
+
+
+def rotate_object(name, rotation, space="world"):
+    # world and local both set the euler directly, as before
+    _get_object(name).rotation_euler = tuple(math.radians(v) for v in rotation)
+
+
+def reset_transform(name):
+    obj = _get_object(name)
+    obj.location = (0.0, 0.0, 0.0)
+    obj.rotation_euler = (0.0, 0.0, 0.0)
+    obj.scale = (1.0, 1.0, 1.0)
+
+
+def set_shading(name, smooth):
+    polygons = getattr(_get_object(name).data, "polygons", None)
+    if polygons is None:
+        raise ValueError("Object has no polygons")
+    polygons.foreach_set("use_smooth", [smooth] * len(polygons))
+
+
+def mesh_stats(name):
+    obj = _get_object(name)
+    if obj.type != 'MESH':
+        raise ValueError("Object is not a mesh")
+    mesh = obj.data
+    # every n-gon tessellates to n - 2 loop triangles, so the count needs no calc_loop_triangles()
+    return {
+        "verts": len(mesh.vertices),
+        "edges": len(mesh.edges),
+        "faces": len(mesh.polygons),
+        "triangles": len(mesh.loops) - 2 * len(mesh.polygons),
+    }
+
+
+def duplicate_object(name, new_name, offset):
+    obj = _get_object(name)
+    dup = obj.copy()
+    dup.data = obj.data.copy()
+    dup.name = new_name
+    dup.location = (obj.location.x + offset[0], obj.location.y + offset[1], obj.location.z + offset[2])
+    obj.users_collection[0].objects.link(dup)
+
+
+def _object_info(obj):
+    return {
+        "name": obj.name,
+        "type": obj.type,
+        "location": [obj.location.x, obj.location.y, obj.location.z],
+        "rotation": [math.degrees(v) for v in obj.rotation_euler],
+        "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+        "materials": [m.name for m in obj.data.materials] if hasattr(obj.data, "materials") else [],
+    }
+
+
+def get_object_info(name):
+    return _object_info(_get_object(name))
+
+
+def list_objects_info(type=None, name_contains=None):
+    needle = name_contains.lower() if name_contains else None
+    return [
+        _object_info(obj)
+        for obj in bpy.data.objects
+        if (type is None or obj.type == type) and (needle is None or needle in obj.name.lower())
+    ]
+
+
+def select_objects(names):
+    for _selected in bpy.context.selected_objects:
+        _selected.select_set(False)
+    found = []
+    missing = []
+    for nm in names:
+        obj = bpy.data.objects.get(nm)
+        if obj is None:
+            missing.append(nm)
+            continue
+        obj.select_set(True)
+        found.append(nm)
+    if missing:
+        raise ValueError(f"Objects not found: {', '.join(missing)}")
+    if found:
+        bpy.context.view_layer.objects.active = bpy.data.objects.get(found[0])
+
+
+def add_cube(name, location=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0), replace=False):
+    if replace:
+        existing = bpy.data.objects.get(name)
+        if existing is not None:
+            bpy.data.objects.remove(existing, do_unlink=True)
+            _OBJECT_CACHE.pop(name, None)
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=2.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.scale = scale
+    obj.location = location
+    bpy.context.view_layer.objects.active = obj
+    return obj.name
+
+
+def add_camera(name, location, rotation):
+    cam_data = bpy.data.cameras.new(name)
+    cam_obj = bpy.data.objects.new(name, cam_data)
+    bpy.context.scene.collection.objects.link(cam_obj)
+    cam_obj.location = location
+    cam_obj.rotation_euler = tuple(math.radians(v) for v in rotation)
+
+
+def add_light(name, light_type, power, location, rotation):
+    light_data = bpy.data.lights.new(name=name, type=light_type)
+    light_data.energy = power
+    light_obj = bpy.data.objects.new(name=name, object_data=light_data)
+    bpy.context.scene.collection.objects.link(light_obj)
+    light_obj.location = location
+    light_obj.rotation_euler = tuple(math.radians(v) for v in rotation)
+
+
+_TRANSFORMS = {"move_object": move_object, "scale_object": scale_object, "rotate_object": rotate_object}
+
+
+def apply_transforms(ops):
+    results = []
+    for fn_name, args in ops:
+        try:
+            _TRANSFORMS[fn_name](**args)
+            results.append({"ok": True})
+        except Exception as exc:
+            results.append({"ok": False, "error": str(exc)})
+    return results
+
+
+# object name -> BMesh kept open by mesh_ops(keep=True); obj.data is stale until mesh_commit writes it back
+_BMESH_SESSIONS = {}
+
+
+def _drop_mesh_sessions(*_args):
+    # a newly loaded file has none of the objects these were read from
+    for bm in _BMESH_SESSIONS.values():
+        bm.free()
+    _BMESH_SESSIONS.clear()
+
+
+for _old in [h for h in bpy.app.handlers.load_post if getattr(h, "__name__", "") == "_drop_mesh_sessions"]:
+    bpy.app.handlers.load_post.remove(_old)
+bpy.app.handlers.load_post.append(_drop_mesh_sessions)
+
+
+def _mesh_extrude(bm, distance):
+    bm.normal_update()
+    faces = bm.faces[:]
+    if not faces:
+        raise ValueError("Mesh has no faces")
+    geom = bmesh.ops.extrude_face_region(bm, geom=faces)
+    verts = [ele for ele in geom["geom"] if isinstance(ele, bmesh.types.BMVert)]
+    if not verts:
+        raise ValueError("Extrude failed")
+    for v in verts:
+        v.co += v.normal.normalized() * distance
+
+
+def _mesh_inset(bm, thickness):
+    faces = bm.faces[:]
+    if not faces:
+        raise ValueError("Mesh has no faces")
+    bmesh.ops.inset_region(bm, faces=faces, thickness=thickness, depth=0.0, use_even_offset=True)
+
+
+def _mesh_loop_cut(bm, cuts, position):
+    edges = bm.edges[:]
+    if not edges:
+        raise ValueError("Mesh has no edges")
+    # edge_percents maps each edge to its cut position; dict.fromkeys fills the shared value in C
+    bmesh.ops.subdivide_edges(
+        bm, edges=edges, cuts=cuts, edge_percents=dict.fromkeys(edges, position), use_grid_fill=False
+    )
+
+
+def _mesh_bevel(bm, width, segments):
+    edges = bm.edges[:]
+    if not edges:
+        raise ValueError("Mesh has no edges")
+    bmesh.ops.bevel(
+        bm, geom=edges, offset=width, offset_type='OFFSET', segments=segments, profile=0.5, clamp_overlap=True
+    )
+
+
+def _mesh_merge_by_distance(bm, distance):
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=distance)
+
+
+def _mesh_recalc_normals(bm, inside):
+    faces = bm.faces[:]
+    bmesh.ops.recalc_face_normals(bm, faces=faces)
+    if inside:
+        bmesh.ops.reverse_faces(bm, faces=faces)
+
+
+def _mesh_triangulate(bm, quad_method):
+    bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method=quad_method, ngon_method='BEAUTY')
+
+
+_MESH_OPS = {
+    "extrude": _mesh_extrude,
+    "inset": _mesh_inset,
+    "loop_cut": _mesh_loop_cut,
+    "bevel": _mesh_bevel,
+    "merge_by_distance": _mesh_merge_by_distance,
+    "recalc_normals": _mesh_recalc_normals,
+    "triangulate": _mesh_triangulate,
+}
+
+
+# geometry an op cannot run without; checked for the whole batch before any op touches the mesh
+_MESH_OP_NEEDS = {"extrude": "faces", "inset": "faces", "loop_cut": "edges", "bevel": "edges"}
+
+
+def _check_mesh_ops(bm, ops):
+    for op in ops:
+        if op["op"] not in _MESH_OPS:
+            raise ValueError(f"Unknown mesh op: {op['op']}")
+        need = _MESH_OP_NEEDS.get(op["op"])
+        if need is not None and not len(getattr(bm, need)):
+            raise ValueError(f"Mesh has no {need}")
+
+
+def mesh_ops(name, ops, keep=False):
+    bm = _BMESH_SESSIONS.get(name)
+    opened = bm is None
+    if opened:
+        obj = _get_object(name)
+        if obj.type != 'MESH':
+            raise ValueError("Object is not a mesh")
+        if obj.mode == 'EDIT':
+            # edit the live edit-mode mesh in place: no mode switch, nothing to keep or commit
+            bm = bmesh.from_edit_mesh(obj.data)
+            _check_mesh_ops(bm, ops)
+            for op in ops:
+                _MESH_OPS[op["op"]](bm, **op["args"])
+            bmesh.update_edit_mesh(obj.data)
+            return
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+    try:
+        _check_mesh_ops(bm, ops)
+    except Exception:
+        if opened:
+            bm.free()
+        raise
+    _BMESH_SESSIONS[name] = bm
+    try:
+        for op in ops:
+            _MESH_OPS[op["op"]](bm, **op["args"])
+    except Exception:
+        # an op failing part way through drops the session: obj.data keeps its last committed state, and
+        # edits kept by earlier calls go with it rather than copying the bmesh on every call to roll back to
+        _BMESH_SESSIONS.pop(name).free()
+        raise
+    if not keep:
+        mesh_commit([name])
+
+
+def mesh_commit(names=None):
+    committed = []
+    for name in list(_BMESH_SESSIONS) if names is None else names:
+        bm = _BMESH_SESSIONS.pop(name, None)
+        if bm is None:
+            continue
+        obj = bpy.data.objects.get(name)
+        if obj is not None and obj.type == 'MESH':
+            bm.to_mesh(obj.data)
+            obj.data.update()
+            committed.append(name)
+        bm.free()
+    return committed
+"""
+_BRIDGE_FNS_VERSION = hashlib.sha1(_BRIDGE_FNS_SOURCE.encode("utf-8")).hexdigest()[:12]
+
+
+def _bridge_call(fn: str, args: Dict[str, Any], timeout: float = 5.0) -> Any:
+    """Call a _BRIDGE_FNS_SOURCE function on the bridge, shipping the library first if it is missing or stale."""
+    payload = {"fn": fn, "args": args, "version": _BRIDGE_FNS_VERSION}
+    data = _bridge_request("/call", payload=payload, timeout=timeout)
+    if data.get("ok") or data.get("error_type") != "fns_missing":
+        return data
+    registered = _bridge_request(
+        "/register_fns",
+        payload={"source": _BRIDGE_FNS_SOURCE, "version": _BRIDGE_FNS_VERSION},
+        timeout=timeout,
+    )
+    if not registered.get("ok"):
+        return registered
+    return _bridge_request("/call", payload=payload, timeout=timeout)
+
+
+_BRIDGE_FANOUT: Optional[ThreadPoolExecutor] = None
+_BRIDGE_FANOUT_LOCK = threading.Lock()
+
+
+def _bridge_parallel(calls: List[Callable[[], Any]]) -> List[Any]:
+    """Run independent bridge calls concurrently over the keep-alive pool; results keep the input order.
+
+    A call that raises ToolError yields {"ok": False, "error": ...} in its slot instead of failing the rest.
+    """
+    global _BRIDGE_FANOUT
+
+    def _guarded(call: Callable[[], Any]) -> Any:
+        try:
+            return call()
+        except ToolError as exc:
+            return {"ok": False, "error": str(exc)}
+
+    if len(calls) <= 1:
+        return [_guarded(call) for call in calls]
+    if _BRIDGE_FANOUT is None:
+        with _BRIDGE_FANOUT_LOCK:
+            if _BRIDGE_FANOUT is None:
+                # one worker per pooled keep-alive connection
+                _BRIDGE_FANOUT = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bridge")
+    return list(_BRIDGE_FANOUT.map(_guarded, calls))
+
+
+class _TransformCoalescer:
+    """Debounces move/scale/rotate: keeps the latest args per (fn, object) and sends them in one /call once quiet."""
+
+    def __init__(self, window_s: float) -> None:
+        self._window_s = window_s
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # held for the whole send so other bridge calls wait for queued transforms to land first
+        self._send_lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    def push(self, fn: str, args: Dict[str, Any]) -> None:
+        key = (fn, args["name"])
+        with self._lock:
+            self._pending.pop(key, None)  # re-insert so ops go out in order of their latest update
+            self._pending[key] = args
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._window_s, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        # take the send lock even when nothing is queued: the timer thread may be mid-send with ops it already
+        # took, and the caller must not reach the bridge before they land (re-entrant for that thread's own call)
+        with self._send_lock:
+            if not self._pending:
+                return
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            ops = [[fn, args] for (fn, _), args in pending.items()]
+            try:
+                data = _bridge_call("apply_transforms", {"ops": ops}, timeout=10.0)
+            except ToolError as exc:
+                data = {"ok": False, "error": str(exc)}
+            if data.get("ok"):
+                errors = [r.get("error") for r in data.get("result") or [] if not r.get("ok")]
+            else:
+                errors = [data.get("error") or "Failed to apply transforms"]
+            if errors:
+                try:
+                    sys.stderr.write(f"[coalesce] {len(errors)} transform(s) failed: {'; '.join(map(str, errors))}\n")
+                    sys.stderr.flush()
+                except Exception:
+                    pass
+
+
+_TRANSFORM_COALESCER: Optional[_TransformCoalescer] = None
+
+
+def _get_transform_coalescer() -> Optional[_TransformCoalescer]:
+    global _TRANSFORM_COALESCER
+    if _COALESCE_WINDOW_S <= 0:
+        return None
+    if _TRANSFORM_COALESCER is None:
+        _TRANSFORM_COALESCER = _TransformCoalescer(_COALESCE_WINDOW_S)
+        atexit.register(_TRANSFORM_COALESCER.flush)
+    return _TRANSFORM_COALESCER
+
+
 def _make_tool_result(text: str, is_error: bool = False) -> Dict[str, Any]:
-    return {"content": [{"type": "text", "text": text}], "isError": is_error}
+    # "ok" is filled in here so call_tool doesn't have to copy the dict to add it
+    return {"content": [{"type": "text", "text": text}], "isError": is_error, "ok": not is_error}
+
+
+# Tools whose last successful arguments are remembered so an identical repeat can skip the bridge.
+_TRANSFORM_TOOLS = frozenset(("blender-move-object", "blender-scale-object", "blender-rotate-object"))
+_TRANSFORM_NOOP_TTL_S = 2.0
+# align-to-axis reads the remembered transforms and drops the one it overwrites, so it leaves the rest alone
+_TRANSFORM_KEEPING_TOOLS = _TRANSFORM_TOOLS | frozenset(("blender-align-to-axis",))
+# Tools that never add, delete or rename objects: a blender-list-objects listing stays valid across them,
+# so the name-checked ones among them can report a missing object without a bridge round trip.
+_NAME_PRESERVING_TOOLS = frozenset(
+    (
+        "blender-list-objects",
+        "blender-get-object-info",
+        "blender-list-modifiers",
+        "blender-list-material-slots",
+        "blender-apply-modifier",
+        "blender-parent",
+        "blender-move-to-collection",
+        "blender-align-to-axis",
+    )
+)
+_OBJECT_NAMES_TTL_S = 1.0
+# Tools that never add, remove or rename materials: a blender-list-materials result stays valid across them.
+# create-material is included because it adds its own material to the remembered list.
+_MATERIAL_PRESERVING_TOOLS = frozenset(
+    (
+        "blender-list-materials",
+        "blender-create-material",
+        "blender-list-material-slots",
+        "blender-list-objects",
+        "blender-get-object-info",
+        "blender-list-modifiers",
+        "blender-move-object",
+        "blender-scale-object",
+        "blender-rotate-object",
+        "blender-parent",
+        "blender-move-to-collection",
+        "blender-align-to-axis",
+    )
+)
+# bounds how long edits made in Blender's own UI can go unnoticed by the remembered material list
+_MATERIAL_NAMES_TTL_S = 5.0
+# how long blender-export polls a queued export before giving up (the job keeps running in Blender)
+_EXPORT_WAIT_S = 600.0
+# Idempotent setters and read-only tools: an identical call right after a successful one reuses its result.
+_REPEAT_SETTER_TOOLS = frozenset(("blender-reset-transform", "blender-set-shading", "blender-apply-transforms"))
+_REPEAT_READ_TOOLS = frozenset(("blender-get-mesh-stats",))
+_REPEAT_TOOLS = _REPEAT_SETTER_TOOLS | _REPEAT_READ_TOOLS
+_REPEAT_TTL_S = 0.1
+# Tools that may leave a bmesh open in Blender (keep=True); any other tool commits open meshes first.
+_MESH_SESSION_TOOLS = frozenset(
+    (
+        "blender-extrude",
+        "blender-inset",
+        "blender-loop-cut",
+        "blender-bevel-edges",
+        "blender-merge-by-distance",
+        "blender-recalc-normals",
+        "blender-triangulate",
+        "blender-mesh-batch",
+        "blender-mesh-commit",
+    )
+)
+# intent-run never dispatches to the intent tools themselves
+_INTENT_TOOLS = frozenset(("intent-run", "intent-resolve"))
+_MESH_OP_NAMES = ("extrude", "inset", "loop_cut", "bevel", "merge_by_distance", "recalc_normals", "triangulate")
+# triangulate method (names of the old bpy.ops.mesh.quads_convert_to_tris enum) -> bmesh.ops.triangulate quad_method
+_TRIANGULATE_QUAD_METHODS = {
+    "BEAUTY": "BEAUTY",
+    "FIXED": "FIXED",
+    "FIXED_ALTERNATE": "ALTERNATE",
+    "SHORTEST_DIAGONAL": "SHORT_EDGE",
+}
+_UNLOGGED_TOOLS = frozenset(("replay-list", "replay-run", "model-start", "model-step", "model-end", "tool-request"))
+_TS_CACHE: List[Any] = [-1, ""]
+
+
+def _utc_timestamp() -> str:
+    # Re-format the seconds prefix only when the second rolls over; avoids a datetime allocation per log line.
+    ns = time.time_ns()
+    sec, frac = divmod(ns, 1_000_000_000)
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[:] = [sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))]
+    return f"{_TS_CACHE[1]}.{frac // 1000:06d}+00:00"
+
+
+# Random bytes drawn from urandom in 4 KiB batches and handed out 16 at a time.
+_ID_POOL = b""
+_ID_POOL_POS = 0
+_ID_POOL_LOCK = threading.Lock()
+
+
+def _reset_id_pool() -> None:
+    # a forked child must not hand out the same bytes as its parent
+    global _ID_POOL, _ID_POOL_POS
+    _ID_POOL, _ID_POOL_POS = b"", 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _random16() -> bytes:
+    global _ID_POOL, _ID_POOL_POS
+    with _ID_POOL_LOCK:
+        if _ID_POOL_POS >= len(_ID_POOL):
+            _ID_POOL, _ID_POOL_POS = os.urandom(4096), 0
+        pool, pos = _ID_POOL, _ID_POOL_POS
+        _ID_POOL_POS = pos + 16
+    return pool[pos : pos + 16]
+
+
+def _fast_uuid() -> str:
+    """RFC 4122 version-4 UUID string without going through uuid.UUID."""
+    raw = bytearray(_random16())
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _new_action_id() -> str:
+    return _random16().hex()
 
 
 def _append_action(tool: str, arguments: Dict[str, Any], result: Dict[str, Any]) -> None:
     try:
-        summary = ""
-        content = result.get("content")
-        if isinstance(content, list) and content:
-            first = content[0]
-            if isinstance(first, dict):
-                text_val = first.get("text")
-                if isinstance(text_val, str):
-                    summary = text_val[:200]
+        # results almost always have content[0]["text"]; only pay for the odd shapes when they occur
+        try:
+            summary = result["content"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            summary = ""
+        summary = summary[:200] if isinstance(summary, str) else ""
         entry = {
-            "id": str(uuid.uuid4()),
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "id": _new_action_id(),
+            "ts": _utc_timestamp(),
             "tool": tool,
             "arguments": arguments or {},
             "isError": bool(result.get("isError")),
             "summary": summary,
         }
-        _atomic_append_jsonl(RUNS_FILE, json.dumps(entry, ensure_ascii=False) + "\n")
+        _write_log_line(_RUNS_FILE_STR, _dumps_line(entry))
     except Exception as exc:  # noqa: BLE001
         try:
             sys.stderr.write(f"[replay] failed to log action: {exc}\n")
@@ -696,9 +1894,14 @@ def _append_action(tool: str, arguments: Dict[str, Any], result: Dict[str, Any])
             pass
 
 
+def _new_request_entry(entry_type: str, session: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # model-start/step/end records for runs/requests.jsonl
+    return {"id": _new_action_id(), "ts": _utc_timestamp(), "type": entry_type, "session": session, "payload": payload}
+
+
 def _append_request(entry: Dict[str, Any]) -> None:
     try:
-        _atomic_append_jsonl(REQUESTS_FILE, json.dumps(entry, ensure_ascii=False) + "\n")
+        _write_log_line(_REQUESTS_FILE_STR, _dumps_line(entry))
     except Exception as exc:  # noqa: BLE001
         try:
             sys.stderr.write(f"[model] failed to log request: {exc}\n")
@@ -707,44 +1910,701 @@ def _append_request(entry: Dict[str, Any]) -> None:
             pass
 
 
-class ToolRegistry:
-    def __init__(self) -> None:
-        self._tools: Dict[str, Tool] = {}
-        self._register_defaults()
-        self._tool_request_store = ToolRequestStore()
-
-    def _register(
-        self, name: str, description: str, input_schema: Dict[str, Any], handler: Callable[[Dict[str, Any]], Dict[str, Any]]
-    ) -> None:
-        if not NAME_PATTERN.match(name):
-            raise ValueError(f"Invalid tool name: {name}")
-        self._tools[name] = Tool(name=name, description=description, input_schema=input_schema, handler=handler)
-
-    def _register_defaults(self) -> None:
-        register_all(self, _bridge_request, _make_tool_result, ToolError)
-
-
-        # Tool Requests (admin/debug)
-        self._register(
-            "tool-requests-info",
-            "Show tool-request store info (paths, env, counts).",
-            {"type": "object", "properties": {}, "additionalProperties": False},
-            self._tool_tool_requests_info,
-        )
-        self._register(
-            "tool-requests-tail",
-            "Tail tool-request JSONL files (base/updates/both) with parse status.",
-            {
-                "type": "object",
+# /exec code templates, built once at import; handlers fill the *_TPL ones with str.format.
+_CUBE_CODE = """
+import bpy, bmesh
+mesh = bpy.data.meshes.new("Cube")
+bm = bmesh.new()
+bmesh.ops.create_cube(bm, size=2.0)
+bm.to_mesh(mesh)
+bm.free()
+obj = bpy.data.objects.new("Cube", mesh)
+scene = bpy.context.scene
+scene.collection.objects.link(obj)
+obj.location = (0.0, 0.0, 0.0)
+bpy.context.view_layer.objects.active = obj
+"""
+_ADD_CUBE_ARGS = {"name": "Cube"}
+_BLOCKOUT_ARGS = {"name": "BlockoutCube", "scale": [2.0, 1.0, 1.0], "replace": True}
+_MACRO_SCENE_CAMERA = {"name": "Camera", "location": [7.0, -7.0, 5.0], "rotation": [63.0, 0.0, 45.0]}
+_MACRO_SCENE_LIGHT = {
+    "name": "Sun",
+    "light_type": "SUN",
+    "power": 3.0,
+    "location": [4.0, 4.0, 8.0],
+    "rotation": [40.0, 0.0, 135.0],
+}
+_LIST_OBJECTS_CODE = """
+import bpy
+result = []
+for obj in bpy.data.objects:
+    result.append({"name": obj.name, "type": obj.type})
+"""
+_DELETE_ALL_CODE = """
+import bpy
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete(use_global=False)
+"""
+_LIST_MATERIALS_CODE = """
+import bpy
+result = [mat.name for mat in bpy.data.materials]
+"""
+_CYLINDER_TPL = """
+import bpy
+import bmesh
+mesh = bpy.data.meshes.new("Cylinder")
+bm = bmesh.new()
+bmesh.ops.create_circle(bm, segments={vertices_i}, radius={radius_f}, cap_ends=True)
+bmesh.ops.extrude_edge_only(bm, edges=bm.edges)
+bmesh.ops.translate(bm, verts=[v for v in bm.verts if v.co.z > 0], vec=(0,0,{depth_f}))
+bm.to_mesh(mesh)
+bm.free()
+obj = bpy.data.objects.new({name}, mesh)
+scene = bpy.context.scene
+scene.collection.objects.link(obj)
+obj.location = {location}
+bpy.context.view_layer.objects.active = obj
+"""
+_UV_SPHERE_TPL = """
+import bpy
+bpy.ops.mesh.primitive_uv_sphere_add(radius={radius_f}, segments={seg_i}, ring_count={ring_i}, location={location})
+obj = bpy.context.active_object
+if obj is not None:
+    obj.name = {name}
+"""
+_ICO_SPHERE_TPL = """
+import bpy
+bpy.ops.mesh.primitive_ico_sphere_add(radius={radius_f}, subdivisions={sub_i}, location={location})
+obj = bpy.context.active_object
+if obj is not None:
+    obj.name = {name}
+"""
+_PLANE_TPL = """
+import bpy, bmesh
+mesh = bpy.data.meshes.new("Plane")
+bm = bmesh.new()
+bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size={size_f})
+bm.to_mesh(mesh)
+bm.free()
+obj = bpy.data.objects.new({name}, mesh)
+scene = bpy.context.scene
+scene.collection.objects.link(obj)
+obj.location = {location}
+bpy.context.view_layer.objects.active = obj
+"""
+_CONE_TPL = """
+import bpy, bmesh
+mesh = bpy.data.meshes.new("Cone")
+bm = bmesh.new()
+bmesh.ops.create_cone(bm, segments={vertices_i}, radius1={r1}, radius2={r2}, depth={d})
+bm.to_mesh(mesh)
+bm.free()
+obj = bpy.data.objects.new({name}, mesh)
+scene = bpy.context.scene
+scene.collection.objects.link(obj)
+obj.location = {location}
+bpy.context.view_layer.objects.active = obj
+"""
+_TORUS_TPL = """
+import bpy
+bpy.ops.mesh.primitive_torus_add(major_radius={maj_r}, minor_radius={min_r}, major_segments={maj_seg}, minor_segments={min_seg}, location={location})
+obj = bpy.context.active_object
+if obj is not None:
+    obj.name = {name}
+"""
+_JOIN_OBJECTS_TPL = """
+import bpy
+objects = {objects}
+name = {name}
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
+for obj_name in objects:
+    obj = bpy.data.objects.get(obj_name)
+    if obj is None:
+        raise ValueError(f"Object {{obj_name}} not found")
+    obj.select_set(True)
+if not bpy.context.selected_objects:
+    raise ValueError("No objects selected")
+bpy.context.view_layer.objects.active = bpy.context.selected_objects[0]
+bpy.ops.object.join()
+bpy.context.active_object.name = name
+"""
+# image texture target -> (image colorspace, Principled BSDF input fed by the texture)
+_IMAGE_TEXTURE_TARGETS = {
+    "BASE_COLOR": ("sRGB", "Base Color"),
+    "ROUGHNESS": ("Non-Color", "Roughness"),
+    "NORMAL": ("Non-Color", "Normal"),
+}
+_ORIGIN_TYPES = {
+    "geometry": "ORIGIN_GEOMETRY",
+    "cursor": "ORIGIN_CURSOR",
+    "mass_center": "ORIGIN_CENTER_OF_MASS",
+    "bottom_center": "BOTTOM_CENTER",
+}
+_ORIGIN_TYPE_KEYS = tuple(_ORIGIN_TYPES)
+_SET_ORIGIN_TPL = """
+import bpy
+name = {name}
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError(f"Object {{name}} not found")
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
+obj.select_set(True)
+bpy.context.view_layer.objects.active = obj
+bpy.ops.object.origin_set(type={origin_type})
+"""
+_SET_ORIGIN_BOTTOM_TPL = """
+import bpy, mathutils
+name = {name}
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError(f"Object {{name}} not found")
+mw = obj.matrix_world
+count = 0
+sum_x = sum_y = 0.0
+min_z = float("inf")
+for corner in obj.bound_box:
+    co = mw @ mathutils.Vector(corner)
+    count += 1
+    sum_x += co.x
+    sum_y += co.y
+    if co.z < min_z:
+        min_z = co.z
+if not count:
+    raise ValueError("Object has no bounding box")
+target = mathutils.Vector((sum_x / count, sum_y / count, min_z))
+cur = obj.matrix_world.to_translation()
+delta = target - cur
+if hasattr(obj.data, "transform"):
+    obj.data.transform(mathutils.Matrix.Translation(-obj.matrix_world.inverted() @ delta))
+    obj.location = obj.location + delta
+else:
+    raise ValueError("Object has no geometry to transform")
+"""
+_APPLY_TRANSFORMS_TPL = """
+import bpy
+name = {name}
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError(f"Object {{name}} not found")
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
+obj.select_set(True)
+bpy.context.view_layer.objects.active = obj
+bpy.ops.object.transform_apply(location={location}, rotation={rotation}, scale={scale})
+"""
+_ASSIGN_MATERIAL_TPL = """
+import bpy
+obj = bpy.data.objects.get({obj_name})
+if obj is None:
+    raise ValueError("Object not found")
+mat = bpy.data.materials.get({mat_name})
+if mat is None:
+    raise ValueError("Material not found")
+slot_index = {slot_index}
+create_slot = {create_slot}
+slots = obj.data.materials
+if slot_index >= len(slots):
+    if not create_slot:
+        raise ValueError("Material slot does not exist")
+    while len(slots) <= slot_index:
+        slots.append(None)
+slots[slot_index] = mat
+"""
+_CONVERT_OBJECT_TPL = """
+import bpy
+name = {name}
+target = {target}
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+if target == "MESH" and obj.type not in {{"CURVE", "MESH", "FONT", "SURFACE", "TEXT"}}:
+    raise ValueError("Object cannot be converted to mesh")
+if target == "CURVE" and obj.type not in {{"MESH", "CURVE"}}:
+    raise ValueError("Object cannot be converted to curve")
+bpy.ops.object.mode_set(mode='OBJECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
+obj.select_set(True)
+bpy.context.view_layer.objects.active = obj
+bpy.ops.object.convert(target=target)
+new_obj = bpy.context.view_layer.objects.active or obj
+result = {{
+    "name": new_obj.name,
+    "type": new_obj.type,
+}}
+"""
+_SNAP_TPL = """
+import bpy, math
+name = {name}
+target = {target}
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+before = {{
+    "location": [obj.location.x, obj.location.y, obj.location.z],
+    "rotation": [math.degrees(v) for v in obj.rotation_euler],
+    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+}}
+new_loc = before["location"]
+if target in {{"GRID", "INCREMENT"}}:
+    new_loc = [round(obj.location.x), round(obj.location.y), round(obj.location.z)]
+elif target == "CURSOR":
+    cur = bpy.context.scene.cursor.location
+    new_loc = [cur.x, cur.y, cur.z]
+elif target == "ACTIVE":
+    active = bpy.context.view_layer.objects.active
+    if active is None:
+        raise ValueError("Active object required for ACTIVE snap")
+    new_loc = [active.location.x, active.location.y, active.location.z]
+obj.location = tuple(new_loc)
+after = {{
+    "location": [obj.location.x, obj.location.y, obj.location.z],
+    "rotation": [math.degrees(v) for v in obj.rotation_euler],
+    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+}}
+result = {{"before": before, "after": after, "target": target}}
+"""
+
+
+def _minify_code(source: str) -> str:
+    # Fixed /exec sources go out on every call: drop comments, blank lines and indentation slack once at import.
+    return ast.unparse(ast.parse(source)) + "\n"
+
+
+# add-modifier: per modifier type, a fixed source made of the shared head plus only the code that applies
+# its settings; name and settings arrive through /exec params
+_MODIFIER_TYPES = {
+    "mirror": "MIRROR",
+    "array": "ARRAY",
+    "solidify": "SOLIDIFY",
+    "bevel": "BEVEL",
+    "subdivision": "SUBSURF",
+    "boolean": "BOOLEAN",
+    "decimate": "DECIMATE",
+    "weld": "WELD",
+    "triangulate": "TRIANGULATE",
+    "screw": "SCREW",
+    "edge_split": "EDGE_SPLIT",
+    "shrinkwrap": "SHRINKWRAP",
+    "lattice": "LATTICE",
+    "skin": "SKIN",
+}
+_REQUIRED = object()
+
+
+def _as_bool(value: Any) -> bool:
+    if not isinstance(value, bool):
+        raise TypeError("expected a boolean")
+    return value
+
+
+def _as_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError("expected a string")
+    return value
+
+
+def _as_boolean_operation(value: Any) -> str:
+    # validated lowercase name in, bpy enum out, so Blender assigns a constant instead of mapping it
+    if value not in _BOOLEAN_OPERATIONS:
+        raise ValueError("expected union, difference or intersect")
+    return value.upper()
+
+
+def _as_vec3(value: Any) -> List[float]:
+    if not isinstance(value, list) or len(value) != 3:
+        raise TypeError("expected 3 numbers")
+    return [float(v) for v in value]
+
+
+def _as_choice(allowed: FrozenSet[str]) -> Callable[[Any], str]:
+    def cast(value: Any) -> str:
+        if not isinstance(value, str):
+            raise TypeError("expected a string")
+        choice = value.upper()
+        if choice not in allowed:
+            raise ValueError("unexpected choice")
+        return choice
+
+    return cast
+
+
+_TRIANGULATE_METHODS = frozenset(("BEAUTY", "FIXED", "FIXED_ALTERNATE", "SHORTEST_DIAGONAL"))
+_BOOLEAN_OPERATIONS = frozenset(("union", "difference", "intersect"))
+_AXES = frozenset(("X", "Y", "Z"))
+_WRAP_METHODS = frozenset(("NEAREST_SURFACEPOINT", "PROJECT", "NEAREST_VERTEX", "TARGET_PROJECT"))
+# modifier type -> rows of (argument keys, tried in order; settings key; cast; error; default). A default of
+# None skips a missing argument, _REQUIRED rejects it, and any other default is cast like a given value.
+_MODIFIER_SETTINGS_SCHEMA: Dict[str, Tuple[Tuple[Tuple[str, ...], str, Callable[[Any], Any], str, Any], ...]] = {
+    "mirror": (
+        (("use_axis_x",), "use_axis_x", _as_bool, "use_axis_x must be a boolean", None),
+        (("use_axis_y",), "use_axis_y", _as_bool, "use_axis_y must be a boolean", None),
+        (("use_axis_z",), "use_axis_z", _as_bool, "use_axis_z must be a boolean", None),
+        (("clipping",), "use_clip", _as_bool, "clipping must be a boolean", None),
+        (("merge",), "use_mirror_merge", _as_bool, "merge must be a boolean", None),
+        (("merge_threshold",), "merge_threshold", float, "merge_threshold must be a number", None),
+    ),
+    "array": (
+        (("count",), "count", int, "count must be an integer", None),
+        (("relative_offset",), "relative_offset", _as_vec3, "relative_offset must be an array of 3 numbers", None),
+        (("offset_object",), "offset_object", _as_str, "offset_object must be a string", None),
+        (("object_offset",), "object_offset", _as_vec3, "object_offset must be an array of 3 numbers", None),
+    ),
+    "solidify": ((("thickness",), "thickness", float, "thickness must be a number", None),),
+    "bevel": (
+        (("width",), "width", float, "width must be a number", None),
+        (("segments",), "segments", int, "segments must be an integer", None),
+    ),
+    "subdivision": ((("levels",), "levels", int, "levels must be an integer", None),),
+    "boolean": (
+        (("cutter",), "cutter", _as_str, "cutter must be a string", None),
+        (
+            ("operation",),
+            "operation",
+            _as_boolean_operation,
+            "operation must be union, difference, or intersect",
+            "union",
+        ),
+    ),
+    "decimate": ((("ratio",), "ratio", float, "ratio must be a number", None),),
+    "weld": ((("merge_threshold",), "merge_threshold", float, "merge_threshold must be a number", None),),
+    "triangulate": (
+        (
+            ("quad_method",),
+            "quad_method",
+            _as_choice(_TRIANGULATE_METHODS),
+            "quad_method must be a valid triangulate method",
+            None,
+        ),
+        (
+            ("ngon_method",),
+            "ngon_method",
+            _as_choice(_TRIANGULATE_METHODS),
+            "ngon_method must be a valid triangulate method",
+            None,
+        ),
+    ),
+    "screw": (
+        (("angle_degrees", "angle"), "angle", float, "angle_degrees must be a number", 360.0),
+        (("steps",), "steps", int, "steps must be an integer", None),
+        (("axis",), "axis", _as_choice(_AXES), "axis must be X, Y, or Z", "Z"),
+    ),
+    "edge_split": (
+        (("split_angle",), "split_angle", float, "split_angle must be a number", 30.0),
+        (("use_edge_angle",), "use_edge_angle", _as_bool, "use_edge_angle must be a boolean", None),
+        (("use_edge_sharp",), "use_edge_sharp", _as_bool, "use_edge_sharp must be a boolean", None),
+    ),
+    "shrinkwrap": (
+        (("target",), "target", _as_str, "target must be a string", None),
+        (("offset",), "offset", float, "offset must be a number", None),
+        (
+            ("wrap_method",),
+            "wrap_method",
+            _as_choice(_WRAP_METHODS),
+            "wrap_method is invalid",
+            None,
+        ),
+    ),
+    "lattice": ((("lattice",), "lattice", _as_str, "lattice must be a string", _REQUIRED),),
+}
+_ADD_MODIFIER_TPL = """
+import bpy, math
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+mod = obj.modifiers.new(name="{mod_type}_mod", type="{mod_bpy_type}")
+"""
+_MODIFIER_SETTINGS_CODE = {
+    "mirror": """for key, val in settings.items():
+    setattr(mod, key, val)
+""",
+    "array": """if "count" in settings:
+    mod.count = settings["count"]
+if "relative_offset" in settings:
+    mod.use_relative_offset = True
+    mod.relative_offset_displace = tuple(settings["relative_offset"])
+if "offset_object" in settings:
+    off_obj = bpy.data.objects.get(settings["offset_object"])
+    if off_obj is None:
+        raise ValueError("Offset object not found")
+    mod.use_object_offset = True
+    mod.offset_object = off_obj
+if "object_offset" in settings:
+    mod.use_constant_offset = True
+    mod.constant_offset_displace = tuple(settings["object_offset"])
+""",
+    "solidify": """if "thickness" in settings:
+    mod.thickness = settings["thickness"]
+""",
+    "bevel": """if "width" in settings:
+    mod.width = settings["width"]
+if "segments" in settings:
+    mod.segments = settings["segments"]
+""",
+    "subdivision": """if "levels" in settings:
+    mod.levels = settings["levels"]
+""",
+    "boolean": """if "cutter" in settings and settings["cutter"]:
+    cutter_obj = bpy.data.objects.get(settings["cutter"])
+    if cutter_obj is None:
+        raise ValueError("Cutter object not found")
+    mod.object = cutter_obj
+mod.operation = settings["operation"]
+""",
+    "decimate": """if "ratio" in settings:
+    mod.ratio = settings["ratio"]
+""",
+    "weld": """if "merge_threshold" in settings:
+    mod.merge_threshold = settings["merge_threshold"]
+""",
+    "triangulate": """if "quad_method" in settings:
+    mod.quad_method = settings["quad_method"]
+if "ngon_method" in settings:
+    mod.ngon_method = settings["ngon_method"]
+""",
+    "screw": """if "angle" in settings:
+    mod.angle = math.radians(settings["angle"])
+if "steps" in settings:
+    mod.steps = settings["steps"]
+if "axis" in settings:
+    mod.axis = settings["axis"]
+""",
+    "edge_split": """if "split_angle" in settings:
+    mod.split_angle = math.radians(settings["split_angle"])
+if "use_edge_angle" in settings:
+    mod.use_edge_angle = settings["use_edge_angle"]
+if "use_edge_sharp" in settings:
+    mod.use_edge_sharp = settings["use_edge_sharp"]
+""",
+    "shrinkwrap": """if "target" in settings:
+    tgt = bpy.data.objects.get(settings["target"])
+    if tgt is None:
+        raise ValueError("Shrinkwrap target not found")
+    mod.target = tgt
+if "offset" in settings:
+    mod.offset = settings["offset"]
+if "wrap_method" in settings:
+    mod.wrap_method = settings["wrap_method"]
+""",
+    "lattice": """if "lattice" in settings:
+    lat = bpy.data.objects.get(settings["lattice"])
+    if lat is None:
+        raise ValueError("Lattice object not found")
+    mod.object = lat
+""",
+}
+_ADD_MODIFIER_CODE = {
+    mod_type: _minify_code(
+        _ADD_MODIFIER_TPL.format(mod_type=mod_type, mod_bpy_type=mod_bpy_type) + _MODIFIER_SETTINGS_CODE.get(mod_type, "")
+    )
+    for mod_type, mod_bpy_type in _MODIFIER_TYPES.items()
+}
+# Appended after code that binds obj and mod: applies mod with obj as the only selected, active object.
+_APPLY_MODIFIER_CODE = _minify_code("""
+bpy.ops.object.mode_set(mode='OBJECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
+obj.select_set(True)
+bpy.context.view_layer.objects.active = obj
+bpy.ops.object.modifier_apply(modifier=mod.name)
+""")
+# Fixed /exec sources: arguments arrive as globals through the payload's params, so the text never
+# changes between calls and the bridge compiles each one once.
+_BOOLEAN_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+cutter_obj = bpy.data.objects.get(cutter)
+if cutter_obj is None:
+    raise ValueError("Cutter object not found")
+mod = obj.modifiers.new(name="Boolean_auto", type="BOOLEAN")
+mod.operation = operation
+mod.object = cutter_obj
+""")
+_APPLY_NAMED_MODIFIER_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+mod = obj.modifiers.get(modifier)
+if mod is None:
+    raise ValueError("Modifier not found")
+""") + _APPLY_MODIFIER_CODE
+_PARENT_CODE = _minify_code("""
+import bpy
+child_obj = bpy.data.objects.get(child_name)
+if child_obj is None:
+    raise ValueError("Child not found")
+parent_obj = bpy.data.objects.get(parent_name)
+if parent_obj is None:
+    raise ValueError("Parent not found")
+current_matrix = child_obj.matrix_world.copy()
+child_obj.parent = parent_obj
+if keep_transform:
+    child_obj.matrix_world = current_matrix
+""")
+_MOVE_TO_COLLECTION_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+col = bpy.data.collections.get(collection_name)
+if col is None:
+    if not create:
+        raise ValueError("Collection not found")
+    col = bpy.data.collections.new(collection_name)
+    bpy.context.scene.collection.children.link(col)
+# users_collection holds the few collections obj is in; col.objects would be scanned in full
+if col not in obj.users_collection:
+    col.objects.link(obj)
+""")
+_ALIGN_TO_AXIS_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+if mode == "ROTATION_ZERO":
+    obj.rotation_euler = (0.0, 0.0, 0.0)
+else:
+    loc = list(obj.location)
+    if axis == "X":
+        loc[0] = 0.0
+    elif axis == "Y":
+        loc[1] = 0.0
+    elif axis == "Z":
+        loc[2] = 0.0
+    obj.location = tuple(loc)
+""")
+_CREATE_MATERIAL_CODE = _minify_code("""
+import bpy
+mat = bpy.data.materials.new(name=name)
+mat.use_nodes = True
+nodes = mat.node_tree.nodes
+links = mat.node_tree.links
+nodes.clear()
+bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
+bsdf.location = (0, 0)
+bsdf.inputs['Base Color'].default_value = tuple(base_color)
+output = nodes.new(type='ShaderNodeOutputMaterial')
+output.location = (300, 0)
+links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+result = mat.name
+""")
+_LIST_MATERIAL_SLOTS_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+if not hasattr(obj.data, "materials"):
+    raise ValueError("Object has no material slots")
+result = [{"index": idx, "material": mat.name if mat else None} for idx, mat in enumerate(obj.data.materials)]
+""")
+_EXPORT_CODE = {
+    "fbx": _minify_code(
+        """
+import bpy
+bpy.ops.export_scene.fbx(filepath=path, use_selection=selected_only)
+"""
+    ),
+    "gltf": _minify_code(
+        """
+import bpy
+bpy.ops.export_scene.gltf(filepath=path, use_selection=selected_only)
+"""
+    ),
+}
+_LIST_MODIFIERS_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(name)
+if obj is None:
+    raise ValueError("Object not found")
+mods = []
+for mod in obj.modifiers:
+    info = {"name": mod.name, "type": mod.type}
+    for field in (
+        "levels", "render_levels", "width", "segments", "thickness", "ratio",
+        "merge_threshold", "use_clip", "use_mirror_merge", "use_relative_offset",
+        "relative_offset_displace", "use_constant_offset", "constant_offset_displace",
+        "use_object_offset", "offset_object", "split_angle", "use_edge_angle", "use_edge_sharp",
+        "wrap_method", "offset", "axis", "angle", "steps"
+    ):
+        try:
+            val = getattr(mod, field, None)
+        except Exception:
+            continue
+        if hasattr(val, "name"):
+            val = val.name
+        elif hasattr(val, "to_tuple"):
+            try:
+                val = list(val)
+            except Exception:
+                pass
+        info[field] = val
+    mods.append(info)
+result = mods
+""")
+_RENAME_OBJECT_CODE = _minify_code("""
+import bpy
+obj = bpy.data.objects.get(old_name)
+if obj is None:
+    raise ValueError(f"Object {old_name} not found")
+obj.name = new_name
+""")
+
+
+def _fmt_vec(vec: List[float]) -> str:
+    return f"({vec[0]}, {vec[1]}, {vec[2]})"
+
+
+# Intent trigger phrase -> (intent, prefix_only). _INTENT_RANK is the priority when several phrases occur.
+_INTENT_TRIGGERS: Dict[str, Tuple[str, bool]] = {
+    "exec:": ("exec", True),
+    "add cube": ("add_cube", False),
+    "ajoute un cube": ("add_cube", False),
+    "create cube": ("add_cube", False),
+    "move cube": ("move_cube", True),
+    "deplace cube": ("move_cube", True),
+    "déplace cube": ("move_cube", True),
+    "delete cube": ("delete_cube", False),
+    "supprime cube": ("delete_cube", False),
+    "remove cube": ("delete_cube", False),
+    "blockout": ("blockout", False),
+}
+_INTENT_RANK = {kind: rank for rank, kind in enumerate(("exec", "add_cube", "move_cube", "delete_cube", "blockout"))}
+# longest phrases first so a longer trigger wins over one it contains at the same position
+_INTENT_RE = re.compile("|".join(re.escape(p) for p in sorted(_INTENT_TRIGGERS, key=len, reverse=True)))
+
+
+def _intent_result(tool: str, arguments: Dict[str, Any], confidence: float, notes: str) -> Dict[str, Any]:
+    return {"tool": tool, "arguments": arguments, "confidence": confidence, "notes": notes}
+
+
+class ToolRegistry:
+    # Tool Requests (admin/debug)
+    _ADMIN_TOOLS = (
+        (
+            "tool-requests-info",
+            "Show tool-request store info (paths, env, counts).",
+            {"type": "object", "properties": {}, "additionalProperties": False},
+            "_tool_tool_requests_info",
+        ),
+        (
+            "tool-requests-tail",
+            "Tail tool-request JSONL files (base/updates/both) with parse status.",
+            {
+                "type": "object",
                 "properties": {
                     "n": {"type": "integer", "minimum": 1, "maximum": 500, "default": 20},
                     "which": {"type": "string", "enum": ["base", "updates", "both"], "default": "both"},
                 },
                 "additionalProperties": False,
             },
-            self._tool_tool_requests_tail,
-        )
-        self._register(
+            "_tool_tool_requests_tail",
+        ),
+        (
             "tool-requests-clear",
             "Delete tool-request JSONL files in the current store (requires confirm=true).",
             {
@@ -752,24 +2612,99 @@ class ToolRegistry:
                 "properties": {"confirm": {"type": "boolean", "default": False}},
                 "additionalProperties": False,
             },
-            self._tool_tool_requests_clear,
-        )
+            "_tool_tool_requests_clear",
+        ),
+    )
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, Tool] = {}
+        # name -> handler, kept alongside _tools so dispatch is a single dict lookup.
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        # registered tools intent-run may dispatch to, kept up to date by _register
+        self._intent_targets: Set[str] = set()
+        # tools/list payload and its encodings, rebuilt lazily after any registration
+        self._list_tools_cache: Optional[List[Dict[str, Any]]] = None
+        # parsed runs log: ((path, inode, mtime_ns, size), bytes consumed, actions); grows incrementally
+        self._actions_cache: Tuple[Optional[Tuple[str, int, int, int]], int, List[Dict[str, Any]]] = (None, 0, [])
+        # id -> first action with that id, maintained alongside _actions_cache for replay-run
+        self._actions_by_id: Dict[str, Dict[str, Any]] = {}
+        # (bridge fn, object name) -> (args, monotonic time) of the last transform that reached Blender
+        self._last_xform: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+        # tool name -> (args, monotonic time, result) of its last successful call, for _REPEAT_TOOLS
+        self._last_repeat: Dict[str, Tuple[Dict[str, Any], float, Dict[str, Any]]] = {}
+        # (monotonic time, object names) from the last blender-list-objects, dropped by any name-changing tool
+        self._object_names: Optional[Tuple[float, FrozenSet[str]]] = None
+        # (monotonic time, material names) from the last blender-list-materials, kept current by create-material
+        self._material_names: Optional[Tuple[float, List[str]]] = None
+        # objects whose bmesh a keep=True mesh edit left open on the bridge side
+        self._open_meshes: Set[str] = set()
+        self._commit_meshes_at_exit = False
+        self._register_defaults()
+        self._tool_request_store = ToolRequestStore()
+
+    def _register(
+        self, name: str, description: str, input_schema: Dict[str, Any], handler: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> None:
+        if not _valid_tool_name(name):
+            raise ValueError(f"Invalid tool name: {name}")
+        name = sys.intern(name)
+        input_schema = _intern_schema(input_schema)
+        self._tools[name] = Tool(name=name, description=description, input_schema=input_schema, handler=handler)
+        self._handlers[name] = handler
+        if name not in _INTENT_TOOLS:
+            self._intent_targets.add(name)
+        self._list_tools_cache = None
+
+    def _register_table(self, table: Tuple[Tuple[str, str, Dict[str, Any], str], ...]) -> None:
+        # (name, description, input_schema, handler method name) rows, registered in order
+        for name, description, input_schema, handler_name in table:
+            self._register(name, description, input_schema, getattr(self, handler_name))
+
+    def _register_defaults(self) -> None:
+        register_all(self, _bridge_request, _make_tool_result, ToolError)
+        self._register_table(self._ADMIN_TOOLS)
 
     def list_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {"name": tool.name, "description": tool.description, "inputSchema": tool.input_schema}
-            for tool in self._tools.values()
-        ]
+        # The returned list is shared between calls; treat it as read-only.
+        if self._list_tools_cache is None:
+            self._list_tools_cache = [
+                {"name": tool.name, "description": tool.description, "inputSchema": tool.input_schema}
+                for tool in self._tools.values()
+            ]
+        return self._list_tools_cache
 
     def call_tool(self, name: str, arguments: Dict[str, Any], *, log_action: bool = True) -> Dict[str, Any]:
         if not isinstance(name, str):
-            raise ToolError("Invalid tool name", code=-32602)
-        if name not in self._tools:
+            # reset the traceback so the shared instance doesn't accumulate frames across raises
+            raise _ERR_INVALID_NAME.with_traceback(None)
+        handler = self._handlers.get(name)
+        if handler is None:
             raise ToolError(f"Unknown tool: {name}", code=-32601)
-        tool = self._tools[name]
+        if self._open_meshes and name not in _MESH_SESSION_TOOLS:
+            # everything else reads or writes obj.data, so pending bmesh edits land first
+            self._commit_meshes()
+        args = arguments or {}
+        if name in _REPEAT_TOOLS:
+            last = self._last_repeat.get(name)
+            if last is not None and last[0] == args and time.monotonic() - last[1] < _REPEAT_TTL_S:
+                # identical repeat of an idempotent call: same outcome, no bridge round trip
+                if log_action:
+                    _append_action(name, args, last[2])
+                return last[2]
+            if name in _REPEAT_SETTER_TOOLS:
+                self._last_repeat.clear()
+        elif self._last_repeat:
+            self._last_repeat.clear()
+        if self._last_xform and name not in _TRANSFORM_KEEPING_TOOLS:
+            # any other tool may move/delete/rename objects, so remembered transforms are no longer trusted
+            self._last_xform.clear()
+        if self._object_names is not None and name not in _NAME_PRESERVING_TOOLS:
+            self._object_names = None
+        if self._material_names is not None and name not in _MATERIAL_PRESERVING_TOOLS:
+            self._material_names = None
         result: Dict[str, Any]
         try:
-            result = tool.handler(arguments or {})
+            result = handler(args)
             if isinstance(result, dict) and "ok" not in result and "isError" in result:
                 result = {**result, "ok": not bool(result.get("isError"))}
             if not isinstance(result, dict):
@@ -779,15 +2714,17 @@ class ToolRegistry:
                 raise ToolError("Tool handler must include ok boolean", code=-32099)
         except ToolError as exc:
             result = {"ok": False, "content": [{"type": "text", "text": str(exc)}], "isError": True}
-        if log_action and name not in ("replay-list", "replay-run", "model-start", "model-step", "model-end", "tool-request"):
-            _append_action(name, arguments or {}, result)
+        if result["ok"] and name in _REPEAT_TOOLS:
+            self._last_repeat[name] = (dict(args), time.monotonic(), result)
+        if log_action and name not in _UNLOGGED_TOOLS:
+            _append_action(name, args, result)
         return result
 
     def _tool_health(self, _: Dict[str, Any]) -> Dict[str, Any]:
         return _make_tool_result(f"ok (server {SERVER_VERSION})")
 
     def _tool_blender_ping(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        data = _bridge_request("/ping")
+        data = _bridge_get("/ping")
         ok = bool(data.get("ok", True))
         blender_info = data.get("blender") or "unknown"
         if not ok:
@@ -795,7 +2732,7 @@ class ToolRegistry:
         return _make_tool_result(f"blender: {blender_info}")
 
     def _tool_blender_snapshot(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        data = _bridge_request("/snapshot", timeout=2.0)
+        data = _bridge_get("/snapshot", timeout=2.0)
         scene = data.get("scene") or data.get("file") or "unknown"
         objects = data.get("objects") or []
         count = len(objects) if isinstance(objects, list) else 0
@@ -816,24 +2753,71 @@ class ToolRegistry:
             return _make_tool_result(data.get("error") or "Execution failed", is_error=True)
         return _make_tool_result("execution ok")
 
-    def _tool_add_cube(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        code = """
-import bpy, bmesh
-mesh = bpy.data.meshes.new("Cube")
-bm = bmesh.new()
-bmesh.ops.create_cube(bm, size=2.0)
-bm.to_mesh(mesh)
-bm.free()
-obj = bpy.data.objects.new("Cube", mesh)
-scene = bpy.context.scene
-scene.collection.objects.link(obj)
-obj.location = (0.0, 0.0, 0.0)
-bpy.context.view_layer.objects.active = obj
-"""
+    # primitive kind -> code builder returning (exec code, success message)
+    _PRIMITIVE_BUILDERS = {
+        "cube": "_cube_code",
+        "cylinder": "_cylinder_code",
+        "sphere": "_sphere_code",
+        "plane": "_plane_code",
+        "cone": "_cone_code",
+        "torus": "_torus_code",
+    }
+    _SCENE_BATCH_MAX_OPS = 50
+
+    def _run_primitive(self, kind: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        code, message = getattr(self, self._PRIMITIVE_BUILDERS[kind])(args)
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        if not data.get("ok"):
+            return _make_tool_result(data.get("error") or f"Failed to add {kind}", is_error=True)
+        return _make_tool_result(message, is_error=False)
+
+    def _tool_scene_batch(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        ops = args.get("ops")
+        if not isinstance(ops, list) or not ops:
+            raise ToolError("ops must be a non-empty array", code=-32602)
+        if len(ops) > self._SCENE_BATCH_MAX_OPS:
+            raise ToolError(f"ops must contain at most {self._SCENE_BATCH_MAX_OPS} entries", code=-32602)
+        fragments: List[str] = []
+        messages: List[str] = []
+        kinds: List[str] = []
+        # validate everything up front so a bad op never leaves a half-built scene
+        for idx, op in enumerate(ops):
+            if not isinstance(op, dict):
+                raise ToolError(f"ops[{idx}] must be an object", code=-32602)
+            kind = op.get("primitive")
+            if kind not in self._PRIMITIVE_BUILDERS:
+                allowed = ", ".join(self._PRIMITIVE_BUILDERS)
+                raise ToolError(f"ops[{idx}].primitive must be one of {allowed}", code=-32602)
+            op_args = op.get("arguments") or {}
+            if not isinstance(op_args, dict):
+                raise ToolError(f"ops[{idx}].arguments must be an object", code=-32602)
+            try:
+                code, message = getattr(self, self._PRIMITIVE_BUILDERS[kind])(op_args)
+            except ToolError as exc:
+                raise ToolError(f"ops[{idx}]: {exc}", code=exc.code) from exc
+            fragments.append(code)
+            messages.append(message)
+            kinds.append(kind)
+        statuses = _batch_exec(fragments, timeout=min(5.0 * len(fragments), 30.0))
+        results = []
+        for kind, message, status in zip(kinds, messages, statuses):
+            entry: Dict[str, Any] = {"primitive": kind, "ok": bool(status.get("ok"))}
+            if entry["ok"]:
+                entry["message"] = message
+            else:
+                entry["error"] = status.get("error") or f"Failed to add {kind}"
+            results.append(entry)
+        failed = sum(1 for entry in results if not entry["ok"])
+        return _make_tool_result(json.dumps({"results": results, "failed": failed}), is_error=failed > 0)
+
+    def _tool_add_cube(self, _: Dict[str, Any]) -> Dict[str, Any]:
+        data = _bridge_call("add_cube", dict(_ADD_CUBE_ARGS))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to add cube", is_error=True)
-        return _make_tool_result("Added cube at origin")
+        return _make_tool_result("Added cube at origin", is_error=False)
+
+    def _cube_code(self, _: Dict[str, Any]) -> Tuple[str, str]:
+        return _CUBE_CODE, "Added cube at origin"
 
     def _tool_move_object(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
@@ -844,15 +2828,7 @@ bpy.context.view_layer.objects.active = obj
             xf, yf, zf = float(x), float(y), float(z)
         except (TypeError, ValueError):
             raise ToolError("x, y, z must be numbers", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-obj.location = ({xf}, {yf}, {zf})
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._transform_call("move_object", {"name": name, "location": [xf, yf, zf]})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to move object", is_error=True)
         return _make_tool_result(f"Moved {name} to ({xf}, {yf}, {zf})")
@@ -861,46 +2837,57 @@ obj.location = ({xf}, {yf}, {zf})
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-bpy.data.objects.remove(obj, do_unlink=True)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("delete_object", {"name": name})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to delete object", is_error=True)
         return _make_tool_result(f"Deleted object {name}")
 
     def _tool_macro_blockout(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        code = """
-import bpy, bmesh
-name = "BlockoutCube"
-existing = bpy.data.objects.get(name)
-if existing:
-    bpy.data.objects.remove(existing, do_unlink=True)
-mesh = bpy.data.meshes.new(name)
-bm = bmesh.new()
-bmesh.ops.create_cube(bm, size=2.0)
-bm.to_mesh(mesh)
-bm.free()
-obj = bpy.data.objects.new(name, mesh)
-scene = bpy.context.scene
-scene.collection.objects.link(obj)
-obj.scale = (2.0, 1.0, 1.0)
-obj.location = (0.0, 0.0, 0.0)
-bpy.context.view_layer.objects.active = obj
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("add_cube", dict(_BLOCKOUT_ARGS))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to create blockout", is_error=True)
         return _make_tool_result("Blockout cube created, scaled to (2,1,1) at origin")
 
+    def _tool_macro_scene(self, _: Dict[str, Any]) -> Dict[str, Any]:
+        # the three parts don't depend on each other, so their round-trips overlap
+        steps = (
+            ("cube", lambda: _bridge_call("add_cube", dict(_ADD_CUBE_ARGS))),
+            ("camera", lambda: _bridge_call("add_camera", dict(_MACRO_SCENE_CAMERA))),
+            ("light", lambda: _bridge_call("add_light", dict(_MACRO_SCENE_LIGHT))),
+        )
+        results = _bridge_parallel([call for _, call in steps])
+        failed = [
+            f"{label}: {res.get('error') or 'failed'}" for (label, _), res in zip(steps, results) if not res.get("ok")
+        ]
+        if failed:
+            return _make_tool_result("; ".join(failed), is_error=True)
+        return _make_tool_result("Scene created: cube at origin, camera, sun light")
+
+    def _transform_call(self, fn: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        key = (fn, args["name"])
+        now = time.monotonic()
+        last = self._last_xform.get(key)
+        if last is not None and last[0] == args and now - last[1] < _TRANSFORM_NOOP_TTL_S:
+            return {"ok": True}  # same value we just set: nothing to send
+        # BLENDER_MCP_COALESCE_MS > 0: queue the transform and report success; the debounced batch is sent later.
+        coalescer = _get_transform_coalescer()
+        if coalescer is None:
+            data = _bridge_call(fn, args)
+        else:
+            coalescer.push(fn, args)
+            data = {"ok": True}
+        if data.get("ok"):
+            self._last_xform[key] = (args, now)
+        else:
+            self._last_xform.pop(key, None)
+        return data
+
     def _validate_vector(self, value: Any, *, name: str) -> Optional[List[float]]:
         if value is None:
             return None
+        if type(value) is list and len(value) == 3 and all(type(v) is float for v in value):
+            # already [float, float, float]: hand it back as-is (callers never mutate the result)
+            return value
         if not isinstance(value, list) or len(value) != 3:
             raise ToolError(f"{name} must be an array of 3 numbers", code=-32602)
         out: List[float] = []
@@ -912,6 +2899,9 @@ bpy.context.view_layer.objects.active = obj
         return out
 
     def _tool_add_cylinder(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run_primitive("cylinder", args)
+
+    def _cylinder_code(self, args: Dict[str, Any]) -> Tuple[str, str]:
         vertices = args.get("vertices", 16)
         radius = args.get("radius", 1.0)
         depth = args.get("depth", 2.0)
@@ -951,26 +2941,14 @@ bpy.context.view_layer.objects.active = obj
             raise ToolError("radius and depth must be numbers", code=-32602)
         if name is not None and not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-import bmesh
-mesh = bpy.data.meshes.new("Cylinder")
-bm = bmesh.new()
-bmesh.ops.create_circle(bm, segments={vertices_i}, radius={radius_f}, cap_ends=True)
-bmesh.ops.extrude_edge_only(bm, edges=bm.edges)
-bmesh.ops.translate(bm, verts=[v for v in bm.verts if v.co.z > 0], vec=(0,0,{depth_f}))
-bm.to_mesh(mesh)
-bm.free()
-obj = bpy.data.objects.new({json.dumps(name or "Cylinder")}, mesh)
-scene = bpy.context.scene
-scene.collection.objects.link(obj)
-obj.location = ({location[0]}, {location[1]}, {location[2]})
-bpy.context.view_layer.objects.active = obj
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to add cylinder", is_error=True)
-        return _make_tool_result("Added cylinder", is_error=False)
+        code = _CYLINDER_TPL.format(
+            location=_fmt_vec(location),
+            vertices_i=vertices_i,
+            radius_f=radius_f,
+            depth_f=depth_f,
+            name=_code_literal(name or "Cylinder"),
+        )
+        return code, "Added cylinder"
 
     def _tool_scale_object(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
@@ -989,15 +2967,7 @@ bpy.context.view_layer.objects.active = obj
             vec = self._validate_vector(scale, name="scale")
         if vec is None:
             raise ToolError("provide uniform or scale", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-obj.scale = ({vec[0]}, {vec[1]}, {vec[2]})
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._transform_call("scale_object", {"name": name, "scale": vec})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to scale object", is_error=True)
         return _make_tool_result(f"Scaled {name} to {tuple(vec)}", is_error=False)
@@ -1011,25 +2981,15 @@ obj.scale = ({vec[0]}, {vec[1]}, {vec[2]})
         rot_vec = self._validate_vector(rotation, name="rotation")
         if space not in ("world", "local"):
             raise ToolError("space must be 'world' or 'local'", code=-32602)
-        code = f"""
-import bpy, math
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-rx, ry, rz = ({rot_vec[0]}, {rot_vec[1]}, {rot_vec[2]})
-rad = (math.radians(rx), math.radians(ry), math.radians(rz))
-if {json.dumps(space)} == "world":
-    obj.rotation_euler = rad
-else:
-    obj.rotation_euler = rad
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._transform_call("rotate_object", {"name": name, "rotation": rot_vec, "space": space})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to rotate object", is_error=True)
         return _make_tool_result(f"Rotated {name} to {tuple(rot_vec)} deg ({space})", is_error=False)
 
     def _tool_add_sphere(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run_primitive("sphere", args)
+
+    def _sphere_code(self, args: Dict[str, Any]) -> Tuple[str, str]:
         sphere_type = args.get("type", "uv")
         segments = args.get("segments", 32)
         rings = args.get("rings", 16)
@@ -1063,31 +3023,30 @@ else:
                 ring_i = int(rings)
             except Exception:
                 raise ToolError("segments and rings must be integers", code=-32602)
-            code = f"""
-import bpy
-bpy.ops.mesh.primitive_uv_sphere_add(radius={radius_f}, segments={seg_i}, ring_count={ring_i}, location=({location[0]}, {location[1]}, {location[2]}))
-obj = bpy.context.active_object
-if obj is not None:
-    obj.name = {json.dumps(name)}
-"""
+            code = _UV_SPHERE_TPL.format(
+                location=_fmt_vec(location),
+                radius_f=radius_f,
+                seg_i=seg_i,
+                ring_i=ring_i,
+                name=_code_literal(name),
+            )
         else:
             try:
                 sub_i = int(subdivisions)
             except Exception:
                 raise ToolError("subdivisions must be an integer", code=-32602)
-            code = f"""
-import bpy
-bpy.ops.mesh.primitive_ico_sphere_add(radius={radius_f}, subdivisions={sub_i}, location=({location[0]}, {location[1]}, {location[2]}))
-obj = bpy.context.active_object
-if obj is not None:
-    obj.name = {json.dumps(name)}
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to add sphere", is_error=True)
-        return _make_tool_result(f"Added {sphere_type} sphere", is_error=False)
+            code = _ICO_SPHERE_TPL.format(
+                location=_fmt_vec(location),
+                radius_f=radius_f,
+                sub_i=sub_i,
+                name=_code_literal(name),
+            )
+        return code, f"Added {sphere_type} sphere"
 
     def _tool_add_plane(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run_primitive("plane", args)
+
+    def _plane_code(self, args: Dict[str, Any]) -> Tuple[str, str]:
         size = args.get("size", 2.0)
         location = self._validate_vector(args.get("location"), name="location") or [0.0, 0.0, 0.0]
         name = args.get("name") or "Plane"
@@ -1095,25 +3054,13 @@ if obj is not None:
             size_f = float(size)
         except Exception:
             raise ToolError("size must be a number", code=-32602)
-        code = f"""
-import bpy, bmesh
-mesh = bpy.data.meshes.new("Plane")
-bm = bmesh.new()
-bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size={size_f})
-bm.to_mesh(mesh)
-bm.free()
-obj = bpy.data.objects.new({json.dumps(name)}, mesh)
-scene = bpy.context.scene
-scene.collection.objects.link(obj)
-obj.location = ({location[0]}, {location[1]}, {location[2]})
-bpy.context.view_layer.objects.active = obj
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to add plane", is_error=True)
-        return _make_tool_result("Added plane", is_error=False)
+        code = _PLANE_TPL.format(location=_fmt_vec(location), size_f=size_f, name=_code_literal(name))
+        return code, "Added plane"
 
     def _tool_add_cone(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run_primitive("cone", args)
+
+    def _cone_code(self, args: Dict[str, Any]) -> Tuple[str, str]:
         vertices = args.get("vertices", 32)
         radius1 = args.get("radius1", 1.0)
         radius2 = args.get("radius2", 0.0)
@@ -1130,25 +3077,20 @@ bpy.context.view_layer.objects.active = obj
             d = float(depth)
         except Exception:
             raise ToolError("radius1, radius2, depth must be numbers", code=-32602)
-        code = f"""
-import bpy, bmesh
-mesh = bpy.data.meshes.new("Cone")
-bm = bmesh.new()
-bmesh.ops.create_cone(bm, segments={vertices_i}, radius1={r1}, radius2={r2}, depth={d})
-bm.to_mesh(mesh)
-bm.free()
-obj = bpy.data.objects.new({json.dumps(name)}, mesh)
-scene = bpy.context.scene
-scene.collection.objects.link(obj)
-obj.location = ({location[0]}, {location[1]}, {location[2]})
-bpy.context.view_layer.objects.active = obj
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to add cone", is_error=True)
-        return _make_tool_result("Added cone", is_error=False)
+        code = _CONE_TPL.format(
+            location=_fmt_vec(location),
+            vertices_i=vertices_i,
+            r1=r1,
+            r2=r2,
+            d=d,
+            name=_code_literal(name),
+        )
+        return code, "Added cone"
 
     def _tool_add_torus(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run_primitive("torus", args)
+
+    def _torus_code(self, args: Dict[str, Any]) -> Tuple[str, str]:
         major_radius = args.get("major_radius", 1.0)
         minor_radius = args.get("minor_radius", 0.25)
         major_segments = args.get("major_segments", 24)
@@ -1165,17 +3107,15 @@ bpy.context.view_layer.objects.active = obj
             min_seg = int(minor_segments)
         except Exception:
             raise ToolError("major_segments and minor_segments must be integers", code=-32602)
-        code = f"""
-import bpy
-bpy.ops.mesh.primitive_torus_add(major_radius={maj_r}, minor_radius={min_r}, major_segments={maj_seg}, minor_segments={min_seg}, location=({location[0]}, {location[1]}, {location[2]}))
-obj = bpy.context.active_object
-if obj is not None:
-    obj.name = {json.dumps(name)}
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to add torus", is_error=True)
-        return _make_tool_result("Added torus", is_error=False)
+        code = _TORUS_TPL.format(
+            location=_fmt_vec(location),
+            maj_r=maj_r,
+            min_r=min_r,
+            maj_seg=maj_seg,
+            min_seg=min_seg,
+            name=_code_literal(name),
+        )
+        return code, "Added torus"
 
     def _tool_create_empty(self, args: Dict[str, Any]) -> Dict[str, Any]:
         empty_type = (args.get("type") or "PLAIN_AXES").upper()
@@ -1194,8 +3134,8 @@ if obj is not None:
             raise ToolError("size must be > 0", code=-32602)
         code = f"""
 import bpy, math
-etype = {json.dumps(empty_type)}
-name = {json.dumps(name)}
+etype = {_code_literal(empty_type)}
+name = {_code_literal(name)}
 loc = ({location[0]}, {location[1]}, {location[2]})
 rot = ({rotation[0]}, {rotation[1]}, {rotation[2]})
 obj = bpy.data.objects.new(name, None)
@@ -1243,8 +3183,8 @@ result = {{
             raise ToolError("resolution must be an integer", code=-32602)
         code = f"""
 import bpy, math
-curve_type = {json.dumps(curve_type)}
-name = {json.dumps(name)}
+curve_type = {_code_literal(curve_type)}
+name = {_code_literal(name)}
 radius = {radius_f}
 res_u = {res_i}
 loc = ({location[0]}, {location[1]}, {location[2]})
@@ -1304,74 +3244,68 @@ result = {{
         if new_name is not None and not isinstance(new_name, str):
             raise ToolError("new_name must be a string", code=-32602)
         target_name = new_name or f"{name}_copy"
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-new_name = {json.dumps(target_name)}
-offset = ({offset[0]}, {offset[1]}, {offset[2]})
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-dup = obj.copy()
-dup.data = obj.data.copy()
-dup.name = new_name
-dup.location = (obj.location.x + offset[0], obj.location.y + offset[1], obj.location.z + offset[2])
-obj.users_collection[0].objects.link(dup)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("duplicate_object", {"name": name, "new_name": target_name, "offset": offset})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to duplicate object", is_error=True)
         return _make_tool_result(f"Duplicated {name} -> {target_name}", is_error=False)
 
     def _tool_list_objects(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        code = """
-import bpy
-result = []
-for obj in bpy.data.objects:
-    result.append({"name": obj.name, "type": obj.type})
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_request("/exec", payload={"code": _LIST_OBJECTS_CODE}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to list objects", is_error=True)
         items = data.get("result") or []
         if isinstance(items, list):
-            names = [f"{item.get('name')} ({item.get('type')})" for item in items if isinstance(item, dict)]
+            items = [item for item in items if isinstance(item, dict)]
+            self._object_names = (time.monotonic(), frozenset(item.get("name") for item in items))
+            names = [f"{item.get('name')} ({item.get('type')})" for item in items]
             text = ", ".join(names) if names else "no objects"
         else:
             text = "listed objects"
         return _make_tool_result(text, is_error=False)
 
+    def _known_missing(self, *names: str) -> Optional[str]:
+        # first of names absent from a fresh object listing; None when there is no listing to trust
+        listing = self._object_names
+        if listing is None or time.monotonic() - listing[0] >= _OBJECT_NAMES_TTL_S:
+            return None
+        return next((name for name in names if name not in listing[1]), None)
+
+    @staticmethod
+    def _format_object_info(info: Dict[str, Any]) -> str:
+        mat_list = info.get("materials") or []
+        mats = ", ".join(mat_list) if isinstance(mat_list, list) else ""
+        return (
+            f"{info.get('name')} loc={info.get('location')} rot(deg)={info.get('rotation')} "
+            f"scale={info.get('scale')} materials={mats}"
+        )
+
+    def _tool_list_objects_full(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        obj_type = args.get("type")
+        name_contains = args.get("name_contains")
+        if obj_type is not None and not isinstance(obj_type, str):
+            raise ToolError("type must be a string", code=-32602)
+        if name_contains is not None and not isinstance(name_contains, str):
+            raise ToolError("name_contains must be a string", code=-32602)
+        fn_args = {"type": obj_type.upper() if obj_type else None, "name_contains": name_contains or None}
+        data = _bridge_call("list_objects_info", fn_args)
+        if not data.get("ok"):
+            return _make_tool_result(data.get("error") or "Failed to list objects", is_error=True)
+        items = data.get("result") or []
+        if not isinstance(items, list):
+            return _make_tool_result("listed objects", is_error=False)
+        lines = [self._format_object_info(item) for item in items if isinstance(item, dict)]
+        return _make_tool_result("\n".join(lines) if lines else "no objects", is_error=False)
+
     def _tool_get_object_info(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-import math
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-result = {{
-    "name": obj.name,
-    "type": obj.type,
-    "location": [obj.location.x, obj.location.y, obj.location.z],
-    "rotation": [math.degrees(v) for v in obj.rotation_euler],
-    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-    "materials": [m.name for m in obj.data.materials] if hasattr(obj.data, "materials") else [],
-}}
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("get_object_info", {"name": name})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to get object info", is_error=True)
         info = data.get("result")
         if isinstance(info, dict):
-            mat_list = info.get("materials") or []
-            mats = ", ".join(mat_list) if isinstance(mat_list, list) else ""
-            text = (
-                f"{info.get('name')} loc={info.get('location')} rot(deg)={info.get('rotation')} "
-                f"scale={info.get('scale')} materials={mats}"
-            )
+            text = self._format_object_info(info)
         else:
             text = f"Fetched info for {name}"
         return _make_tool_result(text, is_error=False)
@@ -1393,25 +3327,7 @@ result = {{
             selected.extend(names)
         if not selected:
             raise ToolError("provide name or names", code=-32602)
-        code = f"""
-import bpy
-names = {json.dumps(selected)}
-bpy.ops.object.select_all(action='DESELECT')
-found = []
-missing = []
-for nm in names:
-    obj = bpy.data.objects.get(nm)
-    if obj is None:
-        missing.append(nm)
-        continue
-    obj.select_set(True)
-    found.append(nm)
-if missing:
-    raise ValueError(f"Objects not found: {{', '.join(missing)}}")
-if found:
-    bpy.context.view_layer.objects.active = bpy.data.objects.get(found[0])
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("select_objects", {"names": selected})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to select objects", is_error=True)
         return _make_tool_result(f"Selected: {', '.join(selected)}", is_error=False)
@@ -1422,16 +3338,7 @@ if found:
         name = args.get("name") or "Camera"
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy, math
-cam_data = bpy.data.cameras.new({json.dumps(name)})
-cam_obj = bpy.data.objects.new({json.dumps(name)}, cam_data)
-scene = bpy.context.scene
-scene.collection.objects.link(cam_obj)
-cam_obj.location = ({location[0]}, {location[1]}, {location[2]})
-cam_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[1]}), math.radians({rotation[2]}))
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("add_camera", {"name": name, "location": location, "rotation": rotation})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to add camera", is_error=True)
         return _make_tool_result(f"Added camera {name}", is_error=False)
@@ -1451,33 +3358,82 @@ cam_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[1]
             power_val = float(power)
         except Exception:
             raise ToolError("power must be a number", code=-32602)
-        code = f"""
-import bpy, math
-light_data = bpy.data.lights.new(name={json.dumps(name)}, type={json.dumps(light_type)})
-light_data.energy = {power_val}
-light_obj = bpy.data.objects.new(name={json.dumps(name)}, object_data=light_data)
-scene = bpy.context.scene
-scene.collection.objects.link(light_obj)
-light_obj.location = ({location[0]}, {location[1]}, {location[2]})
-light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[1]}), math.radians({rotation[2]}))
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        light_args = {
+            "name": name,
+            "light_type": light_type,
+            "power": power_val,
+            "location": location,
+            "rotation": rotation,
+        }
+        data = _bridge_call("add_light", light_args)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to add light", is_error=True)
         return _make_tool_result(f"Added light {name} ({light_type.lower()})", is_error=False)
 
     def _read_actions(self) -> List[Dict[str, Any]]:
-        if not RUNS_FILE.exists():
+        """Parsed runs log, shared between calls (read-only); only bytes appended since the last call are parsed."""
+        _flush_logs()
+        runs_file = _log_path(RUNS_FILE)
+        try:
+            st = os.stat(runs_file)
+        except FileNotFoundError:
+            self._actions_cache = (None, 0, [])
+            self._actions_by_id = {}
+            return []
+        try:
+            key = (os.fspath(runs_file), st.st_ino, st.st_mtime_ns, st.st_size)
+            cached_key, offset, actions = self._actions_cache
+            if key == cached_key:
+                return actions
+            if cached_key is None or cached_key[:2] != key[:2] or st.st_size < offset:
+                # new, replaced (tmp-copy fallback) or truncated file: start over
+                offset, actions = 0, []
+                self._actions_by_id = {}
+            if runs_file.suffix == ".gz":
+                with open(runs_file, "rb") as fh:
+                    fh.seek(offset)
+                    chunk = fh.read(st.st_size - offset)
+                # appends are whole gzip members, so a suffix starting at a previous end-of-file decodes on its own
+                parsed = _parse_jsonl(gzip.decompress(chunk)) if chunk else []
+                consumed = len(chunk)
+            elif st.st_size > offset:
+                # map the file and parse line slices of the new suffix: no whole-file bytes/str copy
+                with open(runs_file, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size = min(st.st_size, len(mm))
+                    # leave a trailing partial line (append in progress) for the next read
+                    last_nl = mm.rfind(b"\n", offset, size)
+                    consumed = last_nl + 1 - offset if last_nl >= 0 else 0
+                    parsed = _parse_jsonl(mm, offset, offset + consumed)
+            else:
+                parsed, consumed = [], 0
+            actions.extend(parsed)
+            by_id = self._actions_by_id
+            for action in parsed:
+                action_id = action.get("id") if isinstance(action, dict) else None
+                if isinstance(action_id, str):
+                    by_id.setdefault(action_id, action)
+            self._actions_cache = (key, offset + consumed, actions)
+            return actions
+        except Exception as exc:  # noqa: BLE001
+            self._actions_cache = (None, 0, [])
+            self._actions_by_id = {}
+            try:
+                sys.stderr.write(f"[replay] failed to read actions: {exc}\n")
+                sys.stderr.flush()
+            except Exception:
+                pass
             return []
+
+    def _read_actions_tail(self, n: int) -> List[Dict[str, Any]]:
+        # A warm cache is topped up incrementally by _read_actions; a cold one on a plain log reads just the tail.
+        runs_file = _log_path(RUNS_FILE)
+        if self._actions_cache[0] is not None or runs_file.suffix == ".gz":
+            return self._read_actions()[-n:]
+        _flush_logs()
         try:
-            lines = RUNS_FILE.read_text(encoding="utf-8").splitlines()
-            actions: List[Dict[str, Any]] = []
-            for line in lines:
-                try:
-                    actions.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-            return actions
+            return _tail_jsonl(runs_file, n)
+        except FileNotFoundError:
+            return []
         except Exception as exc:  # noqa: BLE001
             try:
                 sys.stderr.write(f"[replay] failed to read actions: {exc}\n")
@@ -1494,8 +3450,7 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             limit_val = 50
         if limit_val <= 0:
             limit_val = 50
-        actions = self._read_actions()
-        slice_actions = actions[-limit_val:] if actions else []
+        slice_actions = self._read_actions_tail(limit_val)
         lines = []
         for action in reversed(slice_actions):
             lines.append(
@@ -1509,19 +3464,15 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
         action_id = args.get("id")
         if not isinstance(action_id, str):
             return _make_tool_result("id must be a string", is_error=True)
-        actions = self._read_actions()
-        target = None
-        for action in actions:
-            if action.get("id") == action_id:
-                target = action
-                break
+        self._read_actions()
+        target = self._actions_by_id.get(action_id)
         if target is None:
             return _make_tool_result("action id not found", is_error=True)
         tool = target.get("tool")
         arguments = target.get("arguments") or {}
         if not isinstance(arguments, dict):
             return _make_tool_result("invalid stored arguments", is_error=True)
-        if tool not in self._tools:
+        if tool not in self._handlers:
             return _make_tool_result("stored tool unavailable", is_error=True)
         return self.call_tool(tool, arguments)
 
@@ -1532,15 +3483,8 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             return _make_tool_result("goal must be a string", is_error=True)
         if constraints is not None and not isinstance(constraints, str):
             return _make_tool_result("constraints must be a string", is_error=True)
-        session_id = str(uuid.uuid4())
-        entry = {
-            "id": str(uuid.uuid4()),
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "type": "model-start",
-            "session": session_id,
-            "payload": {"goal": goal, "constraints": constraints},
-        }
-        _append_request(entry)
+        session_id = _fast_uuid()
+        _append_request(_new_request_entry("model-start", session_id, {"goal": goal, "constraints": constraints}))
         return _make_tool_result(f"session: {session_id}", is_error=False)
 
     def _tool_model_step(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -1559,19 +3503,8 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             return _make_tool_result("proposed_args must be an object", is_error=True)
         if notes is not None and not isinstance(notes, str):
             return _make_tool_result("notes must be a string", is_error=True)
-        entry = {
-            "id": str(uuid.uuid4()),
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "type": "model-step",
-            "session": session,
-            "payload": {
-                "intent": intent,
-                "proposed_tool": proposed_tool,
-                "proposed_args": proposed_args,
-                "notes": notes,
-            },
-        }
-        _append_request(entry)
+        payload = {"intent": intent, "proposed_tool": proposed_tool, "proposed_args": proposed_args, "notes": notes}
+        _append_request(_new_request_entry("model-step", session, payload))
         return _make_tool_result("model step recorded", is_error=False)
 
     def _tool_model_end(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -1581,14 +3514,7 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             return _make_tool_result("session must be a string", is_error=True)
         if not isinstance(summary, str):
             return _make_tool_result("summary must be a string", is_error=True)
-        entry = {
-            "id": str(uuid.uuid4()),
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "type": "model-end",
-            "session": session,
-            "payload": {"summary": summary},
-        }
-        _append_request(entry)
+        _append_request(_new_request_entry("model-end", session, {"summary": summary}))
         return _make_tool_result("model session ended", is_error=False)
 
     def _tool_tool_requests_info(self, _: Dict[str, Any]) -> Dict[str, Any]:
@@ -1738,7 +3664,7 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
         if not isinstance(tests_passed, bool):
             return _make_tool_result("tests_passed must be a boolean", is_error=True)
         requests = list(self._tool_request_store.requests.values())
-        tool_names = set(self._tools.keys())
+        tool_names = self._handlers
         seen_keys: Dict[str, str] = {}
         duplicates = []
         for item in requests:
@@ -1764,28 +3690,40 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
     def _resolve_intent(self, text: str) -> Dict[str, Any]:
         if not isinstance(text, str):
             raise ToolError("text must be a string", code=-32602)
-        normalized = text.strip().lower()
+        stripped = text.strip()
+        normalized = stripped.lower()
         if not normalized:
             raise ToolError("text is empty", code=-32602)
 
-        def result(tool: str, arguments: Dict[str, Any], confidence: float, notes: str) -> Dict[str, Any]:
-            return {"tool": tool, "arguments": arguments, "confidence": confidence, "notes": notes}
+        # one regex pass finds every trigger; the highest-priority hit wins, as the old check order did
+        intent = None
+        best_rank = len(_INTENT_RANK)
+        for match in _INTENT_RE.finditer(normalized):
+            kind, prefix_only = _INTENT_TRIGGERS[match.group()]
+            if prefix_only and match.start() != 0:
+                continue
+            rank = _INTENT_RANK[kind]
+            if rank < best_rank:
+                intent, best_rank = kind, rank
+                if rank == 0:
+                    break
 
         # exec path, gated by env and prefix
-        if normalized.startswith("exec:"):
+        if intent == "exec":
             if not DEBUG_EXEC_ENABLED:
                 raise ToolError("debug exec disabled", code=-32602)
-            code = text[text.lower().find("exec:") + len("exec:") :].strip()
+            # the exec trigger only matches at position 0, so the code starts right after the prefix
+            code = stripped[len("exec:") :].strip()
             if not code:
                 raise ToolError("exec code missing", code=-32602)
-            return result("blender-exec", {"code": code}, 0.9, "explicit exec request")
+            return _intent_result("blender-exec", {"code": code}, 0.9, "explicit exec request")
 
-        cube_patterns = ("add cube", "ajoute un cube", "create cube")
-        if any(pat in normalized for pat in cube_patterns):
-            return result("blender-add-cube", {}, 0.9, "cube creation intent")
+        if intent == "add_cube":
+            return _intent_result("blender-add-cube", {}, 0.9, "cube creation intent")
 
-        if normalized.startswith("move cube") or normalized.startswith("deplace cube") or normalized.startswith("déplace cube"):
-            parts = normalized.split()
+        if intent == "move_cube":
+            # only the last three tokens matter; rsplit stops after them instead of splitting the whole text
+            parts = normalized.rsplit(None, 3)
             try:
                 numbers = [float(val) for val in parts[-3:]]
             except Exception:
@@ -1793,14 +3731,13 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             if len(numbers) != 3:
                 raise ToolError("move requires x y z numbers", code=-32602)
             x, y, z = numbers
-            return result("blender-move-object", {"name": "Cube", "x": x, "y": y, "z": z}, 0.8, "move cube intent")
+            return _intent_result("blender-move-object", {"name": "Cube", "x": x, "y": y, "z": z}, 0.8, "move cube intent")
 
-        delete_patterns = ("delete cube", "supprime cube", "remove cube")
-        if any(pat in normalized for pat in delete_patterns):
-            return result("blender-delete-object", {"name": "Cube"}, 0.8, "delete cube intent")
+        if intent == "delete_cube":
+            return _intent_result("blender-delete-object", {"name": "Cube"}, 0.8, "delete cube intent")
 
-        if "blockout" in normalized or "macro blockout" in normalized:
-            return result("macro-blockout", {}, 0.8, "blockout intent")
+        if intent == "blockout":
+            return _intent_result("macro-blockout", {}, 0.8, "blockout intent")
 
         raise ToolError("intent not recognized", code=-32602)
 
@@ -1817,7 +3754,7 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             return _make_tool_result(str(exc), is_error=True)
         tool = resolved.get("tool")
         arguments = resolved.get("arguments") or {}
-        if tool not in self._tools or tool in ("intent-run", "intent-resolve"):
+        if tool not in self._intent_targets:
             return _make_tool_result("resolved tool not available", is_error=True)
         try:
             return self.call_tool(tool, arguments)
@@ -1831,25 +3768,9 @@ light_obj.rotation_euler = (math.radians({rotation[0]}), math.radians({rotation[
             raise ToolError("objects must be a non-empty list", code=-32602)
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        for obj in objects:
-            if not isinstance(obj, str):
-                raise ToolError("all objects must be strings", code=-32602)
-        code = f"""
-import bpy
-objects = {json.dumps(objects)}
-name = {json.dumps(name)}
-bpy.ops.object.select_all(action='DESELECT')
-for obj_name in objects:
-    obj = bpy.data.objects.get(obj_name)
-    if obj is None:
-        raise ValueError(f"Object {{obj_name}} not found")
-    obj.select_set(True)
-if not bpy.context.selected_objects:
-    raise ValueError("No objects selected")
-bpy.context.view_layer.objects.active = bpy.context.selected_objects[0]
-bpy.ops.object.join()
-bpy.context.active_object.name = name
-"""
+        if not all(isinstance(obj, str) for obj in objects):
+            raise ToolError("all objects must be strings", code=-32602)
+        code = _JOIN_OBJECTS_TPL.format(objects=_code_literal(objects), name=_code_literal(name))
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to join objects", is_error=True)
@@ -1862,47 +3783,13 @@ bpy.context.active_object.name = name
             raise ToolError("name must be a string", code=-32602)
         if not isinstance(origin_type, str):
             raise ToolError("type must be a string", code=-32602)
-        valid_types = {
-            "geometry": "ORIGIN_GEOMETRY",
-            "cursor": "ORIGIN_CURSOR",
-            "mass_center": "ORIGIN_CENTER_OF_MASS",
-            "bottom_center": "BOTTOM_CENTER",
-        }
-        if origin_type not in valid_types:
-            raise ToolError(f"type must be one of {list(valid_types.keys())}", code=-32602)
+        blender_type = _ORIGIN_TYPES.get(origin_type)
+        if blender_type is None:
+            raise ToolError(f"type must be one of {list(_ORIGIN_TYPE_KEYS)}", code=-32602)
         if origin_type == "bottom_center":
-            code = f"""
-import bpy, mathutils
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-coords = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-if not coords:
-    raise ValueError("Object has no bounding box")
-xs = [c.x for c in coords]; ys = [c.y for c in coords]; zs = [c.z for c in coords]
-target = mathutils.Vector((sum(xs)/len(xs), sum(ys)/len(ys), min(zs)))
-cur = obj.matrix_world.to_translation()
-delta = target - cur
-if hasattr(obj.data, "transform"):
-    obj.data.transform(mathutils.Matrix.Translation(-obj.matrix_world.inverted() @ delta))
-    obj.location = obj.location + delta
-else:
-    raise ValueError("Object has no geometry to transform")
-"""
+            code = _SET_ORIGIN_BOTTOM_TPL.format(name=_code_literal(name))
         else:
-            blender_type = valid_types[origin_type]
-            code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-bpy.ops.object.origin_set(type={json.dumps(blender_type)})
-"""
+            code = _SET_ORIGIN_TPL.format(name=_code_literal(name), origin_type=_code_literal(blender_type))
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to set origin", is_error=True)
@@ -1921,17 +3808,7 @@ bpy.ops.object.origin_set(type={json.dumps(blender_type)})
             raise ToolError("rotation must be a boolean", code=-32602)
         if not isinstance(scale, bool):
             raise ToolError("scale must be a boolean", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError(f"Object {{name}} not found")
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-bpy.ops.object.transform_apply(location={location}, rotation={rotation}, scale={scale})
-"""
+        code = _APPLY_TRANSFORMS_TPL.format(name=_code_literal(name), location=location, rotation=rotation, scale=scale)
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to apply transforms", is_error=True)
@@ -1962,24 +3839,12 @@ bpy.ops.object.transform_apply(location={location}, rotation={rotation}, scale={
             raise ToolError("slot must be >= 0", code=-32602)
         if not isinstance(create_slot, bool):
             raise ToolError("create_slot must be a boolean", code=-32602)
-        code = f"""
-import bpy
-obj = bpy.data.objects.get({json.dumps(obj_name)})
-if obj is None:
-    raise ValueError("Object not found")
-mat = bpy.data.materials.get({json.dumps(mat_name)})
-if mat is None:
-    raise ValueError("Material not found")
-slot_index = {slot_index}
-create_slot = {create_slot}
-slots = obj.data.materials
-if slot_index >= len(slots):
-    if not create_slot:
-        raise ValueError("Material slot does not exist")
-    while len(slots) <= slot_index:
-        slots.append(None)
-slots[slot_index] = mat
-"""
+        code = _ASSIGN_MATERIAL_TPL.format(
+            obj_name=_code_literal(obj_name),
+            mat_name=_code_literal(mat_name),
+            slot_index=slot_index,
+            create_slot=create_slot,
+        )
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to assign material", is_error=True)
@@ -1998,9 +3863,10 @@ slots[slot_index] = mat
             raise ToolError("material must be a string", code=-32602)
         if not isinstance(image_path, str):
             raise ToolError("image_path must be a string", code=-32602)
-        valid_targets = {"BASE_COLOR", "ROUGHNESS", "NORMAL"}
-        if target not in valid_targets:
+        target_config = _IMAGE_TEXTURE_TARGETS.get(target)
+        if target_config is None:
             raise ToolError("target must be BASE_COLOR, ROUGHNESS, or NORMAL", code=-32602)
+        colorspace, bsdf_input = target_config
         if not isinstance(create_material, bool):
             raise ToolError("create_material must be a boolean", code=-32602)
         if not isinstance(create_slot, bool):
@@ -2008,10 +3874,10 @@ slots[slot_index] = mat
         code = f"""
 import bpy
 import os
-obj_name = {json.dumps(obj_name)}
-mat_name = {json.dumps(mat_name)}
-image_path = {json.dumps(image_path)}
-target = {json.dumps(target)}
+obj_name = {_code_literal(obj_name)}
+mat_name = {_code_literal(mat_name)}
+image_path = {_code_literal(image_path)}
+target = {_code_literal(target)}
 create_material = {create_material}
 create_slot = {create_slot}
 obj = bpy.data.objects.get(obj_name)
@@ -2026,20 +3892,27 @@ if mat is None:
 if not hasattr(obj.data, "materials"):
     raise ValueError("Object has no material slots")
 slots = obj.data.materials
-if mat.name not in [m.name for m in slots if m]:
+has_mat = False
+first_none = -1
+for i, existing in enumerate(slots):
+    if existing is None:
+        if first_none < 0:
+            first_none = i
+    elif existing.name == mat.name:
+        has_mat = True
+        break
+if not has_mat:
     if not slots:
         slots.append(mat)
     else:
         if create_slot:
             slots.append(None)
-        slots[0] = mat if not slots[0] else slots[0]
-        if mat not in slots:
-            for i, existing in enumerate(slots):
-                if existing is None:
-                    slots[i] = mat
-                    break
-            else:
-                slots.append(mat)
+            if first_none < 0:
+                first_none = len(slots) - 1
+        if first_none >= 0:
+            slots[first_none] = mat
+        else:
+            slots.append(mat)
 img = bpy.data.images.load(image_path, check_existing=True)
 if mat.node_tree is None:
     mat.use_nodes = True
@@ -2056,21 +3929,15 @@ tex_node.image = img
 tex_node.location = (-400, 0)
 bsdf.location = (-100, 0)
 output.location = (200, 0)
-if target == "BASE_COLOR":
-    if hasattr(tex_node, "image") and hasattr(tex_node.image, "colorspace_settings"):
-        tex_node.image.colorspace_settings.name = "sRGB"
-    links.new(tex_node.outputs.get("Color"), bsdf.inputs.get("Base Color"))
-elif target == "ROUGHNESS":
-    if hasattr(tex_node, "image") and hasattr(tex_node.image, "colorspace_settings"):
-        tex_node.image.colorspace_settings.name = "Non-Color"
-    links.new(tex_node.outputs.get("Color"), bsdf.inputs.get("Roughness"))
-elif target == "NORMAL":
-    if hasattr(tex_node, "image") and hasattr(tex_node.image, "colorspace_settings"):
-        tex_node.image.colorspace_settings.name = "Non-Color"
+if hasattr(tex_node.image, "colorspace_settings"):
+    tex_node.image.colorspace_settings.name = {_code_literal(colorspace)}
+if target != "NORMAL":
+    links.new(tex_node.outputs.get("Color"), bsdf.inputs.get({_code_literal(bsdf_input)}))
+else:
     normal_node = nodes.new(type='ShaderNodeNormalMap')
     normal_node.location = (-150, -200)
     links.new(tex_node.outputs.get("Color"), normal_node.inputs.get("Color"))
-    links.new(normal_node.outputs.get("Normal"), bsdf.inputs.get("Normal"))
+    links.new(normal_node.outputs.get("Normal"), bsdf.inputs.get({_code_literal(bsdf_input)}))
 if not any(link.to_node == output for link in links):
     links.new(bsdf.outputs.get("BSDF"), output.inputs.get("Surface"))
 """
@@ -2087,18 +3954,7 @@ if not any(link.to_node == output for link in links):
         if mode not in ("flat", "smooth"):
             raise ToolError("mode must be 'flat' or 'smooth'", code=-32602)
         use_smooth = mode == "smooth"
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if not hasattr(obj.data, "polygons"):
-    raise ValueError("Object has no polygons")
-for poly in obj.data.polygons:
-    poly.use_smooth = {use_smooth}
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("set_shading", {"name": name, "smooth": use_smooth})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to set shading", is_error=True)
         return _make_tool_result(f"Set shading of {name} to {mode}", is_error=False)
@@ -2107,12 +3963,7 @@ for poly in obj.data.polygons:
         confirm = args.get("confirm")
         if confirm != "DELETE_ALL":
             raise ToolError("confirm must equal 'DELETE_ALL'", code=-32602)
-        code = """
-import bpy
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_request("/exec", payload={"code": _DELETE_ALL_CODE}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to delete all", is_error=True)
         return _make_tool_result("Deleted all objects", is_error=False)
@@ -2125,28 +3976,7 @@ bpy.ops.object.delete(use_global=False)
             raise ToolError("name must be a string", code=-32602)
         if target not in valid_targets:
             raise ToolError("target must be MESH or CURVE", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-target = {json.dumps(target)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if target == "MESH" and obj.type not in {{"CURVE", "MESH", "FONT", "SURFACE", "TEXT"}}:
-    raise ValueError("Object cannot be converted to mesh")
-if target == "CURVE" and obj.type not in {{"MESH", "CURVE"}}:
-    raise ValueError("Object cannot be converted to curve")
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-bpy.ops.object.convert(target=target)
-new_obj = bpy.context.view_layer.objects.active or obj
-result = {{
-    "name": new_obj.name,
-    "type": new_obj.type,
-}}
-"""
+        code = _CONVERT_OBJECT_TPL.format(name=_code_literal(name), target=_code_literal(target))
         data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to convert object", is_error=True)
@@ -2194,37 +4024,7 @@ result = {{
         valid_targets = {"GRID", "CURSOR", "ACTIVE", "INCREMENT"}
         if target not in valid_targets:
             raise ToolError("target must be GRID, CURSOR, ACTIVE, or INCREMENT", code=-32602)
-        code = f"""
-import bpy, math
-name = {json.dumps(name)}
-target = {json.dumps(target)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-before = {{
-    "location": [obj.location.x, obj.location.y, obj.location.z],
-    "rotation": [math.degrees(v) for v in obj.rotation_euler],
-    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-}}
-new_loc = before["location"]
-if target in {{"GRID", "INCREMENT"}}:
-    new_loc = [round(obj.location.x), round(obj.location.y), round(obj.location.z)]
-elif target == "CURSOR":
-    cur = bpy.context.scene.cursor.location
-    new_loc = [cur.x, cur.y, cur.z]
-elif target == "ACTIVE":
-    active = bpy.context.view_layer.objects.active
-    if active is None:
-        raise ValueError("Active object required for ACTIVE snap")
-    new_loc = [active.location.x, active.location.y, active.location.z]
-obj.location = tuple(new_loc)
-after = {{
-    "location": [obj.location.x, obj.location.y, obj.location.z],
-    "rotation": [math.degrees(v) for v in obj.rotation_euler],
-    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-}}
-result = {{"before": before, "after": after, "target": target}}
-"""
+        code = _SNAP_TPL.format(name=_code_literal(name), target=_code_literal(target))
         data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to snap", is_error=True)
@@ -2234,17 +4034,7 @@ result = {{"before": before, "after": after, "target": target}}
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-obj.location = (0.0, 0.0, 0.0)
-obj.rotation_euler = (0.0, 0.0, 0.0)
-obj.scale = (1.0, 1.0, 1.0)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("reset_transform", {"name": name})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to reset transform", is_error=True)
         return _make_tool_result(f"Reset transforms for {name}", is_error=False)
@@ -2253,24 +4043,7 @@ obj.scale = (1.0, 1.0, 1.0)
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-mesh = obj.data
-mesh.calc_loop_triangles()
-result = {{
-    "verts": len(mesh.vertices),
-    "edges": len(mesh.edges),
-    "faces": len(mesh.polygons),
-    "triangles": len(mesh.loop_triangles),
-}}
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = _bridge_call("mesh_stats", {"name": name})
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to get mesh stats", is_error=True)
         info = data.get("result")
@@ -2280,273 +4053,197 @@ result = {{
             text = f"Mesh stats for {name}"
         return _make_tool_result(text, is_error=False)
 
+    def _mesh_op(self, op: Any, args: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        # validate one bmesh op for the bridge's mesh_ops; prefix locates the op inside a batch in error messages
+        if op == "extrude":
+            try:
+                dist = float(args.get("distance"))
+            except Exception:
+                raise ToolError(f"{prefix}distance must be a number", code=-32602)
+            return {"op": op, "args": {"distance": dist}}
+        if op == "inset":
+            try:
+                thickness_val = float(args.get("thickness"))
+            except Exception:
+                raise ToolError(f"{prefix}thickness must be a number", code=-32602)
+            return {"op": op, "args": {"thickness": thickness_val}}
+        if op == "loop_cut":
+            try:
+                cuts_i = int(args.get("cuts"))
+            except Exception:
+                raise ToolError(f"{prefix}cuts must be an integer", code=-32602)
+            if cuts_i < 1 or cuts_i > 20:
+                raise ToolError(f"{prefix}cuts must be between 1 and 20", code=-32602)
+            try:
+                pos_f = float(args.get("position", 0.5))
+            except Exception:
+                raise ToolError(f"{prefix}position must be a number", code=-32602)
+            if pos_f < 0.0 or pos_f > 1.0:
+                raise ToolError(f"{prefix}position must be between 0 and 1", code=-32602)
+            return {"op": op, "args": {"cuts": cuts_i, "position": pos_f}}
+        if op == "bevel":
+            try:
+                width_f = float(args.get("width"))
+            except Exception:
+                raise ToolError(f"{prefix}width must be a number", code=-32602)
+            if width_f <= 0:
+                raise ToolError(f"{prefix}width must be > 0", code=-32602)
+            try:
+                segments_i = int(args.get("segments"))
+            except Exception:
+                raise ToolError(f"{prefix}segments must be an integer", code=-32602)
+            if segments_i < 1 or segments_i > 12:
+                raise ToolError(f"{prefix}segments must be between 1 and 12", code=-32602)
+            return {"op": op, "args": {"width": width_f, "segments": segments_i}}
+        if op == "merge_by_distance":
+            try:
+                distance_f = float(args.get("distance", 0.0001))
+            except Exception:
+                raise ToolError(f"{prefix}distance must be a number", code=-32602)
+            if distance_f < 0:
+                raise ToolError(f"{prefix}distance must be >= 0", code=-32602)
+            return {"op": op, "args": {"distance": distance_f}}
+        if op == "recalc_normals":
+            inside = args.get("inside", False)
+            if not isinstance(inside, bool):
+                raise ToolError(f"{prefix}inside must be a boolean", code=-32602)
+            return {"op": op, "args": {"inside": inside}}
+        if op == "triangulate":
+            quad_method = _TRIANGULATE_QUAD_METHODS.get((args.get("method") or "BEAUTY").upper())
+            if quad_method is None:
+                raise ToolError(
+                    f"{prefix}method must be BEAUTY, FIXED, FIXED_ALTERNATE, or SHORTEST_DIAGONAL", code=-32602
+                )
+            return {"op": op, "args": {"quad_method": quad_method}}
+        raise ToolError(f"{prefix}op must be one of {list(_MESH_OP_NAMES)}", code=-32602)
+
+    def _run_mesh_ops(self, name: str, ops: List[Dict[str, Any]], keep: Any) -> Dict[str, Any]:
+        # keep=True leaves the bmesh open in Blender for the next mesh edit on this object; the next
+        # tool outside _MESH_SESSION_TOOLS (or blender-mesh-commit) writes it back to the mesh
+        if not isinstance(keep, bool):
+            raise ToolError("keep must be a boolean", code=-32602)
+        data = _bridge_call("mesh_ops", {"name": name, "ops": ops, "keep": keep}, timeout=5.0 * len(ops))
+        if not data.get("ok"):
+            # nothing new is open; a session the bridge dropped mid-batch is simply skipped by mesh_commit
+            return data
+        if keep:
+            if not self._commit_meshes_at_exit:
+                atexit.register(self._commit_meshes)
+                self._commit_meshes_at_exit = True
+            self._open_meshes.add(name)
+        else:
+            self._open_meshes.discard(name)
+        return data
+
+    def _commit_meshes(self, names: Optional[List[str]] = None) -> Dict[str, Any]:
+        # names=None commits every bmesh the bridge holds, including ones left by an earlier server process
+        if names is None:
+            self._open_meshes.clear()
+        else:
+            self._open_meshes.difference_update(names)
+        try:
+            return _bridge_call("mesh_commit", {"names": names})
+        except ToolError as exc:
+            return {"ok": False, "error": str(exc)}
+
     def _tool_extrude(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
         mode = args.get("mode")
-        distance = args.get("distance")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
         if mode not in ("faces",):
             raise ToolError("mode must be 'faces'", code=-32602)
-        try:
-            dist = float(distance)
-        except Exception:
-            raise ToolError("distance must be a number", code=-32602)
-        code = f"""
-import bpy, bmesh
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-mesh = obj.data
-bm = bmesh.new()
-bm.from_mesh(mesh)
-bm.normal_update()
-faces = bm.faces[:]
-if not faces:
-    raise ValueError("Mesh has no faces")
-geom = bmesh.ops.extrude_face_region(bm, geom=faces)
-verts = [ele for ele in geom["geom"] if isinstance(ele, bmesh.types.BMVert)]
-if not verts:
-    raise ValueError("Extrude failed")
-for v in verts:
-    v.co += v.normal.normalized() * {dist}
-bm.to_mesh(mesh)
-bm.free()
-mesh.update()
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._run_mesh_ops(name, [self._mesh_op("extrude", args)], args.get("keep", False))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to extrude", is_error=True)
         return _make_tool_result(f"Extruded faces on {name}", is_error=False)
 
     def _tool_inset(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        thickness = args.get("thickness")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        try:
-            thickness_val = float(thickness)
-        except Exception:
-            raise ToolError("thickness must be a number", code=-32602)
-        code = f"""
-import bpy, bmesh
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-mesh = obj.data
-bm = bmesh.new()
-bm.from_mesh(mesh)
-faces = bm.faces[:]
-if not faces:
-    raise ValueError("Mesh has no faces")
-bmesh.ops.inset_region(bm, faces=faces, thickness={thickness_val}, depth=0.0, use_even_offset=True)
-bm.to_mesh(mesh)
-bm.free()
-mesh.update()
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._run_mesh_ops(name, [self._mesh_op("inset", args)], args.get("keep", False))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to inset", is_error=True)
         return _make_tool_result(f"Inset faces on {name}", is_error=False)
 
     def _tool_loop_cut(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        cuts = args.get("cuts")
-        position = args.get("position", 0.5)
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        try:
-            cuts_i = int(cuts)
-        except Exception:
-            raise ToolError("cuts must be an integer", code=-32602)
-        if cuts_i < 1 or cuts_i > 20:
-            raise ToolError("cuts must be between 1 and 20", code=-32602)
-        try:
-            pos_f = float(position)
-        except Exception:
-            raise ToolError("position must be a number", code=-32602)
-        if pos_f < 0.0 or pos_f > 1.0:
-            raise ToolError("position must be between 0 and 1", code=-32602)
-        code = f"""
-import bpy, bmesh
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-mesh = obj.data
-bm = bmesh.new()
-bm.from_mesh(mesh)
-edges = bm.edges[:]
-if not edges:
-    raise ValueError("Mesh has no edges")
-perc = [{pos_f} for _ in edges]
-bmesh.ops.subdivide_edges(bm, edges=edges, cuts={cuts_i}, edge_perc=perc, use_grid_fill=False)
-bm.to_mesh(mesh)
-bm.free()
-mesh.update()
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        op = self._mesh_op("loop_cut", args)
+        data = self._run_mesh_ops(name, [op], args.get("keep", False))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to add loop cuts", is_error=True)
-        return _make_tool_result(f"Added {cuts_i} loop cuts on {name}", is_error=False)
+        return _make_tool_result(f"Added {op['args']['cuts']} loop cuts on {name}", is_error=False)
 
     def _tool_bevel_edges(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        width = args.get("width")
-        segments = args.get("segments")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        try:
-            width_f = float(width)
-        except Exception:
-            raise ToolError("width must be a number", code=-32602)
-        if width_f <= 0:
-            raise ToolError("width must be > 0", code=-32602)
-        try:
-            segments_i = int(segments)
-        except Exception:
-            raise ToolError("segments must be an integer", code=-32602)
-        if segments_i < 1 or segments_i > 12:
-            raise ToolError("segments must be between 1 and 12", code=-32602)
-        code = f"""
-import bpy, bmesh
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-mesh = obj.data
-bm = bmesh.new()
-bm.from_mesh(mesh)
-edges = bm.edges[:]
-if not edges:
-    raise ValueError("Mesh has no edges")
-bmesh.ops.bevel(bm, geom=edges, offset={width_f}, offset_type='OFFSET', segments={segments_i}, profile=0.5, clamp_overlap=True)
-bm.to_mesh(mesh)
-bm.free()
-mesh.update()
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        data = self._run_mesh_ops(name, [self._mesh_op("bevel", args)], args.get("keep", False))
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to bevel edges", is_error=True)
         return _make_tool_result(f"Beveled edges on {name}", is_error=False)
 
+    def _tool_mesh_batch(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        name = args.get("name")
+        ops = args.get("ops")
+        if not isinstance(name, str):
+            raise ToolError("name must be a string", code=-32602)
+        if not isinstance(ops, list) or not ops:
+            raise ToolError("ops must be a non-empty list", code=-32602)
+        checked = []
+        for index, op in enumerate(ops):
+            if not isinstance(op, dict):
+                raise ToolError(f"ops[{index}] must be an object", code=-32602)
+            checked.append(self._mesh_op(op.get("op"), op, prefix=f"ops[{index}]."))
+        data = self._run_mesh_ops(name, checked, args.get("keep", False))
+        if not data.get("ok"):
+            return _make_tool_result(data.get("error") or "Failed to run mesh ops", is_error=True)
+        return _make_tool_result(f"Applied {len(ops)} mesh ops on {name}", is_error=False)
+
+    def _tool_mesh_commit(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        name = args.get("name")
+        if name is not None and not isinstance(name, str):
+            raise ToolError("name must be a string", code=-32602)
+        data = self._commit_meshes(None if name is None else [name])
+        if not data.get("ok"):
+            return _make_tool_result(data.get("error") or "Failed to commit meshes", is_error=True)
+        committed = data.get("result") or []
+        if not committed:
+            return _make_tool_result("No open meshes", is_error=False)
+        return _make_tool_result(f"Committed {', '.join(committed)}", is_error=False)
+
     def _tool_merge_by_distance(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        distance = args.get("distance", 0.0001)
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        try:
-            distance_f = float(distance)
-        except Exception:
-            raise ToolError("distance must be a number", code=-32602)
-        if distance_f < 0:
-            raise ToolError("distance must be >= 0", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-distance = {distance_f}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-initial_mode = obj.mode
-restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT'}} else 'OBJECT'
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-try:
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.merge_by_distance(distance=distance)
-finally:
-    bpy.ops.object.mode_set(mode=restore_mode)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
+        op = self._mesh_op("merge_by_distance", args)
+        data = self._run_mesh_ops(name, [op], False)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to merge by distance", is_error=True)
-        return _make_tool_result(f"Merged {name} by distance {distance_f}", is_error=False)
+        return _make_tool_result(f"Merged {name} by distance {op['args']['distance']}", is_error=False)
 
     def _tool_recalc_normals(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        inside = args.get("inside", False)
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        if not isinstance(inside, bool):
-            raise ToolError("inside must be a boolean", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-inside = {inside}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-initial_mode = obj.mode
-restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT'}} else 'OBJECT'
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-try:
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.normals_make_consistent(inside=inside)
-finally:
-    bpy.ops.object.mode_set(mode=restore_mode)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
+        op = self._mesh_op("recalc_normals", args)
+        data = self._run_mesh_ops(name, [op], False)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to recalc normals", is_error=True)
-        side = "inside" if inside else "outside"
+        side = "inside" if op["args"]["inside"] else "outside"
         return _make_tool_result(f"Recalculated {name} normals ({side})", is_error=False)
 
     def _tool_triangulate(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
-        method = (args.get("method") or "BEAUTY").upper()
-        valid_methods = {"BEAUTY", "FIXED", "FIXED_ALTERNATE", "SHORTEST_DIAGONAL"}
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        if method not in valid_methods:
-            raise ToolError("method must be BEAUTY, FIXED, FIXED_ALTERNATE, or SHORTEST_DIAGONAL", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-method = {json.dumps(method)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if obj.type != 'MESH':
-    raise ValueError("Object is not a mesh")
-initial_mode = obj.mode
-restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT'}} else 'OBJECT'
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-try:
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.quads_convert_to_tris(quad_method=method, ngon_method='BEAUTY')
-finally:
-    bpy.ops.object.mode_set(mode=restore_mode)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
+        data = self._run_mesh_ops(name, [self._mesh_op("triangulate", args)], False)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to triangulate", is_error=True)
-        return _make_tool_result(f"Triangulated {name} with {method}", is_error=False)
+        return _make_tool_result(f"Triangulated {name} with {(args.get('method') or 'BEAUTY').upper()}", is_error=False)
 
     def _tool_mark_sharp_edges(self, args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
@@ -2571,9 +4268,9 @@ finally:
         clear_flag = mode == "clear"
         code = f"""
 import bpy, bmesh, math
-name = {json.dumps(name)}
+name = {_code_literal(name)}
 clear_flag = {clear_flag}
-selection_mode = {json.dumps(selection)}
+selection_mode = {_code_literal(selection)}
 angle_rad = math.radians({angle_f})
 obj = bpy.data.objects.get(name)
 if obj is None:
@@ -2583,7 +4280,8 @@ if obj.type != 'MESH':
 initial_mode = obj.mode
 restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT'}} else 'OBJECT'
 bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 obj.select_set(True)
 bpy.context.view_layer.objects.active = obj
 try:
@@ -2633,8 +4331,8 @@ finally:
             raise ToolError("mark_seams must be a boolean", code=-32602)
         code = f"""
 import bpy
-name = {json.dumps(name)}
-method = {json.dumps(method)}
+name = {_code_literal(name)}
+method = {_code_literal(method)}
 margin = {margin_f}
 mark_seams = {mark_seams}
 obj = bpy.data.objects.get(name)
@@ -2645,7 +4343,8 @@ if obj.type != 'MESH':
 initial_mode = obj.mode
 restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT'}} else 'OBJECT'
 bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 obj.select_set(True)
 bpy.context.view_layer.objects.active = obj
 try:
@@ -2666,291 +4365,42 @@ finally:
         name = args.get("name")
         mod_type = args.get("type")
         settings = args.get("settings") or {}
+        apply = args.get("apply", False)
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
         if not isinstance(mod_type, str):
             raise ToolError("type must be a string", code=-32602)
         if settings is not None and not isinstance(settings, dict):
             raise ToolError("settings must be an object", code=-32602)
-        type_map = {
-            "mirror": "MIRROR",
-            "array": "ARRAY",
-            "solidify": "SOLIDIFY",
-            "bevel": "BEVEL",
-            "subdivision": "SUBSURF",
-            "boolean": "BOOLEAN",
-            "decimate": "DECIMATE",
-            "weld": "WELD",
-            "triangulate": "TRIANGULATE",
-            "screw": "SCREW",
-            "edge_split": "EDGE_SPLIT",
-            "shrinkwrap": "SHRINKWRAP",
-            "lattice": "LATTICE",
-            "skin": "SKIN",
-        }
-        if mod_type not in type_map:
+        if not isinstance(apply, bool):
+            raise ToolError("apply must be a boolean", code=-32602)
+        code = _ADD_MODIFIER_CODE.get(mod_type)
+        if code is None:
             raise ToolError(
                 "type must be one of mirror,array,solidify,bevel,subdivision,boolean,decimate,weld,triangulate,"
                 "screw,edge_split,shrinkwrap,lattice,skin",
                 code=-32602,
             )
         clean_settings: Dict[str, Any] = {}
-        if mod_type == "mirror":
-            for axis_key in ("use_axis_x", "use_axis_y", "use_axis_z"):
-                val = settings.get(axis_key)
-                if val is not None:
-                    if not isinstance(val, bool):
-                        raise ToolError(f"{axis_key} must be a boolean", code=-32602)
-                    clean_settings[axis_key] = val
-            for opt_key, prop in (("clipping", "use_clip"), ("merge", "use_mirror_merge")):
-                val = settings.get(opt_key)
-                if val is not None:
-                    if not isinstance(val, bool):
-                        raise ToolError(f"{opt_key} must be a boolean", code=-32602)
-                    clean_settings[prop] = val
-            merge_threshold = settings.get("merge_threshold")
-            if merge_threshold is not None:
-                try:
-                    clean_settings["merge_threshold"] = float(merge_threshold)
-                except Exception:
-                    raise ToolError("merge_threshold must be a number", code=-32602)
-        if mod_type == "array":
-            count = settings.get("count")
-            if count is not None:
-                try:
-                    count_i = int(count)
-                except Exception:
-                    raise ToolError("count must be an integer", code=-32602)
-                clean_settings["count"] = count_i
-            rel = settings.get("relative_offset")
-            if rel is not None:
-                if not isinstance(rel, list) or len(rel) != 3:
-                    raise ToolError("relative_offset must be an array of 3 numbers", code=-32602)
-                try:
-                    rel_vals = [float(v) for v in rel]
-                except Exception:
-                    raise ToolError("relative_offset must be an array of 3 numbers", code=-32602)
-                clean_settings["relative_offset"] = rel_vals
-            offset_obj = settings.get("offset_object")
-            if offset_obj is not None:
-                if not isinstance(offset_obj, str):
-                    raise ToolError("offset_object must be a string", code=-32602)
-                clean_settings["offset_object"] = offset_obj
-            obj_offset = settings.get("object_offset")
-            if obj_offset is not None:
-                if not isinstance(obj_offset, list) or len(obj_offset) != 3:
-                    raise ToolError("object_offset must be an array of 3 numbers", code=-32602)
-                try:
-                    clean_settings["object_offset"] = [float(v) for v in obj_offset]
-                except Exception:
-                    raise ToolError("object_offset must be an array of 3 numbers", code=-32602)
-        if mod_type == "solidify":
-            thickness = settings.get("thickness")
-            if thickness is not None:
-                try:
-                    clean_settings["thickness"] = float(thickness)
-                except Exception:
-                    raise ToolError("thickness must be a number", code=-32602)
-        if mod_type == "bevel":
-            width = settings.get("width")
-            segments = settings.get("segments")
-            if width is not None:
-                try:
-                    clean_settings["width"] = float(width)
-                except Exception:
-                    raise ToolError("width must be a number", code=-32602)
-            if segments is not None:
-                try:
-                    segments_i = int(segments)
-                except Exception:
-                    raise ToolError("segments must be an integer", code=-32602)
-                clean_settings["segments"] = segments_i
-        if mod_type == "subdivision":
-            levels = settings.get("levels")
-            if levels is not None:
-                try:
-                    clean_settings["levels"] = int(levels)
-                except Exception:
-                    raise ToolError("levels must be an integer", code=-32602)
-        if mod_type == "boolean":
-            cutter = settings.get("cutter")
-            operation = settings.get("operation", "union")
-            if cutter is not None and not isinstance(cutter, str):
-                raise ToolError("cutter must be a string", code=-32602)
-            if operation not in ("union", "difference", "intersect"):
-                raise ToolError("operation must be union, difference, or intersect", code=-32602)
-            clean_settings["cutter"] = cutter
-            clean_settings["operation"] = operation
-        if mod_type == "decimate":
-            ratio = settings.get("ratio")
-            if ratio is not None:
-                try:
-                    r = float(ratio)
-                except Exception:
-                    raise ToolError("ratio must be a number", code=-32602)
-                clean_settings["ratio"] = r
-        if mod_type == "weld":
-            merge_threshold = settings.get("merge_threshold")
-            if merge_threshold is not None:
-                try:
-                    clean_settings["merge_threshold"] = float(merge_threshold)
-                except Exception:
-                    raise ToolError("merge_threshold must be a number", code=-32602)
-        if mod_type == "triangulate":
-            quad_method = settings.get("quad_method")
-            ngon_method = settings.get("ngon_method")
-            quad_valid = {"BEAUTY", "FIXED", "FIXED_ALTERNATE", "SHORTEST_DIAGONAL"}
-            ngon_valid = {"BEAUTY", "FIXED", "FIXED_ALTERNATE", "SHORTEST_DIAGONAL"}
-            if quad_method is not None:
-                if not isinstance(quad_method, str) or quad_method.upper() not in quad_valid:
-                    raise ToolError("quad_method must be a valid triangulate method", code=-32602)
-                clean_settings["quad_method"] = quad_method.upper()
-            if ngon_method is not None:
-                if not isinstance(ngon_method, str) or ngon_method.upper() not in ngon_valid:
-                    raise ToolError("ngon_method must be a valid triangulate method", code=-32602)
-                clean_settings["ngon_method"] = ngon_method.upper()
-        if mod_type == "screw":
-            angle = settings.get("angle_degrees", settings.get("angle", 360.0))
-            steps = settings.get("steps")
-            axis = (settings.get("axis") or "Z").upper()
-            try:
-                clean_settings["angle"] = float(angle)
-            except Exception:
-                raise ToolError("angle_degrees must be a number", code=-32602)
-            if steps is not None:
-                try:
-                    clean_settings["steps"] = int(steps)
-                except Exception:
-                    raise ToolError("steps must be an integer", code=-32602)
-            if axis not in ("X", "Y", "Z"):
-                raise ToolError("axis must be X, Y, or Z", code=-32602)
-            clean_settings["axis"] = axis
-        if mod_type == "edge_split":
-            split_angle = settings.get("split_angle", 30.0)
+        for keys, dest, cast, message, default in _MODIFIER_SETTINGS_SCHEMA.get(mod_type, ()):
+            value = next((settings[key] for key in keys if settings.get(key) is not None), default)
+            if value is None:
+                continue
+            if value is _REQUIRED:
+                raise ToolError(message, code=-32602)
             try:
-                clean_settings["split_angle"] = float(split_angle)
-            except Exception:
-                raise ToolError("split_angle must be a number", code=-32602)
-            for key in ("use_edge_angle", "use_edge_sharp"):
-                val = settings.get(key)
-                if val is not None:
-                    if not isinstance(val, bool):
-                        raise ToolError(f"{key} must be a boolean", code=-32602)
-                    clean_settings[key] = val
-        if mod_type == "shrinkwrap":
-            target_obj = settings.get("target")
-            if target_obj is not None and not isinstance(target_obj, str):
-                raise ToolError("target must be a string", code=-32602)
-            if target_obj is not None:
-                clean_settings["target"] = target_obj
-            offset = settings.get("offset")
-            if offset is not None:
-                try:
-                    clean_settings["offset"] = float(offset)
-                except Exception:
-                    raise ToolError("offset must be a number", code=-32602)
-            wrap_method = settings.get("wrap_method")
-            if wrap_method is not None:
-                if not isinstance(wrap_method, str):
-                    raise ToolError("wrap_method must be a string", code=-32602)
-                valid_wrap = {"NEAREST_SURFACEPOINT", "PROJECT", "NEAREST_VERTEX", "TARGET_PROJECT"}
-                wm_upper = wrap_method.upper()
-                if wm_upper not in valid_wrap:
-                    raise ToolError("wrap_method is invalid", code=-32602)
-                clean_settings["wrap_method"] = wm_upper
-        if mod_type == "lattice":
-            lattice = settings.get("lattice")
-            if lattice is None or not isinstance(lattice, str):
-                raise ToolError("lattice must be a string", code=-32602)
-            clean_settings["lattice"] = lattice
-        mod_bpy_type = type_map[mod_type]
-        code = f"""
-import bpy, math
-obj = bpy.data.objects.get({json.dumps(name)})
-if obj is None:
-    raise ValueError("Object not found")
-mod = obj.modifiers.new(name={json.dumps(mod_type + "_mod")}, type={json.dumps(mod_bpy_type)})
-settings = {json.dumps(clean_settings)}
-if {json.dumps(mod_type)} == "mirror":
-    for key, val in settings.items():
-        setattr(mod, key, val)
-elif {json.dumps(mod_type)} == "array":
-    if "count" in settings:
-        mod.count = settings["count"]
-    if "relative_offset" in settings:
-        mod.use_relative_offset = True
-        mod.relative_offset_displace = tuple(settings["relative_offset"])
-    if "offset_object" in settings:
-        off_obj = bpy.data.objects.get(settings["offset_object"])
-        if off_obj is None:
-            raise ValueError("Offset object not found")
-        mod.use_object_offset = True
-        mod.offset_object = off_obj
-    if "object_offset" in settings:
-        mod.use_constant_offset = True
-        mod.constant_offset_displace = tuple(settings["object_offset"])
-elif {json.dumps(mod_type)} == "solidify":
-    if "thickness" in settings:
-        mod.thickness = settings["thickness"]
-elif {json.dumps(mod_type)} == "bevel":
-    if "width" in settings:
-        mod.width = settings["width"]
-    if "segments" in settings:
-        mod.segments = settings["segments"]
-elif {json.dumps(mod_type)} == "subdivision":
-    if "levels" in settings:
-        mod.levels = settings["levels"]
-elif {json.dumps(mod_type)} == "boolean":
-    if "cutter" in settings and settings["cutter"]:
-        cutter_obj = bpy.data.objects.get(settings["cutter"])
-        if cutter_obj is None:
-            raise ValueError("Cutter object not found")
-        mod.object = cutter_obj
-    op_map = {{"union": "UNION", "difference": "DIFFERENCE", "intersect": "INTERSECT"}}
-    mod.operation = op_map.get(settings.get("operation", "union"), "UNION")
-elif {json.dumps(mod_type)} == "decimate":
-    if "ratio" in settings:
-        mod.ratio = settings["ratio"]
-elif {json.dumps(mod_type)} == "weld":
-    if "merge_threshold" in settings:
-        mod.merge_threshold = settings["merge_threshold"]
-elif {json.dumps(mod_type)} == "triangulate":
-    if "quad_method" in settings:
-        mod.quad_method = settings["quad_method"]
-    if "ngon_method" in settings:
-        mod.ngon_method = settings["ngon_method"]
-elif {json.dumps(mod_type)} == "screw":
-    if "angle" in settings:
-        mod.angle = math.radians(settings["angle"])
-    if "steps" in settings:
-        mod.steps = settings["steps"]
-    if "axis" in settings:
-        mod.axis = settings["axis"]
-elif {json.dumps(mod_type)} == "edge_split":
-    if "split_angle" in settings:
-        mod.split_angle = math.radians(settings["split_angle"])
-    if "use_edge_angle" in settings:
-        mod.use_edge_angle = settings["use_edge_angle"]
-    if "use_edge_sharp" in settings:
-        mod.use_edge_sharp = settings["use_edge_sharp"]
-elif {json.dumps(mod_type)} == "shrinkwrap":
-    if "target" in settings:
-        tgt = bpy.data.objects.get(settings["target"])
-        if tgt is None:
-            raise ValueError("Shrinkwrap target not found")
-        mod.target = tgt
-    if "offset" in settings:
-        mod.offset = settings["offset"]
-    if "wrap_method" in settings:
-        mod.wrap_method = settings["wrap_method"]
-elif {json.dumps(mod_type)} == "lattice":
-    if "lattice" in settings:
-        lat = bpy.data.objects.get(settings["lattice"])
-        if lat is None:
-            raise ValueError("Lattice object not found")
-        mod.object = lat
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+                clean_settings[dest] = cast(value)
+            except (TypeError, ValueError, OverflowError):
+                raise ToolError(message, code=-32602)
+        params = {"name": name, "settings": clean_settings}
+        if apply:
+            # add and apply in the same /exec instead of a second round trip through blender-apply-modifier
+            code += _APPLY_MODIFIER_CODE
+            data = _bridge_request("/exec", payload={"code": code, "params": params}, timeout=8.0)
+            if not data.get("ok"):
+                return _make_tool_result(data.get("error") or "Failed to add and apply modifier", is_error=True)
+            return _make_tool_result(f"Added and applied {mod_type} modifier on {name}", is_error=False)
+        data = _bridge_request("/exec", payload={"code": code, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to add modifier", is_error=True)
         return _make_tool_result(f"Added {mod_type} modifier to {name}", is_error=False)
@@ -2962,21 +4412,10 @@ elif {json.dumps(mod_type)} == "lattice":
             raise ToolError("name must be a string", code=-32602)
         if not isinstance(modifier, str):
             raise ToolError("modifier must be a string", code=-32602)
-        code = f"""
-import bpy
-obj = bpy.data.objects.get({json.dumps(name)})
-if obj is None:
-    raise ValueError("Object not found")
-mod = obj.modifiers.get({json.dumps(modifier)})
-if mod is None:
-    raise ValueError("Modifier not found")
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-bpy.ops.object.modifier_apply(modifier=mod.name)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
+        if self._known_missing(name):
+            return _make_tool_result("Object not found", is_error=True)
+        params = {"name": name, "modifier": modifier}
+        data = _bridge_request("/exec", payload={"code": _APPLY_NAMED_MODIFIER_CODE, "params": params}, timeout=8.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to apply modifier", is_error=True)
         return _make_tool_result(f"Applied modifier {modifier} on {name}", is_error=False)
@@ -2985,38 +4424,8 @@ bpy.ops.object.modifier_apply(modifier=mod.name)
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-mods = []
-for mod in obj.modifiers:
-    info = {{"name": mod.name, "type": mod.type}}
-    for field in (
-        "levels", "render_levels", "width", "segments", "thickness", "ratio",
-        "merge_threshold", "use_clip", "use_mirror_merge", "use_relative_offset",
-        "relative_offset_displace", "use_constant_offset", "constant_offset_displace",
-        "use_object_offset", "offset_object", "split_angle", "use_edge_angle", "use_edge_sharp",
-        "wrap_method", "offset", "axis", "angle", "steps"
-    ):
-        try:
-            val = getattr(mod, field, None)
-        except Exception:
-            continue
-        if hasattr(val, "name"):
-            val = val.name
-        elif hasattr(val, "to_tuple"):
-            try:
-                val = list(val)
-            except Exception:
-                pass
-        info[field] = val
-    mods.append(info)
-result = mods
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        params = {"name": name}
+        data = _bridge_request("/exec", payload={"code": _LIST_MODIFIERS_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to list modifiers", is_error=True)
         mods = data.get("result") or []
@@ -3036,32 +4445,13 @@ result = mods
             raise ToolError("name must be a string", code=-32602)
         if not isinstance(cutter, str):
             raise ToolError("cutter must be a string", code=-32602)
-        if operation not in ("union", "difference", "intersect"):
+        if operation not in _BOOLEAN_OPERATIONS:
             raise ToolError("operation must be union, difference, or intersect", code=-32602)
         if not isinstance(apply, bool):
             raise ToolError("apply must be a boolean", code=-32602)
-        code = f"""
-import bpy
-obj = bpy.data.objects.get({json.dumps(name)})
-if obj is None:
-    raise ValueError("Object not found")
-cutter_obj = bpy.data.objects.get({json.dumps(cutter)})
-if cutter_obj is None:
-    raise ValueError("Cutter object not found")
-mod = obj.modifiers.new(name="Boolean_auto", type="BOOLEAN")
-op_map = {{"union": "UNION", "difference": "DIFFERENCE", "intersect": "INTERSECT"}}
-mod.operation = op_map[{json.dumps(operation)}]
-mod.object = cutter_obj
-"""
-        if apply:
-            code += """
-bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
-obj.select_set(True)
-bpy.context.view_layer.objects.active = obj
-bpy.ops.object.modifier_apply(modifier=mod.name)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=8.0)
+        code = _BOOLEAN_CODE + _APPLY_MODIFIER_CODE if apply else _BOOLEAN_CODE
+        params = {"name": name, "cutter": cutter, "operation": operation.upper()}
+        data = _bridge_request("/exec", payload={"code": code, "params": params}, timeout=8.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to perform boolean", is_error=True)
         return _make_tool_result(f"Boolean {operation} on {name} with {cutter}", is_error=False)
@@ -3071,13 +4461,10 @@ bpy.ops.object.modifier_apply(modifier=mod.name)
             return None
         if not isinstance(value, list) or len(value) != 4:
             raise ToolError(f"{name} must be an array of 4 numbers (RGBA)", code=-32602)
-        out: List[float] = []
-        for v in value:
-            try:
-                out.append(float(v))
-            except (TypeError, ValueError):
-                raise ToolError(f"{name} must be an array of 4 numbers (RGBA)", code=-32602)
-        return out
+        try:
+            return list(map(float, value))
+        except (TypeError, ValueError):
+            raise ToolError(f"{name} must be an array of 4 numbers (RGBA)", code=-32602)
 
     def _tool_parent(self, args: Dict[str, Any]) -> Dict[str, Any]:
         child = args.get("child")
@@ -3089,23 +4476,11 @@ bpy.ops.object.modifier_apply(modifier=mod.name)
             raise ToolError("parent must be a string", code=-32602)
         if not isinstance(keep_transform, bool):
             raise ToolError("keep_transform must be a boolean", code=-32602)
-        code = f"""
-import bpy
-child_name = {json.dumps(child)}
-parent_name = {json.dumps(parent)}
-keep_transform = {keep_transform}
-child_obj = bpy.data.objects.get(child_name)
-if child_obj is None:
-    raise ValueError("Child not found")
-parent_obj = bpy.data.objects.get(parent_name)
-if parent_obj is None:
-    raise ValueError("Parent not found")
-current_matrix = child_obj.matrix_world.copy()
-child_obj.parent = parent_obj
-if keep_transform:
-    child_obj.matrix_world = current_matrix
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        missing = self._known_missing(child, parent)
+        if missing:
+            return _make_tool_result("Child not found" if missing == child else "Parent not found", is_error=True)
+        params = {"child_name": child, "parent_name": parent, "keep_transform": keep_transform}
+        data = _bridge_request("/exec", payload={"code": _PARENT_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to parent object", is_error=True)
         return _make_tool_result(f"Parented {child} to {parent}", is_error=False)
@@ -3120,24 +4495,10 @@ if keep_transform:
             raise ToolError("collection must be a string", code=-32602)
         if not isinstance(create, bool):
             raise ToolError("create must be a boolean", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-collection_name = {json.dumps(collection)}
-create = {create}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-col = bpy.data.collections.get(collection_name)
-if col is None:
-    if not create:
-        raise ValueError("Collection not found")
-    col = bpy.data.collections.new(collection_name)
-    bpy.context.scene.collection.children.link(col)
-if obj.name not in col.objects:
-    col.objects.link(obj)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        if self._known_missing(name):
+            return _make_tool_result("Object not found", is_error=True)
+        params = {"name": name, "collection_name": collection, "create": create}
+        data = _bridge_request("/exec", payload={"code": _MOVE_TO_COLLECTION_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to move to collection", is_error=True)
         return _make_tool_result(f"Moved {name} to collection {collection}", is_error=False)
@@ -3148,31 +4509,23 @@ if obj.name not in col.objects:
         mode = (args.get("mode") or "ROTATION_ZERO").upper()
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        if axis not in ("X", "Y", "Z"):
+        if axis not in _AXES:
             raise ToolError("axis must be X, Y, or Z", code=-32602)
         if mode not in ("ROTATION_ZERO", "LOCATION_ZERO"):
             raise ToolError("mode must be ROTATION_ZERO or LOCATION_ZERO", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-axis = {json.dumps(axis)}
-mode = {json.dumps(mode)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if mode == "ROTATION_ZERO":
-    obj.rotation_euler = (0.0, 0.0, 0.0)
-else:
-    loc = list(obj.location)
-    if axis == "X":
-        loc[0] = 0.0
-    elif axis == "Y":
-        loc[1] = 0.0
-    elif axis == "Z":
-        loc[2] = 0.0
-    obj.location = tuple(loc)
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        if self._known_missing(name):
+            return _make_tool_result("Object not found", is_error=True)
+        rotation = mode == "ROTATION_ZERO"
+        xform_key = ("rotate_object", name) if rotation else ("move_object", name)
+        last = self._last_xform.get(xform_key)
+        if last is not None and time.monotonic() - last[1] < _TRANSFORM_NOOP_TTL_S:
+            values = last[0]["rotation"] if rotation else [last[0]["location"]["XYZ".index(axis)]]
+            if not any(values):
+                # the transform we last set is already zero there: nothing to send
+                return _make_tool_result(f"Aligned {name} ({mode} {axis})", is_error=False)
+        self._last_xform.pop(xform_key, None)
+        params = {"name": name, "axis": axis, "mode": mode}
+        data = _bridge_request("/exec", payload={"code": _ALIGN_TO_AXIS_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to align object", is_error=True)
         return _make_tool_result(f"Aligned {name} ({mode} {axis})", is_error=False)
@@ -3185,35 +4538,30 @@ else:
             raise ToolError("name must be a string", code=-32602)
         if base_color is None:
             base_color = [0.8, 0.8, 0.8, 1.0]
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-mat = bpy.data.materials.new(name=name)
-mat.use_nodes = True
-nodes = mat.node_tree.nodes
-links = mat.node_tree.links
-nodes.clear()
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-bsdf.location = (0, 0)
-bsdf.inputs['Base Color'].default_value = ({base_color[0]}, {base_color[1]}, {base_color[2]}, {base_color[3]})
-output = nodes.new(type='ShaderNodeOutputMaterial')
-output.location = (300, 0)
-links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        params = {"name": name, "base_color": base_color}
+        data = _bridge_request("/exec", payload={"code": _CREATE_MATERIAL_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to create material", is_error=True)
+        created = data.get("result")
+        if self._material_names is not None:
+            # Blender may have suffixed the name (.001); only a reported name keeps the list exact
+            if isinstance(created, str):
+                self._material_names[1].append(created)
+            else:
+                self._material_names = None
         return _make_tool_result(f"Created material {name}", is_error=False)
 
     def _tool_list_materials(self, _: Dict[str, Any]) -> Dict[str, Any]:
-        code = """
-import bpy
-result = [mat.name for mat in bpy.data.materials]
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
-        if not data.get("ok"):
-            return _make_tool_result(data.get("error") or "Failed to list materials", is_error=True)
-        mats = data.get("result") or []
+        listing = self._material_names
+        if listing is not None and time.monotonic() - listing[0] < _MATERIAL_NAMES_TTL_S:
+            mats: Any = listing[1]
+        else:
+            data = _bridge_request("/exec", payload={"code": _LIST_MATERIALS_CODE}, timeout=5.0)
+            if not data.get("ok"):
+                return _make_tool_result(data.get("error") or "Failed to list materials", is_error=True)
+            mats = data.get("result") or []
+            if isinstance(mats, list):
+                self._material_names = (time.monotonic(), list(mats))
         if isinstance(mats, list) and mats:
             text = ", ".join(mats)
         else:
@@ -3224,20 +4572,8 @@ result = [mat.name for mat in bpy.data.materials]
         name = args.get("name")
         if not isinstance(name, str):
             raise ToolError("name must be a string", code=-32602)
-        code = f"""
-import bpy
-name = {json.dumps(name)}
-obj = bpy.data.objects.get(name)
-if obj is None:
-    raise ValueError("Object not found")
-if not hasattr(obj.data, "materials"):
-    raise ValueError("Object has no material slots")
-slots = []
-for idx, mat in enumerate(obj.data.materials):
-    slots.append({{"index": idx, "material": mat.name if mat else None}})
-result = slots
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        params = {"name": name}
+        data = _bridge_request("/exec", payload={"code": _LIST_MATERIAL_SLOTS_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to list material slots", is_error=True)
         slots = data.get("result") or []
@@ -3258,25 +4594,39 @@ result = slots
             raise ToolError("format must be a string", code=-32602)
         if not isinstance(selected_only, bool):
             raise ToolError("selected_only must be a boolean", code=-32602)
-        if fmt not in ("fbx", "gltf"):
+        if fmt not in _EXPORT_CODE:
             raise ToolError("format must be 'fbx' or 'gltf'", code=-32602)
-        if fmt == "fbx":
-            code = f"""
-import bpy
-path = {json.dumps(path)}
-bpy.ops.export_scene.fbx(filepath=path, use_selection={selected_only})
-"""
-        else:
-            code = f"""
-import bpy
-path = {json.dumps(path)}
-bpy.ops.export_scene.gltf(filepath=path, use_selection={selected_only})
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=10.0)
+        wait = args.get("wait", True)
+        if not isinstance(wait, bool):
+            raise ToolError("wait must be a boolean", code=-32602)
+        params = {"path": path, "selected_only": selected_only}
+        # the bridge queues the export and answers at once; the writer's run time is spent polling, not on one request
+        payload = {"code": _EXPORT_CODE[fmt], "params": params, "wait": False}
+        data = _bridge_request("/exec", payload=payload, timeout=5.0)
+        if data.get("ok") and data.get("pending"):
+            if not wait:
+                return _make_tool_result(json.dumps({"job_id": data.get("id"), "status": "pending"}), is_error=False)
+            data = _wait_bridge_job(data.get("id"), _EXPORT_WAIT_S)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to export", is_error=True)
         return _make_tool_result(f"Exported to {path} as {fmt}", is_error=False)
 
+    def _tool_export_status(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = args.get("job_id")
+        if not isinstance(job_id, str) or not job_id:
+            raise ToolError("job_id must be a non-empty string", code=-32602)
+        data = _bridge_request(f"/jobs/{urllib.parse.quote(job_id, safe='')}", timeout=2.0)
+        if data.get("pending"):
+            status = {"job_id": job_id, "status": "pending"}
+        elif data.get("error_type") == "unknown_job":
+            # never queued, or finished longer ago than the bridge keeps results
+            status = {"job_id": job_id, "status": "unknown", "error": data.get("error") or "Unknown job"}
+        elif data.get("ok"):
+            status = {"job_id": job_id, "status": "done"}
+        else:
+            status = {"job_id": job_id, "status": "failed", "error": data.get("error") or "Export failed"}
+        return _make_tool_result(json.dumps(status), is_error=status["status"] in ("failed", "unknown"))
+
     def _tool_rename_object(self, args: Dict[str, Any]) -> Dict[str, Any]:
         old_name = args.get("old_name")
         new_name = args.get("new_name")
@@ -3284,16 +4634,8 @@ bpy.ops.export_scene.gltf(filepath=path, use_selection={selected_only})
             raise ToolError("old_name must be a string", code=-32602)
         if not isinstance(new_name, str):
             raise ToolError("new_name must be a string", code=-32602)
-        code = f"""
-import bpy
-old_name = {json.dumps(old_name)}
-new_name = {json.dumps(new_name)}
-obj = bpy.data.objects.get(old_name)
-if obj is None:
-    raise ValueError(f"Object {{old_name}} not found")
-obj.name = new_name
-"""
-        data = _bridge_request("/exec", payload={"code": code}, timeout=5.0)
+        params = {"old_name": old_name, "new_name": new_name}
+        data = _bridge_request("/exec", payload={"code": _RENAME_OBJECT_CODE, "params": params}, timeout=5.0)
         if not data.get("ok"):
             return _make_tool_result(data.get("error") or "Failed to rename object", is_error=True)
         return _make_tool_result(f"Renamed {old_name} to {new_name}", is_error=False)
@@ -2,27 +2,32 @@ import os
 from typing import Any
 
 
-def register(registry, bridge_request: Any, make_tool_result: Any, ToolError: Any) -> None:  # noqa: ANN001, N803
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "health",
         "Health check",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_health,  # noqa: SLF001
-    )
-    reg(
+        "_tool_health",
+    ),
+    (
         "blender-ping",
         "Ping Blender bridge",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_blender_ping,  # noqa: SLF001
-    )
-    reg(
+        "_tool_blender_ping",
+    ),
+    (
         "blender-snapshot",
         "Get Blender scene snapshot",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_blender_snapshot,  # noqa: SLF001
-    )
+        "_tool_blender_snapshot",
+    ),
+)
+
+
+def register(registry, bridge_request: Any, make_tool_result: Any, ToolError: Any) -> None:  # noqa: ANN001, N803
+    reg = registry._register  # noqa: SLF001
+
+    registry._register_table(TOOLS)  # noqa: SLF001
     if os.environ.get("BLENDER_MCP_UNSAFE") == "1":
         reg(
             "blender-exec",
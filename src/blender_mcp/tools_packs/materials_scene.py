@@ -1,10 +1,8 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-create-material",
         "Create a new material with optional base color",
         {
@@ -16,9 +14,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_create_material,  # noqa: SLF001
-    )
-    reg(
+        "_tool_create_material",
+    ),
+    (
         "blender-export",
         "Export scene to FBX or glTF format",
         {
@@ -27,13 +25,25 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
                 "path": {"type": "string"},
                 "format": {"type": "string"},
                 "selected_only": {"type": "boolean"},
+                "wait": {"type": "boolean"},
             },
             "required": ["path", "format"],
             "additionalProperties": False,
         },
-        registry._tool_export,  # noqa: SLF001
-    )
-    reg(
+        "_tool_export",
+    ),
+    (
+        "blender-export-status",
+        "Check an export started with wait=false",
+        {
+            "type": "object",
+            "properties": {"job_id": {"type": "string"}},
+            "required": ["job_id"],
+            "additionalProperties": False,
+        },
+        "_tool_export_status",
+    ),
+    (
         "blender-rename-object",
         "Rename an object",
         {
@@ -45,9 +55,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["old_name", "new_name"],
             "additionalProperties": False,
         },
-        registry._tool_rename_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_rename_object",
+    ),
+    (
         "blender-assign-material",
         "Assign an existing material to an object",
         {
@@ -61,9 +71,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["object", "material"],
             "additionalProperties": False,
         },
-        registry._tool_assign_material,  # noqa: SLF001
-    )
-    reg(
+        "_tool_assign_material",
+    ),
+    (
         "blender-set-shading",
         "Set object shading to flat or smooth",
         {
@@ -72,15 +82,15 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "mode"],
             "additionalProperties": False,
         },
-        registry._tool_set_shading,  # noqa: SLF001
-    )
-    reg(
+        "_tool_set_shading",
+    ),
+    (
         "blender-list-materials",
         "List materials in scene",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_list_materials,  # noqa: SLF001
-    )
-    reg(
+        "_tool_list_materials",
+    ),
+    (
         "blender-list-material-slots",
         "List material slots for an object",
         {
@@ -89,9 +99,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_list_material_slots,  # noqa: SLF001
-    )
-    reg(
+        "_tool_list_material_slots",
+    ),
+    (
         "blender-assign-image-texture",
         "Assign image texture to material slot",
         {
@@ -107,9 +117,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["object", "material", "image_path"],
             "additionalProperties": False,
         },
-        registry._tool_assign_image_texture,  # noqa: SLF001
-    )
-    reg(
+        "_tool_assign_image_texture",
+    ),
+    (
         "blender-parent",
         "Parent one object to another",
         {
@@ -122,9 +132,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["child", "parent"],
             "additionalProperties": False,
         },
-        registry._tool_parent,  # noqa: SLF001
-    )
-    reg(
+        "_tool_parent",
+    ),
+    (
         "blender-move-to-collection",
         "Move an object to a collection (links without unlinking others)",
         {
@@ -133,5 +143,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "collection"],
             "additionalProperties": False,
         },
-        registry._tool_move_to_collection,  # noqa: SLF001
-    )
+        "_tool_move_to_collection",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
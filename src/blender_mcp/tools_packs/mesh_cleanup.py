@@ -1,10 +1,8 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-delete-all",
         "Delete all objects (safety confirm required)",
         {
@@ -13,9 +11,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["confirm"],
             "additionalProperties": False,
         },
-        registry._tool_delete_all,  # noqa: SLF001
-    )
-    reg(
+        "_tool_delete_all",
+    ),
+    (
         "blender-get-mesh-stats",
         "Get mesh vertex/edge/face/triangle counts",
         {
@@ -24,9 +22,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_get_mesh_stats,  # noqa: SLF001
-    )
-    reg(
+        "_tool_get_mesh_stats",
+    ),
+    (
         "blender-merge-by-distance",
         "Merge mesh vertices by distance",
         {
@@ -35,9 +33,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_merge_by_distance,  # noqa: SLF001
-    )
-    reg(
+        "_tool_merge_by_distance",
+    ),
+    (
         "blender-recalc-normals",
         "Recalculate mesh normals (outside or inside)",
         {
@@ -46,9 +44,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_recalc_normals,  # noqa: SLF001
-    )
-    reg(
+        "_tool_recalc_normals",
+    ),
+    (
         "blender-triangulate",
         "Triangulate mesh faces",
         {
@@ -57,5 +55,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_triangulate,  # noqa: SLF001
-    )
+        "_tool_triangulate",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
@@ -3,55 +3,120 @@ import json
 from typing import Any, Dict
 
 
-def register(registry, bridge_request, make_tool_result, ToolError) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-    validate_vector = registry._validate_vector  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-extrude",
         "Extrude all faces of a mesh",
         {
             "type": "object",
-            "properties": {"name": {"type": "string"}, "mode": {"type": "string"}, "distance": {"type": "number"}},
+            "properties": {
+                "name": {"type": "string"},
+                "mode": {"type": "string"},
+                "distance": {"type": "number"},
+                "keep": {"type": "boolean"},
+            },
             "required": ["name", "mode", "distance"],
             "additionalProperties": False,
         },
-        registry._tool_extrude,  # noqa: SLF001
-    )
-    reg(
+        "_tool_extrude",
+    ),
+    (
         "blender-inset",
         "Inset all faces of a mesh",
         {
             "type": "object",
-            "properties": {"name": {"type": "string"}, "thickness": {"type": "number"}},
+            "properties": {"name": {"type": "string"}, "thickness": {"type": "number"}, "keep": {"type": "boolean"}},
             "required": ["name", "thickness"],
             "additionalProperties": False,
         },
-        registry._tool_inset,  # noqa: SLF001
-    )
-    reg(
+        "_tool_inset",
+    ),
+    (
         "blender-loop-cut",
         "Add loop cuts to a mesh",
         {
             "type": "object",
-            "properties": {"name": {"type": "string"}, "cuts": {"type": "integer"}, "position": {"type": "number"}},
+            "properties": {
+                "name": {"type": "string"},
+                "cuts": {"type": "integer"},
+                "position": {"type": "number"},
+                "keep": {"type": "boolean"},
+            },
             "required": ["name", "cuts"],
             "additionalProperties": False,
         },
-        registry._tool_loop_cut,  # noqa: SLF001
-    )
-    reg(
+        "_tool_loop_cut",
+    ),
+    (
         "blender-bevel-edges",
         "Bevel mesh edges",
         {
             "type": "object",
-            "properties": {"name": {"type": "string"}, "width": {"type": "number"}, "segments": {"type": "integer"}},
+            "properties": {
+                "name": {"type": "string"},
+                "width": {"type": "number"},
+                "segments": {"type": "integer"},
+                "keep": {"type": "boolean"},
+            },
             "required": ["name", "width", "segments"],
             "additionalProperties": False,
         },
-        registry._tool_bevel_edges,  # noqa: SLF001
-    )
-    reg(
+        "_tool_bevel_edges",
+    ),
+    (
+        "blender-mesh-batch",
+        "Run several bmesh edit ops (extrude, inset, bevel, merge, ...) on one mesh in a single pass",
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "ops": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {
+                                "type": "string",
+                                "enum": [
+                                    "extrude",
+                                    "inset",
+                                    "loop_cut",
+                                    "bevel",
+                                    "merge_by_distance",
+                                    "recalc_normals",
+                                    "triangulate",
+                                ],
+                            },
+                            "distance": {"type": "number"},
+                            "thickness": {"type": "number"},
+                            "cuts": {"type": "integer"},
+                            "position": {"type": "number"},
+                            "width": {"type": "number"},
+                            "segments": {"type": "integer"},
+                            "inside": {"type": "boolean"},
+                            "method": {"type": "string"},
+                        },
+                        "required": ["op"],
+                    },
+                },
+                "keep": {"type": "boolean"},
+            },
+            "required": ["name", "ops"],
+            "additionalProperties": False,
+        },
+        "_tool_mesh_batch",
+    ),
+    (
+        "blender-mesh-commit",
+        "Write bmesh edits left open by keep=true back to their meshes",
+        {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "additionalProperties": False,
+        },
+        "_tool_mesh_commit",
+    ),
+    (
         "blender-merge-by-distance",
         "Merge mesh vertices by distance",
         {
@@ -60,9 +125,9 @@ def register(registry, bridge_request, make_tool_result, ToolError) -> None:  #
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_merge_by_distance,  # noqa: SLF001
-    )
-    reg(
+        "_tool_merge_by_distance",
+    ),
+    (
         "blender-recalc-normals",
         "Recalculate mesh normals (outside or inside)",
         {
@@ -71,9 +136,9 @@ def register(registry, bridge_request, make_tool_result, ToolError) -> None:  #
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_recalc_normals,  # noqa: SLF001
-    )
-    reg(
+        "_tool_recalc_normals",
+    ),
+    (
         "blender-triangulate",
         "Triangulate mesh faces",
         {
@@ -82,8 +147,17 @@ def register(registry, bridge_request, make_tool_result, ToolError) -> None:  #
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_triangulate,  # noqa: SLF001
-    )
+        "_tool_triangulate",
+    ),
+)
+
+
+def register(registry, bridge_request, make_tool_result, ToolError) -> None:  # noqa: ANN001
+    reg = registry._register  # noqa: SLF001
+    validate_vector = registry._validate_vector  # noqa: SLF001
+
+    registry._register_table(TOOLS)  # noqa: SLF001
+
     def _mesh_extrude(args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
         if name is None:
@@ -193,7 +267,8 @@ if obj.type != 'MESH':
 initial_mode = obj.mode
 restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT', 'SCULPT', 'VERTEX_PAINT', 'WEIGHT_PAINT', 'TEXTURE_PAINT'}} else 'OBJECT'
 bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 obj.select_set(True)
 bpy.context.view_layer.objects.active = obj
 try:
@@ -824,7 +899,8 @@ result = created
 import bpy
 objects = {json.dumps(objects)}
 name = {json.dumps(name)}
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 for obj_name in objects:
     obj = bpy.data.objects.get(obj_name)
     if obj is None:
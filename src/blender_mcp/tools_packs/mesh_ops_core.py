@@ -2,6 +2,26 @@ import json
 from typing import Any, Dict
 
 
+TOOLS = (
+    (
+        "blender-mark-sharp-edges",
+        "Mark or clear sharp edges",
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "mode": {"type": "string"},
+                "selection": {"type": "string"},
+                "angle_degrees": {"type": "number"},
+            },
+            "required": ["name", "mode", "selection"],
+            "additionalProperties": False,
+        },
+        "_tool_mark_sharp_edges",
+    ),
+)
+
+
 def register(registry, bridge_request: Any, make_tool_result: Any, ToolError: Any) -> None:  # noqa: ANN001, N803
     reg = registry._register  # noqa: SLF001
 
@@ -28,7 +48,8 @@ if obj is None or obj.type != 'MESH':
 initial_mode = obj.mode
 restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT', 'SCULPT', 'VERTEX_PAINT', 'WEIGHT_PAINT', 'TEXTURE_PAINT'}} else 'OBJECT'
 bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 obj.select_set(True)
 bpy.context.view_layer.objects.active = obj
 try:
@@ -249,19 +270,4 @@ bpy.ops.mesh.separate(type={json.dumps(sep_type)})
         {"type": "object", "properties": {}, "additionalProperties": False},
         _mesh_bridge_edge_loops,
     )
-    reg(
-        "blender-mark-sharp-edges",
-        "Mark or clear sharp edges",
-        {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string"},
-                "mode": {"type": "string"},
-                "selection": {"type": "string"},
-                "angle_degrees": {"type": "number"},
-            },
-            "required": ["name", "mode", "selection"],
-            "additionalProperties": False,
-        },
-        registry._tool_mark_sharp_edges,  # noqa: SLF001
-    )
+    registry._register_table(TOOLS)  # noqa: SLF001
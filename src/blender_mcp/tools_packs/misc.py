@@ -1,10 +1,8 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "intent-resolve",
         "Resolve natural text to a tool call",
         {
@@ -13,9 +11,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["text"],
             "additionalProperties": False,
         },
-        registry._tool_intent_resolve,  # noqa: SLF001
-    )
-    reg(
+        "_tool_intent_resolve",
+    ),
+    (
         "intent-run",
         "Resolve natural text and run the resolved tool",
         {
@@ -24,9 +22,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["text"],
             "additionalProperties": False,
         },
-        registry._tool_intent_run,  # noqa: SLF001
-    )
-    reg(
+        "_tool_intent_run",
+    ),
+    (
         "replay-list",
         "List recent tool executions",
         {
@@ -34,9 +32,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "properties": {"limit": {"type": "integer"}},
             "additionalProperties": False,
         },
-        registry._tool_replay_list,  # noqa: SLF001
-    )
-    reg(
+        "_tool_replay_list",
+    ),
+    (
         "replay-run",
         "Re-run a previous tool execution by id",
         {
@@ -45,9 +43,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["id"],
             "additionalProperties": False,
         },
-        registry._tool_replay_run,  # noqa: SLF001
-    )
-    reg(
+        "_tool_replay_run",
+    ),
+    (
         "model-start",
         "Start an observation session",
         {
@@ -56,9 +54,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["goal"],
             "additionalProperties": False,
         },
-        registry._tool_model_start,  # noqa: SLF001
-    )
-    reg(
+        "_tool_model_start",
+    ),
+    (
         "model-step",
         "Record an observation step",
         {
@@ -73,9 +71,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["session", "intent"],
             "additionalProperties": False,
         },
-        registry._tool_model_step,  # noqa: SLF001
-    )
-    reg(
+        "_tool_model_step",
+    ),
+    (
         "model-end",
         "End an observation session",
         {
@@ -84,9 +82,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["session", "summary"],
             "additionalProperties": False,
         },
-        registry._tool_model_end,  # noqa: SLF001
-    )
-    reg(
+        "_tool_model_end",
+    ),
+    (
         "tool-request",
         "Request a new tool capability",
         {
@@ -123,9 +121,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["session", "need", "why"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request",
+    ),
+    (
         "tool-request-list",
         "List tool requests",
         {
@@ -138,9 +136,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_tool_request_list,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_list",
+    ),
+    (
         "tool-request-get",
         "Get a tool request by id",
         {
@@ -149,9 +147,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["id"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request_get,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_get",
+    ),
+    (
         "tool-request-update",
         "Update a tool request status/priority/tags",
         {
@@ -191,9 +189,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["id"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request_update,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_update",
+    ),
+    (
         "tool-request-delete",
         "Hard delete a tool request by id",
         {
@@ -202,9 +200,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["id"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request_delete,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_delete",
+    ),
+    (
         "tool-request-bulk-update",
         "Bulk update multiple tool requests",
         {
@@ -219,9 +217,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["ids", "patch"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request_bulk_update,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_bulk_update",
+    ),
+    (
         "tool-request-bulk-delete",
         "Bulk delete tool requests",
         {
@@ -230,9 +228,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["ids"],
             "additionalProperties": False,
         },
-        registry._tool_tool_request_bulk_delete,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_bulk_delete",
+    ),
+    (
         "tool-request-purge",
         "Purge tool requests by status and age",
         {
@@ -243,9 +241,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_tool_request_purge,  # noqa: SLF001
-    )
-    reg(
+        "_tool_tool_request_purge",
+    ),
+    (
         "tool-request-lint",
         "Lint tool requests for duplicates and implementation status",
         {
@@ -255,5 +253,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_tool_request_lint,  # noqa: SLF001
-    )
+        "_tool_tool_request_lint",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
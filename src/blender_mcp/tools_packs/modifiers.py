@@ -1,10 +1,8 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-add-modifier",
         "Add a modifier to an object",
         {
@@ -13,13 +11,14 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
                 "name": {"type": "string"},
                 "type": {"type": "string"},
                 "settings": {"type": "object"},
+                "apply": {"type": "boolean"},
             },
             "required": ["name", "type"],
             "additionalProperties": False,
         },
-        registry._tool_add_modifier,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_modifier",
+    ),
+    (
         "blender-apply-modifier",
         "Apply a modifier on an object",
         {
@@ -31,9 +30,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "modifier"],
             "additionalProperties": False,
         },
-        registry._tool_apply_modifier,  # noqa: SLF001
-    )
-    reg(
+        "_tool_apply_modifier",
+    ),
+    (
         "blender-list-modifiers",
         "List modifiers on an object",
         {
@@ -42,9 +41,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_list_modifiers,  # noqa: SLF001
-    )
-    reg(
+        "_tool_list_modifiers",
+    ),
+    (
         "blender-boolean",
         "Add a boolean modifier",
         {
@@ -57,5 +56,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "cutter"],
             "additionalProperties": False,
         },
-        registry._tool_boolean,  # noqa: SLF001
-    )
+        "_tool_boolean",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
@@ -1,16 +1,14 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-add-cube",
         "Add a cube at the origin",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_add_cube,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_cube",
+    ),
+    (
         "blender-move-object",
         "Move an object to (x,y,z)",
         {
@@ -24,9 +22,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "x", "y", "z"],
             "additionalProperties": False,
         },
-        registry._tool_move_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_move_object",
+    ),
+    (
         "blender-delete-object",
         "Delete an object by name",
         {
@@ -35,15 +33,21 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_delete_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_delete_object",
+    ),
+    (
         "macro-blockout",
         "Create a blockout cube scaled to (2,1,1) at origin",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_macro_blockout,  # noqa: SLF001
-    )
-    reg(
+        "_tool_macro_blockout",
+    ),
+    (
+        "macro-scene",
+        "Create a starter scene (cube, camera, sun light) with the bridge calls sent concurrently",
+        {"type": "object", "properties": {}, "additionalProperties": False},
+        "_tool_macro_scene",
+    ),
+    (
         "blender-add-cylinder",
         "Add a low-poly cylinder",
         {
@@ -57,9 +61,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_add_cylinder,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_cylinder",
+    ),
+    (
         "blender-add-sphere",
         "Add a sphere (UV or Ico)",
         {
@@ -76,9 +80,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_add_sphere,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_sphere",
+    ),
+    (
         "blender-add-plane",
         "Add a plane",
         {
@@ -86,9 +90,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "properties": {"size": {"type": "number"}, "location": {"type": "array"}, "name": {"type": "string"}},
             "additionalProperties": False,
         },
-        registry._tool_add_plane,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_plane",
+    ),
+    (
         "blender-add-cone",
         "Add a cone",
         {
@@ -103,9 +107,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_add_cone,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_cone",
+    ),
+    (
         "blender-add-torus",
         "Add a torus",
         {
@@ -120,9 +124,33 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_add_torus,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_torus",
+    ),
+    (
+        "scene-batch",
+        "Add several primitives (cube, cylinder, sphere, plane, cone, torus) in one bridge round-trip",
+        {
+            "type": "object",
+            "properties": {
+                "ops": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "primitive": {"type": "string", "enum": ["cube", "cylinder", "sphere", "plane", "cone", "torus"]},
+                            "arguments": {"type": "object"},
+                        },
+                        "required": ["primitive"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["ops"],
+            "additionalProperties": False,
+        },
+        "_tool_scene_batch",
+    ),
+    (
         "blender-create-empty",
         "Create an Empty object",
         {
@@ -137,9 +165,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["type"],
             "additionalProperties": False,
         },
-        registry._tool_create_empty,  # noqa: SLF001
-    )
-    reg(
+        "_tool_create_empty",
+    ),
+    (
         "blender-create-curve",
         "Create a curve object",
         {
@@ -155,9 +183,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["type"],
             "additionalProperties": False,
         },
-        registry._tool_create_curve,  # noqa: SLF001
-    )
-    reg(
+        "_tool_create_curve",
+    ),
+    (
         "blender-duplicate-object",
         "Duplicate an object",
         {
@@ -170,15 +198,25 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_duplicate_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_duplicate_object",
+    ),
+    (
         "blender-list-objects",
         "List all objects in the scene",
         {"type": "object", "properties": {}, "additionalProperties": False},
-        registry._tool_list_objects,  # noqa: SLF001
-    )
-    reg(
+        "_tool_list_objects",
+    ),
+    (
+        "blender-list-objects-full",
+        "List objects with location/rotation/scale/materials in one call (optional type and name filters)",
+        {
+            "type": "object",
+            "properties": {"type": {"type": "string"}, "name_contains": {"type": "string"}},
+            "additionalProperties": False,
+        },
+        "_tool_list_objects_full",
+    ),
+    (
         "blender-get-object-info",
         "Get info about an object",
         {
@@ -187,9 +225,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_get_object_info,  # noqa: SLF001
-    )
-    reg(
+        "_tool_get_object_info",
+    ),
+    (
         "blender-select-object",
         "Select an object by name",
         {
@@ -198,9 +236,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_select_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_select_object",
+    ),
+    (
         "blender-add-camera",
         "Add a camera",
         {
@@ -212,9 +250,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             },
             "additionalProperties": False,
         },
-        registry._tool_add_camera,  # noqa: SLF001
-    )
-    reg(
+        "_tool_add_camera",
+    ),
+    (
         "blender-add-light",
         "Add a point light",
         {
@@ -222,5 +260,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "properties": {"name": {"type": "string"}, "location": {"type": "array"}, "energy": {"type": "number"}},
             "additionalProperties": False,
         },
-        registry._tool_add_light,  # noqa: SLF001
-    )
+        "_tool_add_light",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
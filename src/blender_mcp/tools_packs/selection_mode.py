@@ -44,7 +44,8 @@ if obj is None or obj.type != 'MESH':
 initial_mode = obj.mode
 restore_mode = initial_mode if initial_mode in {{'EDIT', 'OBJECT', 'SCULPT', 'VERTEX_PAINT', 'WEIGHT_PAINT', 'TEXTURE_PAINT'}} else 'OBJECT'
 bpy.ops.object.mode_set(mode='OBJECT')
-bpy.ops.object.select_all(action='DESELECT')
+for _selected in bpy.context.selected_objects:
+    _selected.select_set(False)
 obj.select_set(True)
 bpy.context.view_layer.objects.active = obj
 try:
@@ -1,10 +1,8 @@
 from typing import Any
 
 
-def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
-    reg = registry._register  # noqa: SLF001
-
-    reg(
+TOOLS = (
+    (
         "blender-scale-object",
         "Scale an object (uniform or vector)",
         {
@@ -17,9 +15,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_scale_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_scale_object",
+    ),
+    (
         "blender-rotate-object",
         "Rotate an object (degrees)",
         {
@@ -28,9 +26,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "rotation"],
             "additionalProperties": False,
         },
-        registry._tool_rotate_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_rotate_object",
+    ),
+    (
         "blender-reset-transform",
         "Reset location/rotation/scale of an object",
         {
@@ -39,9 +37,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_reset_transform,  # noqa: SLF001
-    )
-    reg(
+        "_tool_reset_transform",
+    ),
+    (
         "blender-apply-transforms",
         "Apply transforms to an object",
         {
@@ -55,9 +53,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name"],
             "additionalProperties": False,
         },
-        registry._tool_apply_transforms,  # noqa: SLF001
-    )
-    reg(
+        "_tool_apply_transforms",
+    ),
+    (
         "blender-convert-object",
         "Convert an object to another type",
         {
@@ -66,9 +64,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "target"],
             "additionalProperties": False,
         },
-        registry._tool_convert_object,  # noqa: SLF001
-    )
-    reg(
+        "_tool_convert_object",
+    ),
+    (
         "blender-set-origin",
         "Set object origin",
         {
@@ -77,9 +75,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "type"],
             "additionalProperties": False,
         },
-        registry._tool_set_origin,  # noqa: SLF001
-    )
-    reg(
+        "_tool_set_origin",
+    ),
+    (
         "blender-set-3d-cursor",
         "Set 3D cursor location/rotation",
         {
@@ -88,9 +86,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["location"],
             "additionalProperties": False,
         },
-        registry._tool_set_3d_cursor,  # noqa: SLF001
-    )
-    reg(
+        "_tool_set_3d_cursor",
+    ),
+    (
         "blender-snap",
         "Snap object to grid/cursor/active",
         {
@@ -102,9 +100,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "target"],
             "additionalProperties": False,
         },
-        registry._tool_snap,  # noqa: SLF001
-    )
-    reg(
+        "_tool_snap",
+    ),
+    (
         "blender-align-to-axis",
         "Align transform components to an axis",
         {
@@ -113,9 +111,9 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["name", "axis"],
             "additionalProperties": False,
         },
-        registry._tool_align_to_axis,  # noqa: SLF001
-    )
-    reg(
+        "_tool_align_to_axis",
+    ),
+    (
         "blender-join-objects",
         "Join multiple objects into one",
         {
@@ -127,5 +125,10 @@ def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
             "required": ["objects", "name"],
             "additionalProperties": False,
         },
-        registry._tool_join_objects,  # noqa: SLF001
-    )
+        "_tool_join_objects",
+    ),
+)
+
+
+def register(registry, _: Any, __: Any, ___: Any) -> None:  # noqa: ANN001
+    registry._register_table(TOOLS)  # noqa: SLF001
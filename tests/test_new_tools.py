@@ -143,3 +143,80 @@ def test_tool_request_lint_duplicates(monkeypatch, tmp_path):
     payload = json.loads(res["content"][0]["text"])
     assert payload["ok"] is True
     assert payload["duplicates"]
+
+
+def test_add_modifier_sends_only_its_branch(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "blender-add-modifier",
+        {"name": "Cube", "type": "boolean", "settings": {"cutter": "Cutter", "operation": "difference"}},
+        log_action=False,
+    )
+    assert res["isError"] is False
+    code = payloads[-1]["code"]
+    compile(code, "<add-modifier>", "exec")
+    assert "type='BOOLEAN'" in code
+    assert "\n\n" not in code
+    assert "mod.operation = settings['operation']" in code
+    assert payloads[-1]["params"]["settings"]["operation"] == "DIFFERENCE"
+    assert "mod.thickness" not in code
+
+
+def test_add_modifier_apply_uses_one_exec(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append((path, payload))
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "blender-add-modifier",
+        {"name": "Cube", "type": "bevel", "settings": {"width": 0.05}, "apply": True},
+        log_action=False,
+    )
+    assert res["isError"] is False
+    assert len(payloads) == 1
+    code = payloads[0][1]["code"]
+    assert code.index("modifiers.new") < code.index("modifier_apply")
+    bad = registry.call_tool("blender-add-modifier", {"name": "Cube", "type": "bevel", "apply": "yes"}, log_action=False)
+    assert bad["isError"] is True
+
+
+def test_add_modifier_settings_table(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "blender-add-modifier",
+        {"name": "Cube", "type": "mirror", "settings": {"use_axis_x": True, "clipping": False, "merge_threshold": "0.01"}},
+        log_action=False,
+    )
+    assert res["isError"] is False
+    assert payloads[-1]["params"]["settings"] == {"use_axis_x": True, "use_clip": False, "merge_threshold": 0.01}
+    registry.call_tool("blender-add-modifier", {"name": "Cube", "type": "screw", "settings": {}}, log_action=False)
+    assert payloads[-1]["params"]["settings"] == {"angle": 360.0, "axis": "Z"}
+    for mod_type, settings in (
+        ("array", {"count": float("inf")}),
+        ("bevel", {"segments": "many"}),
+        ("triangulate", {"quad_method": "nope"}),
+        ("lattice", {}),
+        ("mirror", {"merge": 1}),
+    ):
+        res = registry.call_tool(
+            "blender-add-modifier", {"name": "Cube", "type": mod_type, "settings": settings}, log_action=False
+        )
+        assert res["isError"] is True
@@ -0,0 +1,403 @@
+import json
+import mmap
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from blender_mcp import tools
+
+
+def test_register_rejects_invalid_names():
+    registry = tools.ToolRegistry()
+    schema = {"type": "object", "properties": {}, "additionalProperties": False}
+    for bad in ("", "has space", "x" * 65, "trailing\n", "é"):
+        with pytest.raises(ValueError):
+            registry._register(bad, "bad", schema, registry._tool_health)
+    registry._register("ok_name-1", "ok", schema, registry._tool_health)
+    assert registry.call_tool("ok_name-1", {}, log_action=False)["isError"] is False
+
+
+def test_split_bridge_url():
+    assert tools._split_bridge_url("http://127.0.0.1:8765") == ("http", "127.0.0.1", 8765, "")
+    assert tools._split_bridge_url("http://localhost/blender/") == ("http", "localhost", 80, "/blender")
+
+
+def test_get_timeout_uses_cached_env(monkeypatch):
+    monkeypatch.setattr(tools, "_ENV_TIMEOUT", None)
+    assert tools._get_timeout(0.5) == 0.5
+    monkeypatch.setattr(tools, "_ENV_TIMEOUT", 2.0)
+    assert tools._get_timeout(0.5) == 2.0
+
+
+def test_utc_timestamp_is_iso_and_ids_are_unique():
+    from datetime import datetime, timezone
+
+    ts = tools._utc_timestamp()
+    parsed = datetime.fromisoformat(ts)
+    assert parsed.tzinfo is not None
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+    ids = {tools._new_action_id() for _ in range(100)}
+    assert len(ids) == 100
+    assert all(len(i) == 32 for i in ids)
+
+
+def test_unknown_tool_raises_method_not_found():
+    registry = tools.ToolRegistry()
+    with pytest.raises(tools.ToolError) as exc:
+        registry.call_tool("no-such-tool", {}, log_action=False)
+    assert exc.value.code == -32601
+    assert set(registry._handlers) == set(registry._tools)
+
+
+def test_schemas_share_identical_fragments():
+    registry = tools.ToolRegistry()
+    empties = [
+        t["inputSchema"]
+        for t in registry.list_tools()
+        if t["inputSchema"] == {"type": "object", "properties": {}, "additionalProperties": False}
+    ]
+    assert len(empties) > 1
+    assert all(e is empties[0] for e in empties)
+    strings = [
+        prop
+        for t in registry.list_tools()
+        for prop in (t["inputSchema"].get("properties") or {}).values()
+        if prop == {"type": "string"}
+    ]
+    assert all(p is strings[0] for p in strings)
+
+
+def test_loads_body_accepts_bytes_with_and_without_orjson(monkeypatch):
+    body = '{"ok": true, "result": ["Cubé"]}'.encode("utf-8")
+    assert tools._loads_body(body) == {"ok": True, "result": ["Cubé"]}
+    monkeypatch.setattr(tools, "orjson", None)
+    assert tools._loads_body(body) == {"ok": True, "result": ["Cubé"]}
+    with pytest.raises(ValueError):
+        tools._loads_body(b"not json")
+
+
+def test_append_recreates_removed_log_dir(tmp_path):
+    target = tmp_path / "logs" / "actions.jsonl"
+    tools._atomic_append_jsonl(target, "a\n")
+    target.unlink()
+    target.parent.rmdir()
+    tools._atomic_append_jsonl(target, "b\n")
+    assert target.read_text(encoding="utf-8") == "b\n"
+
+
+def test_append_lock_file_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "_APPEND_FD_ENABLED", False)
+    target = tmp_path / "fallback.jsonl"
+    tools._atomic_append_jsonl(target, "a\n")
+    tools._atomic_append_jsonl(str(target), "b\n")
+    assert target.read_text(encoding="utf-8") == "a\nb\n"
+    assert not (tmp_path / "fallback.jsonl.lock").exists()
+
+
+def test_pack_tables_reference_registry_methods():
+    from blender_mcp import tools_packs
+
+    registry = tools.ToolRegistry()
+    tables = [registry._ADMIN_TOOLS]
+    for pack in (tools_packs.core, tools_packs.misc, tools_packs.transforms, tools_packs.primitives_curves):
+        tables.append(pack.TOOLS)
+    for table in tables:
+        for name, _desc, schema, handler_name in table:
+            assert callable(getattr(registry, handler_name))
+            assert registry._tools[name].input_schema == schema
+
+
+def test_invalid_name_error_is_reused_without_growing_traceback():
+    import traceback
+
+    registry = tools.ToolRegistry()
+    depths = []
+    for _ in range(3):
+        with pytest.raises(tools.ToolError) as exc:
+            registry.call_tool(123, {}, log_action=False)
+        assert exc.value is tools._ERR_INVALID_NAME
+        assert exc.value.code == -32602
+        depths.append(len(traceback.extract_tb(exc.value.__traceback__)))
+    assert depths[0] == depths[-1]
+
+
+def test_list_tools_cached_and_invalidated():
+    registry = tools.ToolRegistry()
+    assert registry.list_tools() is registry.list_tools()
+    schema = {"type": "object", "properties": {}, "additionalProperties": False}
+    registry._register("late-tool", "late", schema, registry._tool_health)
+    assert registry.list_tools()[-1]["name"] == "late-tool"
+
+
+def test_fast_uuid_is_version4_and_unique():
+    import uuid
+
+    values = [tools._fast_uuid() for _ in range(600)]
+    assert len(set(values)) == len(values)
+    for value in values[:5]:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert str(parsed) == value
+
+
+def test_append_action_summary_handles_odd_result_shapes(monkeypatch):
+    lines = []
+    monkeypatch.setattr(tools, "_write_log_line", lambda path, line: lines.append(json.loads(line)))
+    tools._append_action("t", {}, {"content": [{"type": "text", "text": "x" * 300}]})
+    tools._append_action("t", {}, {"content": []})
+    tools._append_action("t", {}, {"content": {"text": "not a list"}})
+    tools._append_action("t", {}, {"content": ["plain"]})
+    tools._append_action("t", {}, {"content": [{"text": 5}], "isError": True})
+    assert [entry["summary"] for entry in lines] == ["x" * 200, "", "", "", ""]
+    assert lines[-1]["isError"] is True
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, format, *args):  # noqa: A003
+        return
+
+    def _reply(self, payload):
+        type(self).connections.add(self.client_address)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        self._reply({"ok": True, "blender": "test"})
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        self._reply({"ok": True, "result": json.loads(self.rfile.read(length))})
+
+
+def test_bridge_requests_reuse_one_connection(monkeypatch):
+    _KeepAliveHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = tools._BridgeConnectionPool("http", "127.0.0.1", server.server_address[1], "")
+    monkeypatch.setattr(tools, "_BRIDGE_POOL", pool)
+    try:
+        assert tools._bridge_get("/ping")["blender"] == "test"
+        for i in range(3):
+            assert tools._bridge_request("/exec", payload={"code": str(i)})["result"] == {"code": str(i)}
+        assert len(_KeepAliveHandler.connections) == 1
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+class _DroppingHandler(_KeepAliveHandler):
+    # the second POST is read and then dropped without a reply, as if the bridge went away mid-call
+    posts = 0
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        type(self).posts += 1
+        if type(self).posts == 2:
+            self.close_connection = True
+            return
+        self._reply({"ok": True})
+
+
+def test_bridge_pool_never_resends_a_post_the_bridge_read(monkeypatch):
+    _DroppingHandler.posts = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DroppingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = tools._BridgeConnectionPool("http", "127.0.0.1", server.server_address[1], "")
+    monkeypatch.setattr(tools, "_BRIDGE_POOL", pool)
+    try:
+        assert tools._bridge_request("/exec", payload={"code": "a"}, timeout=1.0) == {"ok": True}
+        with pytest.raises(tools.ToolError):
+            tools._bridge_request("/exec", payload={"code": "b"}, timeout=1.0)
+        assert _DroppingHandler.posts == 2
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+class _ClosingHandler(_KeepAliveHandler):
+    def do_GET(self):  # noqa: N802
+        # replies as keep-alive, then closes the socket the client will find in its pool
+        self._reply({"ok": True, "blender": "test"})
+        self.close_connection = True
+
+
+def test_bridge_pool_skips_idle_sockets_the_bridge_closed(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ClosingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = tools._BridgeConnectionPool("http", "127.0.0.1", server.server_address[1], "")
+    monkeypatch.setattr(tools, "_BRIDGE_POOL", pool)
+    try:
+        assert tools._bridge_get("/ping")["ok"] is True
+        time.sleep(0.05)
+        assert tools._bridge_request("/exec", payload={"code": "x"}, timeout=1.0)["result"] == {"code": "x"}
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_bridge_unreachable_maps_to_tool_error(monkeypatch):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    monkeypatch.setattr(tools, "_BRIDGE_POOL", tools._BridgeConnectionPool("http", "127.0.0.1", port, ""))
+    with pytest.raises(tools.ToolError) as exc:
+        tools._bridge_request("/exec", payload={"code": "x"}, timeout=0.2)
+    assert str(exc.value) == "Blender bridge unreachable"
+
+
+def test_read_actions_parses_only_appended_lines(monkeypatch, tmp_path):
+    runs_file = tmp_path / "actions.jsonl"
+    monkeypatch.setattr(tools, "RUNS_FILE", runs_file)
+    monkeypatch.setattr(tools, "RUNS_GZIP", False)
+    registry = tools.ToolRegistry()
+    assert registry._read_actions() == []
+
+    runs_file.write_text(json.dumps({"id": "a"}) + "\n", encoding="utf-8")
+    first = registry._read_actions()
+    assert [a["id"] for a in first] == ["a"]
+    assert registry._read_actions() is first
+
+    loads = []
+    real_loads = tools._loads_body
+    monkeypatch.setattr(tools, "_loads_body", lambda body: loads.append(body) or real_loads(body))
+    with runs_file.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"id": "b"}) + "\n" + '{"id": "c"')
+    assert [a["id"] for a in registry._read_actions()] == ["a", "b"]
+    assert loads == [b'{"id": "b"}']
+    with runs_file.open("a", encoding="utf-8") as fh:
+        fh.write("}\n")
+    assert [a["id"] for a in registry._read_actions()] == ["a", "b", "c"]
+
+    assert set(registry._actions_by_id) == {"a", "b", "c"}
+
+    runs_file.write_text(json.dumps({"id": "z"}) + "\n", encoding="utf-8")
+    assert [a["id"] for a in registry._read_actions()] == ["z"]
+    assert set(registry._actions_by_id) == {"z"}
+
+
+def test_tail_jsonl_matches_full_read(tmp_path):
+    runs_file = tmp_path / "actions.jsonl"
+    lines = [json.dumps({"id": f"a{i}", "pad": "x" * (i % 7)}) for i in range(40)]
+    lines.insert(20, "not json")
+    runs_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    full = [json.loads(line) for line in lines if line != "not json"]
+    for n in (1, 5, 25, 100):
+        assert tools._tail_jsonl(runs_file, n) == full[-n:]
+
+
+def test_replay_list_reads_tail_on_cold_cache(monkeypatch, tmp_path):
+    runs_file = tmp_path / "actions.jsonl"
+    monkeypatch.setattr(tools, "RUNS_FILE", runs_file)
+    monkeypatch.setattr(tools, "RUNS_GZIP", False)
+    runs_file.write_text("".join(json.dumps({"id": f"a{i}", "tool": "health"}) + "\n" for i in range(10)), encoding="utf-8")
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("replay-list", {"limit": 2}, log_action=False)
+    assert [line.split(" | ")[0] for line in res["content"][0]["text"].splitlines()] == ["a9", "a8"]
+    assert registry._actions_cache[0] is None
+
+
+def test_validate_vector_fast_path_and_coercion():
+    registry = tools.ToolRegistry()
+    floats = [1.0, 2.0, 3.0]
+    assert registry._validate_vector(floats, name="v") is floats
+    coerced = registry._validate_vector([1, "2", 3.5], name="v")
+    assert coerced == [1.0, 2.0, 3.5] and all(type(v) is float for v in coerced)
+    with pytest.raises(tools.ToolError):
+        registry._validate_vector([1.0, 2.0], name="v")
+
+
+def test_parse_jsonl_reads_mmap_slices(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(b'{"id": "a"}\r\n\nbad\n{"id": "b"}\n{"id": "c"}')
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert tools._parse_jsonl(mm) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        assert tools._parse_jsonl(mm, 0, mm.rfind(b"\n") + 1) == [{"id": "a"}, {"id": "b"}]
+    assert tools._tail_jsonl(path, 2) == [{"id": "b"}, {"id": "c"}]
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert tools._tail_jsonl(empty, 5) == []
+
+
+def test_dumps_body_matches_json_and_falls_back():
+    payload = {"code": "import bpy\nprint('é')", "params": {"name": "Cube", "location": [1.0, 2.0, 3.0]}}
+    assert json.loads(tools._dumps_body(payload)) == payload
+    huge = {"n": 2**70}
+    assert json.loads(tools._dumps_body(huge)) == huge
+
+
+def test_code_literal_is_a_python_literal():
+    for value in ['Cube "A" \\ {x}', "Déplacé\n", ["A", "B"], 2**70, 1.5]:
+        assert eval(tools._code_literal(value)) == value
+
+
+def test_tool_results_carry_ok_without_copy(monkeypatch):
+    registry = tools.ToolRegistry()
+    built = []
+    real = tools._make_tool_result
+    monkeypatch.setattr(tools, "_make_tool_result", lambda *a, **k: built.append(real(*a, **k)) or built[-1])
+    res = registry.call_tool("health", {}, log_action=False)
+    assert res is built[0]
+    assert list(res) == ["content", "isError", "ok"] and res["ok"] is True
+    assert tools._make_tool_result("x", is_error=True)["ok"] is False
+
+
+def test_dumps_line_is_one_utf8_record():
+    entry = {"id": "x", "summary": "Déplacé", "arguments": {"n": 2**70}}
+    data = tools._dumps_line(entry)
+    assert data.endswith(b"\n") and data.count(b"\n") == 1
+    assert "Déplacé".encode("utf-8") in data
+    assert json.loads(data) == entry
+
+
+def test_resolve_intent_priorities():
+    registry = tools.ToolRegistry()
+    resolve = registry._resolve_intent
+    assert resolve("Please ADD CUBE")["tool"] == "blender-add-cube"
+    assert resolve("ajoute un cube")["tool"] == "blender-add-cube"
+    assert resolve("delete cube then add cube")["tool"] == "blender-add-cube"
+    assert resolve("déplace cube 1 2 3")["arguments"] == {"name": "Cube", "x": 1.0, "y": 2.0, "z": 3.0}
+    assert resolve("remove cube")["tool"] == "blender-delete-object"
+    assert resolve("make a macro blockout")["tool"] == "macro-blockout"
+    with pytest.raises(tools.ToolError):
+        resolve("please move cube 1 2 3")
+    assert resolve("move cube to  -1.5   .5 1e1 ")["arguments"] == {"name": "Cube", "x": -1.5, "y": 0.5, "z": 10.0}
+    with pytest.raises(tools.ToolError):
+        resolve("move cube 2 3")
+
+
+def test_resolve_intent_exec_keeps_code_casing(monkeypatch):
+    monkeypatch.setattr(tools, "DEBUG_EXEC_ENABLED", True)
+    registry = tools.ToolRegistry()
+    resolved = registry._resolve_intent("  EXEC: print('Hi')  ")
+    assert resolved["tool"] == "blender-exec"
+    assert resolved["arguments"] == {"code": "print('Hi')"}
+
+
+def test_intent_run_targets_exclude_intent_tools():
+    registry = tools.ToolRegistry()
+    assert "blender-add-cube" in registry._intent_targets
+    assert not registry._intent_targets & {"intent-run", "intent-resolve"}
+    registry._register("late-tool", "x", {"type": "object"}, lambda _: tools._make_tool_result("ok"))
+    assert "late-tool" in registry._intent_targets
@@ -1,3 +1,4 @@
+import gzip
 import json
 import os
 import subprocess
@@ -106,3 +107,47 @@ def test_replay_run_with_bridge_down(tmp_path):
         assert result.get("isError") is True
     finally:
         _cleanup_proc(proc)
+
+
+def test_replay_with_gzip_logs(tmp_path):
+    gz_file = tmp_path / "actions.jsonl.gz"
+    proc = _start_server({"BLENDER_MCP_RUNS_GZIP": "1", "BLENDER_MCP_RUNS_DIR": str(tmp_path)})
+    try:
+        _send(proc, {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "health", "arguments": {}}})
+        _read_line(proc, timeout=1.0)
+        assert gz_file.exists(), "compressed runs file should be created"
+        with gzip.open(gz_file, "rt", encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+        assert json.loads(lines[-1])["tool"] == "health"
+
+        _send(
+            proc,
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "replay-list", "arguments": {"limit": 5}}},
+        )
+        line = _read_line(proc, timeout=1.0)
+        assert line is not None
+        result = json.loads(line)["result"]
+        assert result.get("isError") is False
+        assert "health" in result["content"][0]["text"]
+    finally:
+        _cleanup_proc(proc)
+
+
+def test_replay_with_async_log_writer(tmp_path):
+    runs_file = tmp_path / "actions.jsonl"
+    proc = _start_server({"BLENDER_MCP_ASYNC_LOG": "1", "BLENDER_MCP_RUNS_DIR": str(tmp_path)})
+    try:
+        _send(proc, {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "health", "arguments": {}}})
+        _read_line(proc, timeout=1.0)
+        _send(
+            proc,
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "replay-list", "arguments": {"limit": 5}}},
+        )
+        line = _read_line(proc, timeout=1.0)
+        assert line is not None
+        result = json.loads(line)["result"]
+        assert "health" in result["content"][0]["text"]
+    finally:
+        _cleanup_proc(proc)
+    lines = runs_file.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[-1])["tool"] == "health"
@@ -209,3 +209,130 @@ def test_corrupted_jsonl_lines_skipped(monkeypatch, tmp_path):
     with pytest.warns(UserWarning, match=r"tool-request: skipping corrupted line"):
         registry = tools.ToolRegistry()
     assert "good" in registry._tool_request_store.requests
+
+
+def test_list_order_index_tracks_mutations(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    registry = tools.ToolRegistry()
+    store = registry._tool_request_store
+    ids = []
+    for n in range(4):
+        res = registry.call_tool("tool-request", {"session": f"s{n}", "need": f"need{n}", "why": "w"}, log_action=False)
+        ids.append(json.loads(res["content"][0]["text"])["id"])
+    registry.call_tool("tool-request-delete", {"id": ids[1]}, log_action=False)
+    expected = sorted(
+        (it for it in store.requests.values()), key=lambda i: (i.get("created_at", ""), i.get("id", "")), reverse=True
+    )
+    first = store.list({}, limit=2)
+    second = store.list({}, limit=2, cursor=first["cursor"])
+    assert [it["id"] for it in first["items"] + second["items"]] == [it["id"] for it in expected]
+    assert second["cursor"] is None
+    assert len(store._order) == len(store.requests) == 3
+    reloaded = tools.ToolRegistry()._tool_request_store
+    assert reloaded._order == store._order
+
+
+def test_list_q_search_follows_updates(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("tool-request", {"session": "s1", "need": "Alpha Need", "why": "w"}, log_action=False)
+    req_id = json.loads(res["content"][0]["text"])["id"]
+    store = registry._tool_request_store
+    assert [it["id"] for it in store.list({"q": "alpha"})["items"]] == [req_id]
+    store.update(req_id, {"need": "Beta need"}, mode="merge")
+    assert store.list({"q": "alpha"})["items"] == []
+    assert [it["id"] for it in store.list({"q": "BETA"})["items"]] == [req_id]
+    assert "_search_blob" not in store.requests[req_id]
+
+
+def test_updates_log_compacted_past_threshold(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    monkeypatch.setattr(tools, "TOOL_REQUEST_COMPACT_MIN", 3)
+    registry = tools.ToolRegistry()
+    ids = []
+    for n in range(2):
+        res = registry.call_tool("tool-request", {"session": "s", "need": f"need{n}", "why": "w"}, log_action=False)
+        ids.append(json.loads(res["content"][0]["text"])["id"])
+    store = registry._tool_request_store
+    updates_file = tmp_path / "tool_requests_updates.jsonl"
+    for status in ("triaged", "needs_info", "triaged", "accepted"):
+        store.update(ids[0], {"status": status}, mode="merge")
+    assert len(updates_file.read_text(encoding="utf-8").splitlines()) == 4
+    store.delete(ids[1])
+    assert updates_file.read_text(encoding="utf-8") == ""
+    base = [json.loads(line) for line in (tmp_path / "tool_requests.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [it["id"] for it in base] == [ids[0]]
+    assert base[0]["status"] == "accepted"
+    store.update(ids[0], {"status": "implemented"}, mode="merge")
+    reloaded = tools.ToolRegistry()._tool_request_store
+    assert list(reloaded.requests) == [ids[0]]
+    assert reloaded.requests[ids[0]]["status"] == "implemented"
+    assert reloaded.requests[ids[0]]["revision"] == store.requests[ids[0]]["revision"]
+
+
+def test_list_field_indexes_follow_updates(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    registry = tools.ToolRegistry()
+    store = registry._tool_request_store
+    a = store.create({"session": "S1", "need": "a", "why": "w", "domain": "mesh", "priority": "high"})["id"]
+    b = store.create({"session": "s1", "need": "b", "why": "w", "domain": "Mesh", "api_probe": {"op": "x"}})["id"]
+    c = store.create({"session": "s2", "need": "c", "why": "w", "domain": "object"})["id"]
+
+    def ids(filters):
+        return {it["id"] for it in store.list(filters)["items"]}
+
+    assert ids({"session": "s1", "domain": "MESH"}) == {a, b}
+    assert ids({"priority": ["high", "low"]}) == {a}
+    assert ids({"has_api_probe": True}) == {b}
+    assert ids({"has_api_probe": False, "session": "s1"}) == {a}
+    store.update(b, {"status": "triaged", "api_probe": None}, mode="merge")
+    assert ids({"status": "triaged"}) == {b}
+    assert ids({"has_api_probe": True}) == set()
+    store.delete(a)
+    assert ids({"domain": "mesh"}) == {b}
+    assert ids({"status": ["pending"]}) == {c}
+    reloaded = tools.ToolRegistry()._tool_request_store
+    assert reloaded._by_field == store._by_field
+    assert reloaded._flagged == store._flagged
+
+
+def test_merge_payload_fast_paths(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    store = tools.ToolRegistry()._tool_request_store
+    base = {
+        "api_probe": {"op": "a", "args": {"x": 1}},
+        "tags": ["a", "b"],
+        "examples": [{"n": 1}],
+        "need": "n",
+    }
+    changes = {"api_probe": {"args": {"y": 2}, "extra": True}, "tags": ["b", "c", "c"], "examples": [{"n": 1}, {"n": 2}]}
+    merged = store._merge_payload(base, changes, mode="merge", list_mode="append")
+    assert merged == {
+        "api_probe": {"op": "a", "args": {"x": 1, "y": 2}, "extra": True},
+        "tags": ["a", "b", "c"],
+        "examples": [{"n": 1}, {"n": 2}],
+        "need": "n",
+    }
+    assert base["api_probe"] == {"op": "a", "args": {"x": 1}}
+    assert base["tags"] == ["a", "b"]
+    replaced = store._merge_payload(base, {"api_probe": {"op": "z"}, "tags": None}, mode="replace", list_mode="replace")
+    assert replaced == {"api_probe": {"op": "z"}, "tags": None, "examples": [{"n": 1}], "need": "n"}
+
+
+@pytest.mark.skipif(tools.fcntl is None, reason="compaction needs fcntl.flock")
+def test_compaction_keeps_other_store_requests(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    monkeypatch.setattr(tools, "TOOL_REQUEST_COMPACT_MIN", 2)
+    store_a = tools.ToolRequestStore()
+    store_b = tools.ToolRequestStore()
+    mine = store_b.create({"session": "b", "need": "mine", "why": "w"})["id"]
+    theirs = store_a.create({"session": "a", "need": "theirs", "why": "w"})["id"]
+    store_a.update(theirs, {"status": "triaged"}, mode="merge")
+    for status in ("accepted", "needs_info", "accepted", "needs_info", "triaged"):
+        store_b.update(mine, {"status": status}, mode="merge")
+    assert (tmp_path / "tool_requests_updates.jsonl").read_text(encoding="utf-8") == ""
+    assert store_b.requests[theirs]["status"] == "triaged"
+    fresh = tools.ToolRequestStore()
+    assert set(fresh.requests) == {mine, theirs}
+    assert fresh.requests[theirs]["status"] == "triaged"
+    assert fresh.requests[mine]["status"] == "triaged"
@@ -59,3 +59,18 @@ def test_tool_requests_clear_deletes_files(monkeypatch, tmp_path):
     assert payload["ok"] is True
     assert not tmp_path.joinpath("tool_requests.jsonl").exists()
     assert not tmp_path.joinpath("tool_request_updates.jsonl").exists()
+
+
+def test_tool_requests_clear_then_list(monkeypatch, tmp_path):
+    _setup_env(monkeypatch, tmp_path)
+    reg = tools.ToolRegistry()
+    reg.call_tool("tool-request", {"session": "s", "need": "n", "why": "w", "api_probe": {"op": "x"}}, log_action=False)
+    reg.call_tool("tool-requests-clear", {"confirm": True}, log_action=False)
+    for filters in ({}, {"status": "pending"}, {"domain": "system"}, {"has_api_probe": True}, {"q": "n"}):
+        res = reg.call_tool("tool-request-list", {"filters": filters}, log_action=False)
+        assert res["isError"] is False
+        assert json.loads(res["content"][0]["text"])["items"] == []
+    created = reg.call_tool("tool-request", {"session": "s", "need": "again", "why": "w"}, log_action=False)
+    new_id = json.loads(created["content"][0]["text"])["id"]
+    res = reg.call_tool("tool-request-list", {"filters": {"status": "pending"}}, log_action=False)
+    assert [it["id"] for it in json.loads(res["content"][0]["text"])["items"]] == [new_id]
@@ -1,4 +1,8 @@
+import importlib.util
+import json
 import sys
+import threading
+import types
 from pathlib import Path
 import tempfile
 
@@ -45,6 +49,27 @@ def test_assign_image_texture(monkeypatch, tmp_path):
     assert result["isError"] is False
 
 
+def test_assign_image_texture_emits_only_target_config(monkeypatch):
+    codes = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        codes.append(payload["code"])
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    result = registry.call_tool(
+        "blender-assign-image-texture",
+        {"object": "Cube", "material": "Mat", "image_path": "/tmp/r.png", "target": "roughness"},
+        log_action=False,
+    )
+    assert result["isError"] is False
+    assert 'colorspace_settings.name = "Non-Color"' in codes[0]
+    assert 'bsdf.inputs.get("Roughness")' in codes[0]
+    assert "sRGB" not in codes[0]
+    compile(codes[0], "<texture>", "exec")
+
+
 def test_parent_and_move_and_align(monkeypatch):
     calls = []
 
@@ -77,3 +102,163 @@ def test_missing_object_errors(monkeypatch):
     assert result["isError"] is True
     result2 = registry.call_tool("blender-parent", {"child": "Missing", "parent": "Other"}, log_action=False)
     assert result2["isError"] is True
+
+
+def test_exec_tools_send_fixed_source_with_params(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-rename-object", {"old_name": "Cube", "new_name": "Box"}, log_action=False)
+    registry.call_tool("blender-rename-object", {"old_name": 'Box "2"', "new_name": "Crate"}, log_action=False)
+    registry.call_tool("blender-parent", {"child": "Cube", "parent": "Root"}, log_action=False)
+    assert payloads[0]["code"] == payloads[1]["code"]
+    assert payloads[1]["params"] == {"old_name": 'Box "2"', "new_name": "Crate"}
+    assert "Root" not in payloads[2]["code"]
+    assert payloads[2]["params"] == {"child_name": "Cube", "parent_name": "Root", "keep_transform": True}
+    for payload in payloads:
+        compile(payload["code"], "<exec>", "exec")
+
+
+def test_create_material_validates_base_color(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    ok = registry.call_tool("blender-create-material", {"name": "Red", "base_color": [1, "0.5", 0, 1]}, log_action=False)
+    assert ok["isError"] is False
+    assert payloads[0]["params"]["base_color"] == [1.0, 0.5, 0.0, 1.0]
+    for bad in ([1, 0, 0], [1, "x", 0, 1], [1, None, 0, 1]):
+        res = registry.call_tool("blender-create-material", {"name": "Bad", "base_color": bad}, log_action=False)
+        assert res["isError"] is True
+
+
+def test_known_missing_object_skips_bridge(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        if payload.get("code") == tools._LIST_OBJECTS_CODE:
+            return {"ok": True, "result": [{"name": "Cube", "type": "MESH"}, {"name": "Root", "type": "EMPTY"}]}
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-list-objects", {}, log_action=False)
+    missing = registry.call_tool("blender-parent", {"child": "Cube", "parent": "Ghost"}, log_action=False)
+    assert missing["isError"] is True
+    assert missing["content"][0]["text"] == "Parent not found"
+    assert len(calls) == 1
+    ok = registry.call_tool("blender-parent", {"child": "Cube", "parent": "Root"}, log_action=False)
+    assert ok["isError"] is False
+    assert len(calls) == 2
+    # a tool that may create objects invalidates the listing, so the next check goes to Blender
+    registry.call_tool("blender-add-cube", {}, log_action=False)
+    registry.call_tool("blender-align-to-axis", {"name": "Ghost", "axis": "Z"}, log_action=False)
+    assert len(calls) == 4
+
+
+def test_export_polls_queued_job(monkeypatch):
+    calls = []
+    polls = iter([{"ok": True, "id": "job-1", "pending": True}, {"ok": True, "id": "job-1"}])
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        if path == "/exec":
+            return {"ok": True, "id": "job-1", "pending": True}
+        return next(polls)
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    monkeypatch.setattr(tools.time, "sleep", lambda _: None)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("blender-export", {"path": "/tmp/out.fbx", "format": "fbx"}, log_action=False)
+    assert res["isError"] is False
+    assert calls[0][1]["wait"] is False
+    assert [path for path, _ in calls[1:]] == ["/jobs/job-1", "/jobs/job-1"]
+
+
+def test_export_without_wait_returns_job(monkeypatch):
+    replies = {
+        "/exec": {"ok": True, "id": "job-2", "pending": True},
+        "/jobs/job-2": {"ok": False, "id": "job-2", "error": "disk full"},
+    }
+    monkeypatch.setattr(tools, "_bridge_request", lambda path, payload=None, timeout=0.5: replies[path])
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "blender-export", {"path": "/tmp/out.glb", "format": "gltf", "wait": False}, log_action=False
+    )
+    assert json.loads(res["content"][0]["text"]) == {"job_id": "job-2", "status": "pending"}
+    status = registry.call_tool("blender-export-status", {"job_id": "job-2"}, log_action=False)
+    assert status["isError"] is True
+    assert json.loads(status["content"][0]["text"])["error"] == "disk full"
+
+
+def test_list_materials_reuses_listing_after_create(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        if payload.get("code") == tools._LIST_MATERIALS_CODE:
+            return {"ok": True, "result": ["Base"]}
+        if payload.get("code") == tools._CREATE_MATERIAL_CODE:
+            return {"ok": True, "result": payload["params"]["name"] + ".001"}
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-list-materials", {}, log_action=False)
+    registry.call_tool("blender-create-material", {"name": "Red"}, log_action=False)
+    mats = registry.call_tool("blender-list-materials", {}, log_action=False)
+    assert mats["content"][0]["text"] == "Base, Red.001"
+    assert len(calls) == 2
+    # any tool that may touch materials drops the listing
+    registry.call_tool("blender-add-cube", {}, log_action=False)
+    registry.call_tool("blender-list-materials", {}, log_action=False)
+    assert len(calls) == 4
+
+
+def test_export_status_unknown_job(monkeypatch):
+    reply = {"ok": False, "id": "job-9", "error": "Unknown job", "error_type": "unknown_job"}
+    monkeypatch.setattr(tools, "_bridge_request", lambda path, payload=None, timeout=0.5: reply)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("blender-export-status", {"job_id": "job-9"}, log_action=False)
+    assert res["isError"] is True
+    assert json.loads(res["content"][0]["text"]) == {"job_id": "job-9", "status": "unknown", "error": "Unknown job"}
+
+
+def _load_bridge(monkeypatch):
+    monkeypatch.setitem(sys.modules, "bpy", types.ModuleType("bpy"))
+    spec = importlib.util.spec_from_file_location("blender_bridge_under_test", ROOT / "bridge" / "blender_bridge.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_bridge_job_status_repeats_and_unknown(monkeypatch):
+    bridge = _load_bridge(monkeypatch)
+    replies = []
+    handler = types.SimpleNamespace(
+        _send_json=lambda payload, status=200: replies.append((status, payload)),
+        _job_reply=bridge.BridgeHandler._job_reply,
+    )
+    job = {"id": "job-1", "done_event": threading.Event(), "code": "result = 1"}
+    bridge.BRIDGE_STATE["jobs"]["job-1"] = job
+    bridge.BridgeHandler._job_status(handler, "job-1")
+    assert replies[-1] == (200, {"ok": True, "id": "job-1", "pending": True})
+    bridge._run_job(job)
+    bridge.BridgeHandler._job_status(handler, "job-1")
+    bridge.BridgeHandler._job_status(handler, "job-1")
+    assert replies[-2] == replies[-1] == (200, {"ok": True, "id": "job-1", "result": 1})
+    bridge.BridgeHandler._job_status(handler, "nope")
+    assert replies[-1] == (200, {"ok": False, "id": "nope", "error": "Unknown job", "error_type": "unknown_job"})
+    job["finished_at"] -= bridge.BRIDGE_STATE["job_ttl"] + 1
+    bridge.BridgeHandler._job_status(handler, "job-1")
+    assert replies[-1][1]["error_type"] == "unknown_job"
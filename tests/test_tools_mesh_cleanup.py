@@ -49,3 +49,20 @@ def test_mesh_cleanup_non_mesh(monkeypatch):
     assert result["isError"] is True
     assert isinstance(result.get("content"), list)
     assert result["content"]
+
+
+def test_mesh_cleanup_uses_bmesh_ops(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-recalc-normals", {"name": "Cube", "inside": True}, log_action=False)
+    registry.call_tool("blender-triangulate", {"name": "Cube", "method": "shortest_diagonal"}, log_action=False)
+    assert [p["fn"] for p in calls] == ["mesh_ops", "mesh_ops"]
+    assert calls[0]["args"]["ops"] == [{"op": "recalc_normals", "args": {"inside": True}}]
+    assert calls[1]["args"]["ops"] == [{"op": "triangulate", "args": {"quad_method": "SHORT_EDGE"}}]
+    assert "bpy.ops.mesh" not in tools._BRIDGE_FNS_SOURCE
@@ -1,6 +1,9 @@
 import sys
+import types
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
@@ -91,3 +94,149 @@ def test_separate_selected_type_and_empty(monkeypatch):
     assert result["isError"] is True
     code = payloads[0]["code"]
     assert "BY_MATERIAL" in code
+
+
+def test_mesh_batch_single_bridge_call(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "blender-mesh-batch",
+        {
+            "name": "Cube",
+            "ops": [
+                {"op": "inset", "thickness": 0.05},
+                {"op": "extrude", "distance": 0.1},
+                {"op": "loop_cut", "cuts": 2},
+                {"op": "bevel", "width": 0.02, "segments": 2},
+            ],
+        },
+        log_action=False,
+    )
+    assert res["isError"] is False
+    assert len(calls) == 1
+    path, payload = calls[0]
+    assert path == "/call" and payload["fn"] == "mesh_ops"
+    assert payload["args"] == {
+        "name": "Cube",
+        "ops": [
+            {"op": "inset", "args": {"thickness": 0.05}},
+            {"op": "extrude", "args": {"distance": 0.1}},
+            {"op": "loop_cut", "args": {"cuts": 2, "position": 0.5}},
+            {"op": "bevel", "args": {"width": 0.02, "segments": 2}},
+        ],
+        "keep": False,
+    }
+    assert "def mesh_ops(" in tools._BRIDGE_FNS_SOURCE
+
+    bad = registry.call_tool(
+        "blender-mesh-batch", {"name": "Cube", "ops": [{"op": "inset", "thickness": 0.1}, {"op": "bevel", "width": 0}]}, log_action=False
+    )
+    assert bad["isError"] is True
+    assert bad["content"][0]["text"] == "ops[1].width must be > 0"
+    assert len(calls) == 1
+
+
+def test_kept_bmesh_commits_before_other_tools(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        if payload.get("fn") == "mesh_commit":
+            return {"ok": True, "result": ["Cube"]}
+        return {"ok": True}
+
+    registered = []
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    monkeypatch.setattr(tools.atexit, "register", registered.append)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-extrude", {"name": "Cube", "mode": "faces", "distance": 0.1, "keep": True}, log_action=False)
+    registry.call_tool("blender-inset", {"name": "Cube", "thickness": 0.02, "keep": True}, log_action=False)
+    assert [p["fn"] for _, p in calls] == ["mesh_ops", "mesh_ops"]
+    registry.call_tool("blender-get-mesh-stats", {"name": "Cube"}, log_action=False)
+    assert calls[2][1] == {"fn": "mesh_commit", "args": {"names": None}, "version": tools._BRIDGE_FNS_VERSION}
+    assert calls[3][1]["fn"] == "mesh_stats"
+    registry.call_tool("blender-get-mesh-stats", {"name": "Cube"}, log_action=False)
+    assert all(p.get("fn") != "mesh_commit" for _, p in calls[3:])
+
+    registry.call_tool("blender-bevel-edges", {"name": "Cube", "width": 0.1, "segments": 1, "keep": True}, log_action=False)
+    res = registry.call_tool("blender-mesh-commit", {}, log_action=False)
+    assert res["content"][0]["text"] == "Committed Cube"
+    assert not registry._open_meshes
+    assert registered == [registry._commit_meshes]
+
+
+def test_failed_kept_mesh_ops_not_tracked(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        if payload.get("fn") == "mesh_ops":
+            return {"ok": False, "error": "Mesh has no faces"}
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    monkeypatch.setattr(tools.atexit, "register", lambda *_: None)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("blender-extrude", {"name": "Cube", "mode": "faces", "distance": 0.1, "keep": True}, log_action=False)
+    assert res["isError"] is True
+    assert not registry._open_meshes
+    registry.call_tool("blender-get-mesh-stats", {"name": "Cube"}, log_action=False)
+    assert [p["fn"] for p in calls] == ["mesh_ops", "mesh_stats"]
+
+
+def _bridge_fns(monkeypatch):
+    class FakeBMesh:
+        def __init__(self, edits=()):
+            self.edits = list(edits)
+            self.freed = False
+
+        def from_mesh(self, mesh):
+            self.edits = list(mesh.edits)
+
+        def to_mesh(self, mesh):
+            mesh.edits = list(self.edits)
+
+        def free(self):
+            self.freed = True
+
+    mesh = types.SimpleNamespace(edits=[], update=lambda: None)
+    obj = types.SimpleNamespace(name="Cube", type="MESH", mode="OBJECT", data=mesh)
+    handlers = types.SimpleNamespace(depsgraph_update_post=[], undo_post=[], redo_post=[], load_post=[])
+    bpy = types.SimpleNamespace(app=types.SimpleNamespace(handlers=handlers), data=types.SimpleNamespace(objects={"Cube": obj}))
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setitem(sys.modules, "bmesh", types.SimpleNamespace(new=FakeBMesh))
+    namespace = {}
+    exec(tools._BRIDGE_FNS_SOURCE, namespace)
+
+    def edit(bm, tag):
+        if tag == "boom":
+            raise ValueError("boom")
+        bm.edits.append(tag)
+
+    namespace["_MESH_OPS"] = {"edit": edit}
+    return namespace, mesh
+
+
+def test_bridge_mesh_ops_failed_batch_leaves_no_partial_edits(monkeypatch):
+    fns, mesh = _bridge_fns(monkeypatch)
+    ops = lambda *tags: [{"op": "edit", "args": {"tag": t}} for t in tags]  # noqa: E731
+    with pytest.raises(ValueError):
+        fns["mesh_ops"]("Cube", ops("a", "boom"), keep=True)
+    assert "Cube" not in fns["_BMESH_SESSIONS"]
+    fns["mesh_ops"]("Cube", ops("a"), keep=True)
+    # rejected up front: the kept session is untouched
+    with pytest.raises(ValueError, match="Unknown mesh op"):
+        fns["mesh_ops"]("Cube", ops("b") + [{"op": "nope", "args": {}}], keep=True)
+    assert fns["_BMESH_SESSIONS"]["Cube"].edits == ["a"]
+    # failing part way through: the session is dropped and the mesh keeps its committed state
+    with pytest.raises(ValueError):
+        fns["mesh_ops"]("Cube", ops("b", "boom"), keep=True)
+    assert "Cube" not in fns["_BMESH_SESSIONS"]
+    assert fns["mesh_commit"](["Cube"]) == []
+    assert mesh.edits == []
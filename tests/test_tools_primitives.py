@@ -1,5 +1,8 @@
 import importlib
+import json
 import sys
+import threading
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -52,8 +55,9 @@ def test_get_object_info_imports_math(monkeypatch):
     monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
     registry = tools.ToolRegistry()
     registry.call_tool("blender-get-object-info", {"name": "Cube"}, log_action=False)
-    code = payloads[0]["code"]
-    assert "import math" in code
+    assert payloads[0]["fn"] == "get_object_info"
+    assert payloads[0]["args"] == {"name": "Cube"}
+    assert "import math" in tools._BRIDGE_FNS_SOURCE
 
 
 def test_blender_exec_gated(monkeypatch):
@@ -85,3 +89,328 @@ def test_blender_exec_gated(monkeypatch):
     monkeypatch.delenv("BLENDER_MCP_UNSAFE", raising=False)
     monkeypatch.delenv("BLENDER_MCP_DEBUG_EXEC", raising=False)
     importlib.reload(tools)
+
+
+def test_scene_batch_single_round_trip(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True, "result": [{"ok": True}, {"ok": False, "error": "boom"}, {"ok": True}]}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool(
+        "scene-batch",
+        {
+            "ops": [
+                {"primitive": "cube"},
+                {"primitive": "sphere", "arguments": {"diameter": 2.0}},
+                {"primitive": "torus", "arguments": {"location": [1, 2, 3]}},
+            ]
+        },
+        log_action=False,
+    )
+    assert len(payloads) == 1
+    code = payloads[0]["code"]
+    compile(code, "<batch>", "exec")
+    assert "create_cube" in code and "primitive_uv_sphere_add" in code and "primitive_torus_add" in code
+    body = json.loads(res["content"][0]["text"])
+    assert res["isError"] is True
+    assert body["failed"] == 1
+    assert [r["ok"] for r in body["results"]] == [True, False, True]
+    assert body["results"][1]["error"] == "boom"
+
+
+def test_scene_batch_validates_before_sending(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tools, "_bridge_request", lambda *a, **k: calls.append(a) or {"ok": True})
+    registry = tools.ToolRegistry()
+    bad_kind = registry.call_tool("scene-batch", {"ops": [{"primitive": "cube"}, {"primitive": "teapot"}]}, log_action=False)
+    bad_args = registry.call_tool(
+        "scene-batch", {"ops": [{"primitive": "cone", "arguments": {"vertices": "many"}}]}, log_action=False
+    )
+    assert bad_kind["isError"] is True
+    assert bad_args["isError"] is True
+    assert "ops[0]" in bad_args["content"][0]["text"]
+    assert calls == []
+
+
+def test_batch_exec_runs_fragments_independently():
+    code = tools._wrap_batch(["x = 1\nraise ValueError('nope')", "y = 2"])
+    ns = {}
+    exec(compile(code, "<batch>", "exec"), ns, ns)
+    assert ns["result"] == [{"ok": False, "error": "nope"}, {"ok": True}]
+
+
+def test_fmt_vec_matches_tuple_literal():
+    assert tools._fmt_vec([1.0, -2.5, 3.0]) == "(1.0, -2.5, 3.0)"
+    code = tools._PLANE_TPL.format(size_f=2.0, name=json.dumps("Plane"), location=tools._fmt_vec([1.0, 2.0, 3.0]))
+    compile(code, "<plane>", "exec")
+    assert "obj.location = (1.0, 2.0, 3.0)" in code
+
+
+def test_object_tools_call_bridge_functions(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-move-object", {"name": "Cube", "x": 1, "y": 2, "z": 3}, log_action=False)
+    registry.call_tool("blender-scale-object", {"name": "Cube", "uniform": 2}, log_action=False)
+    assert [path for path, _ in calls] == ["/call", "/call"]
+    assert calls[0][1]["fn"] == "move_object"
+    assert calls[0][1]["args"] == {"name": "Cube", "location": [1.0, 2.0, 3.0]}
+    assert calls[1][1]["args"] == {"name": "Cube", "scale": [2.0, 2.0, 2.0]}
+    assert all("code" not in payload for _, payload in calls)
+    compile(tools._BRIDGE_FNS_SOURCE, "<mcp_fns>", "exec")
+
+
+def test_bridge_call_ships_library_when_missing(monkeypatch):
+    calls = []
+    registered = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(path)
+        if path == "/register_fns":
+            registered.append(payload["version"])
+            return {"ok": True, "result": ["move_object"]}
+        if not registered:
+            return {"ok": False, "error": "Function move_object not registered", "error_type": "fns_missing"}
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    first = registry.call_tool("blender-move-object", {"name": "Cube", "x": 0, "y": 0, "z": 1}, log_action=False)
+    second = registry.call_tool("blender-move-object", {"name": "Cube", "x": 0, "y": 0, "z": 2}, log_action=False)
+    assert first["isError"] is False and second["isError"] is False
+    assert calls == ["/call", "/register_fns", "/call", "/call"]
+    assert registered == [tools._BRIDGE_FNS_VERSION]
+
+
+def test_transforms_coalesce_within_window(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        return {"ok": True, "result": [{"ok": True}, {"ok": True}]}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    monkeypatch.setattr(tools, "_COALESCE_WINDOW_S", 5.0)
+    monkeypatch.setattr(tools, "_TRANSFORM_COALESCER", None)
+    registry = tools.ToolRegistry()
+    for x in (1, 2, 3):
+        res = registry.call_tool("blender-move-object", {"name": "Cube", "x": x, "y": 0, "z": 0}, log_action=False)
+        assert res["isError"] is False
+    registry.call_tool("blender-scale-object", {"name": "Cube", "uniform": 2}, log_action=False)
+    assert calls == []
+
+    tools._TRANSFORM_COALESCER.flush()
+    assert len(calls) == 1
+    path, payload = calls[0]
+    assert path == "/call" and payload["fn"] == "apply_transforms"
+    assert payload["args"]["ops"] == [
+        ["move_object", {"name": "Cube", "location": [3.0, 0.0, 0.0]}],
+        ["scale_object", {"name": "Cube", "scale": [2.0, 2.0, 2.0]}],
+    ]
+    tools._TRANSFORM_COALESCER.flush()
+    assert len(calls) == 1
+
+
+def test_bridge_send_waits_for_in_flight_transforms(monkeypatch):
+    events = []
+    started = threading.Event()
+
+    def slow_call(fn, args, timeout=5.0):
+        events.append("apply-start")
+        started.set()
+        time.sleep(0.2)
+        events.append("apply-end")
+        return {"ok": True, "result": [{"ok": True}]}
+
+    class FakePool:
+        def request(self, method, path, body, headers, timeout):
+            events.append(f"{method} {path}")
+            return 200, "OK", b'{"ok": true}'
+
+    coalescer = tools._TransformCoalescer(60.0)
+    monkeypatch.setattr(tools, "_bridge_call", slow_call)
+    monkeypatch.setattr(tools, "_BRIDGE_POOL", FakePool())
+    monkeypatch.setattr(tools, "_TRANSFORM_COALESCER", coalescer)
+    coalescer.push("move_object", {"name": "Cube", "location": [1.0, 0.0, 0.0]})
+    sender = threading.Thread(target=coalescer.flush)
+    sender.start()
+    assert started.wait(1.0)
+    assert tools._bridge_send("GET", "/snapshot", None, {}, 1.0) == {"ok": True}
+    sender.join()
+    assert events == ["apply-start", "apply-end", "GET /snapshot"]
+
+
+def test_repeated_identical_transform_skips_bridge(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    move = {"name": "Cube", "x": 1, "y": 2, "z": 3}
+    assert registry.call_tool("blender-move-object", move, log_action=False)["isError"] is False
+    assert registry.call_tool("blender-move-object", move, log_action=False)["isError"] is False
+    assert len(calls) == 1
+    registry.call_tool("blender-move-object", {**move, "x": 4}, log_action=False)
+    assert len(calls) == 2
+
+    registry.call_tool("blender-delete-object", {"name": "Cube"}, log_action=False)
+    registry.call_tool("blender-move-object", {**move, "x": 4}, log_action=False)
+    assert len(calls) == 4
+
+    monkeypatch.setattr(tools, "_TRANSFORM_NOOP_TTL_S", 0.0)
+    registry.call_tool("blender-move-object", {**move, "x": 4}, log_action=False)
+    assert len(calls) == 5
+
+
+def test_macro_scene_fans_out_bridge_calls(monkeypatch):
+    seen = []
+    lock = threading.Lock()
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        with lock:
+            seen.append((path, payload.get("fn") if path == "/call" else "exec", threading.get_ident()))
+        if payload.get("fn") == "add_light":
+            return {"ok": False, "error": "no lights today"}
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("macro-scene", {}, log_action=False)
+    assert sorted(kind for _, kind, _ in seen) == ["add_camera", "add_cube", "add_light"]
+    assert res["isError"] is True
+    assert res["content"][0]["text"] == "light: no lights today"
+    assert tools._bridge_parallel([lambda: 1, lambda: 2, lambda: 3]) == [1, 2, 3]
+
+
+def test_list_objects_full_single_call(monkeypatch):
+    calls = []
+    infos = [
+        {"name": "Cube", "type": "MESH", "location": [0, 0, 0], "rotation": [0, 0, 0], "scale": [1, 1, 1], "materials": ["Mat"]},
+        {"name": "Cube.001", "type": "MESH", "location": [1, 0, 0], "rotation": [0, 0, 0], "scale": [1, 1, 1], "materials": []},
+    ]
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        return {"ok": True, "result": infos}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    res = registry.call_tool("blender-list-objects-full", {"type": "mesh", "name_contains": "cube"}, log_action=False)
+    assert res["isError"] is False
+    assert len(calls) == 1
+    assert calls[0]["fn"] == "list_objects_info"
+    assert calls[0]["args"] == {"type": "MESH", "name_contains": "cube"}
+    lines = res["content"][0]["text"].splitlines()
+    assert lines[0].startswith("Cube loc=[0, 0, 0]") and lines[0].endswith("materials=Mat")
+    assert len(lines) == 2
+
+
+def test_object_templates_fill_json_args(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append(payload)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-join-objects", {"objects": ['Cube "{x}"', "B"], "name": "J"}, log_action=False)
+    registry.call_tool("blender-assign-material", {"object": "Cube", "material": "Mat", "slot": 2}, log_action=False)
+    join, material = (p["code"] for p in payloads)
+    assert 'objects = ["Cube \\"{x}\\"",' in join
+    assert 'bpy.data.materials.get("Mat")' in material and "slot_index = 2" in material
+    compile(join, "<join>", "exec")
+
+
+def test_reset_and_shading_call_bridge_functions(monkeypatch):
+    payloads = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        payloads.append((path, payload))
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    registry.call_tool("blender-set-shading", {"name": "Cube", "mode": "smooth"}, log_action=False)
+    assert [(path, p["fn"], p["args"]) for path, p in payloads] == [
+        ("/call", "reset_transform", {"name": "Cube"}),
+        ("/call", "set_shading", {"name": "Cube", "smooth": True}),
+    ]
+
+
+def test_idempotent_repeat_reuses_result(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(payload)
+        return {"ok": len(calls) != 4, "error": "boom"}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    first = registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    again = registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    assert again is first and len(calls) == 1
+    registry.call_tool("blender-reset-transform", {"name": "Other"}, log_action=False)
+    assert len(calls) == 2
+    registry.call_tool("blender-set-shading", {"name": "Cube", "mode": "flat"}, log_action=False)
+    # a different setter ran in between, so the reset goes to Blender again (and fails here)
+    failed = registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    assert failed["isError"] is True and len(calls) == 4
+    registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    assert len(calls) == 5
+
+    monkeypatch.setattr(tools, "_REPEAT_TTL_S", 0.0)
+    registry.call_tool("blender-reset-transform", {"name": "Cube"}, log_action=False)
+    assert len(calls) == 6
+
+
+def test_align_to_axis_skips_when_last_transform_is_zero(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append(path)
+        return {"ok": True}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    registry.call_tool("blender-rotate-object", {"name": "Cube", "rotation": [0, 0, 0]}, log_action=False)
+    registry.call_tool("blender-move-object", {"name": "Cube", "x": 1, "y": 0, "z": 3}, log_action=False)
+    sent = len(calls)
+    res = registry.call_tool("blender-align-to-axis", {"name": "Cube", "axis": "X"}, log_action=False)
+    assert res["isError"] is False
+    registry.call_tool("blender-align-to-axis", {"name": "Cube", "axis": "Y", "mode": "LOCATION_ZERO"}, log_action=False)
+    assert len(calls) == sent
+    registry.call_tool("blender-align-to-axis", {"name": "Cube", "axis": "X", "mode": "LOCATION_ZERO"}, log_action=False)
+    assert len(calls) == sent + 1
+    # the aligned location is no longer what move-object last sent, so repeating that move goes out again
+    registry.call_tool("blender-move-object", {"name": "Cube", "x": 1, "y": 0, "z": 3}, log_action=False)
+    assert len(calls) == sent + 2
+
+
+def test_add_cube_and_blockout_use_bridge_functions(monkeypatch):
+    calls = []
+
+    def fake_bridge(path, payload=None, timeout=0.5):
+        calls.append((path, payload))
+        return {"ok": True, "result": "Cube"}
+
+    monkeypatch.setattr(tools, "_bridge_request", fake_bridge)
+    registry = tools.ToolRegistry()
+    assert registry.call_tool("blender-add-cube", {}, log_action=False)["isError"] is False
+    assert registry.call_tool("macro-blockout", {}, log_action=False)["isError"] is False
+    assert [path for path, _ in calls] == ["/call", "/call"]
+    assert calls[0][1]["fn"] == calls[1][1]["fn"] == "add_cube"
+    assert calls[1][1]["args"] == {"name": "BlockoutCube", "scale": [2.0, 1.0, 1.0], "replace": True}